@@ -0,0 +1,151 @@
+"""Synthetic Garmin payloads shaped like real API responses, for offline benchmarks.
+
+``load(name)`` returns ``benchmarks/fixtures/<name>.json`` when a recorded
+response has been saved there, and otherwise builds a deterministic stand-in
+with the same structure and realistic sizes. ``load(name, size)`` does the
+same for the ``small`` and ``worst`` variants (``<name>-<size>.json``), which
+bracket the typical payload: a short nap or a handful of activities at one
+end, an ultra-distance activity or a year of history at the other.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+FIXTURES = Path(__file__).parent / "fixtures"
+_DAY_START_MS = 1771804800000  # 2026-02-23T00:00:00Z
+
+
+def heart_rate_day(interval_s: int = 120) -> dict[str, Any]:
+    rng = random.Random(1)  # noqa: S311 - deterministic sample data
+    values = [
+        [_DAY_START_MS + i * interval_s * 1000, rng.randint(48, 150)]
+        for i in range(86400 // interval_s)
+    ]
+    return {
+        "userProfilePK": 123456,
+        "calendarDate": "2026-02-23",
+        "maxHeartRate": 150,
+        "minHeartRate": 48,
+        "restingHeartRate": 52,
+        "heartRateValueDescriptors": [
+            {"key": "timestamp", "index": 0},
+            {"key": "heartrate", "index": 1},
+        ],
+        "heartRateValues": values,
+    }
+
+
+def activities(count: int = 60) -> list[dict[str, Any]]:
+    rng = random.Random(2)  # noqa: S311 - deterministic sample data
+    return [
+        {
+            "activityId": 18000000000 + i,
+            "activityName": f"Morning Run {i}",
+            "startTimeLocal": f"2026-02-{1 + i % 28:02d} 07:{i % 60:02d}:00",
+            "activityType": {"typeId": 1, "typeKey": "running", "parentTypeId": 17},
+            "distance": rng.uniform(3000, 21000),
+            "duration": rng.uniform(900, 7200),
+            "elapsedDuration": rng.uniform(900, 7400),
+            "movingDuration": rng.uniform(900, 7000),
+            "elevationGain": rng.uniform(0, 300),
+            "averageSpeed": rng.uniform(2.5, 4.5),
+            "maxSpeed": rng.uniform(4.5, 6.5),
+            "averageHR": rng.uniform(120, 165),
+            "maxHR": rng.uniform(165, 190),
+            "calories": rng.uniform(200, 1500),
+            "aerobicTrainingEffect": rng.uniform(1, 5),
+            "anaerobicTrainingEffect": rng.uniform(0, 3),
+            "vO2MaxValue": 52.0,
+            "steps": rng.randint(3000, 25000),
+        }
+        for i in range(count)
+    ]
+
+
+def sleep_day(hours: int = 8) -> dict[str, Any]:
+    rng = random.Random(3)  # noqa: S311 - deterministic sample data
+    epochs = range(0, hours * 60)
+    return {
+        "dailySleepDTO": {
+            "calendarDate": "2026-02-23",
+            "sleepTimeSeconds": hours * 3600,
+            "deepSleepSeconds": 5400,
+            "lightSleepSeconds": 15000,
+            "remSleepSeconds": 6600,
+            "awakeSleepSeconds": 1800,
+            "sleepScores": {"overall": {"value": 82, "qualifierKey": "GOOD"}},
+        },
+        "sleepMovement": [
+            {
+                "startGMT": f"2026-02-23T{m // 60:02d}:{m % 60:02d}:00.0",
+                "endGMT": f"2026-02-23T{m // 60:02d}:{m % 60:02d}:59.0",
+                "activityLevel": rng.uniform(0, 3),
+            }
+            for m in epochs
+        ],
+        "sleepHeartRate": [
+            {"value": rng.randint(45, 70), "startGMT": _DAY_START_MS + m * 120_000}
+            for m in range(hours * 30)
+        ],
+        "sleepStress": [
+            {"value": rng.randint(-1, 40), "startGMT": _DAY_START_MS + m * 180_000}
+            for m in range(hours * 20)
+        ],
+        "hrvData": [
+            {"value": rng.uniform(30, 90), "startGMT": _DAY_START_MS + m * 300_000}
+            for m in range(hours * 12)
+        ],
+        "avgOvernightHrv": 55.4,
+        "restingHeartRate": 52,
+    }
+
+
+def activity_details(seconds: int = 3600, activity_id: int = 18000000000) -> dict[str, Any]:
+    rng = random.Random(4)  # noqa: S311 - deterministic sample data
+    return {
+        "activityId": activity_id,
+        "summaryDTO": {"distance": seconds * rng.uniform(2.5, 4.5), "duration": float(seconds)},
+        "metricDescriptors": [{"key": k, "metricsIndex": i} for i, k in enumerate("shpc")],
+        "activityDetailMetrics": [
+            {"metrics": [rng.uniform(2, 5), rng.randint(100, 180), rng.uniform(0, 400), 170]}
+            for _ in range(seconds)
+        ],
+        "geoPolylineDTO": {
+            "polyline": [
+                {"lat": 51.5 + i * 1e-5, "lon": -0.12 + i * 1e-5, "time": i} for i in range(seconds)
+            ]
+        },
+        "heartRateDTO": [rng.randint(100, 180) for _ in range(seconds)],
+        "splitSummaries": [{"splitType": "INTERVAL_ACTIVE", "distance": 1000.0}] * 10,
+    }
+
+
+_BUILDERS: dict[str, Callable[..., Any]] = {
+    "heart_rate_day": heart_rate_day,
+    "activities": activities,
+    "sleep_day": sleep_day,
+    "activity_details": activity_details,
+}
+
+NAMES = tuple(_BUILDERS)
+SIZES = ("small", "typical", "worst")
+
+# Builder arguments for the non-typical sizes.
+_SIZED: dict[str, dict[str, dict[str, Any]]] = {
+    "heart_rate_day": {"small": {"interval_s": 900}, "worst": {"interval_s": 15}},
+    "activities": {"small": {"count": 5}, "worst": {"count": 1000}},
+    "sleep_day": {"small": {"hours": 1}, "worst": {"hours": 14}},
+    "activity_details": {"small": {"seconds": 600}, "worst": {"seconds": 6 * 3600}},
+}
+
+
+def load(name: str, size: str = "typical") -> Any:
+    recorded = FIXTURES / (f"{name}.json" if size == "typical" else f"{name}-{size}.json")
+    if recorded.exists():
+        return json.loads(recorded.read_text())
+    return _BUILDERS[name](**_SIZED[name].get(size, {}))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""First tool-call latency with and without the startup login warm-up.
+
+Simulates a server session against a stubbed Garmin client whose login costs
+``--login`` seconds and whose API calls cost ``--latency`` seconds. The first
+``call_tool`` arrives ``--startup`` seconds after the server starts, roughly
+the stdio/initialize handshake plus the model deciding to call a tool. The
+lazy run logs in inside that first call; the eager run starts ``warm_up()``
+at server start, as ``_run`` does, so the call only waits for what is left.
+
+Run with:
+    poetry run python benchmarks/bench_first_call.py --login 1.5 --startup 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+
+class SlowGarmin:
+    """Stand-in for ``garminconnect.Garmin`` with a slow login and slow API calls."""
+
+    login_seconds = 0.0
+    latency = 0.0
+
+    def login(self, tokenstore: str) -> None:
+        time.sleep(self.login_seconds)
+
+    def get_stats(self, cdate: str) -> dict[str, Any]:
+        time.sleep(self.latency)
+        return {"calendarDate": cdate, "totalSteps": 8000}
+
+
+async def _first_call(eager: bool, startup: float) -> float:
+    import mcp_garmin.client as client_module
+    import mcp_garmin.server as server_module
+
+    client_module._client = None
+    if eager:
+        client_module.warm_up()
+    await asyncio.sleep(startup)
+    started = time.perf_counter()
+    await server_module.call_tool("get_daily_stats", {"date": "2026-01-01"})
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--login", type=float, default=1.5, help="stub login seconds")
+    parser.add_argument("--latency", type=float, default=0.25, help="stub API call seconds")
+    parser.add_argument("--startup", type=float, default=0.5, help="seconds until first call")
+    args = parser.parse_args()
+
+    # Measure the login, not the response cache or the warehouse.
+    os.environ["GARMIN_CACHE_ENABLED"] = "false"
+    os.environ["GARMIN_WAREHOUSE_ENABLED"] = "false"
+    os.environ["GARMIN_RATE_LIMIT"] = "0"
+    SlowGarmin.login_seconds = args.login
+    SlowGarmin.latency = args.latency
+
+    with (
+        tempfile.TemporaryDirectory() as token_store,
+        patch("mcp_garmin.client.TOKEN_STORE", Path(token_store)),
+        patch("garminconnect.Garmin", SlowGarmin),
+    ):
+        lazy = asyncio.run(_first_call(eager=False, startup=args.startup))
+        eager = asyncio.run(_first_call(eager=True, startup=args.startup))
+
+    print(f"login={args.login:.3f}s latency={args.latency:.3f}s startup={args.startup:.3f}s")
+    print(f"  lazy login : first call {lazy:7.3f}s")
+    print(f"  warm-up    : first call {eager:7.3f}s  (saved {lazy - eager:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Hot-path micro-benchmarks with a regression check.
+
+Times the per-call transforms every Garmin tool response goes through,
+``_summarize_sleep``, ``_summarize_activity_details`` and ``_json_result``,
+on small, typical and worst-case payloads. For each case it reports the best
+time per call, the peak memory allocated during one call (tracemalloc) and
+the output size.
+
+Payloads come from ``_payloads`` (recorded fixtures in benchmarks/fixtures/
+when present, synthetic stand-ins otherwise). With ``--recorded`` they are
+taken from a ``GARMIN_RECORD_DIR`` instead: the smallest, median and largest
+recorded response of each kind.
+
+``--output`` saves the results as JSON. ``--baseline`` compares against a
+saved run and exits with status 1 when any case is more than ``--threshold``
+percent slower, so the check can gate a change locally or in CI.
+
+Run with:
+    poetry run python benchmarks/bench_hot_paths.py --output baseline.json
+    poetry run python benchmarks/bench_hot_paths.py --baseline baseline.json --threshold 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from mcp.types import TextContent
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _payloads import SIZES, load  # noqa: E402
+
+from mcp_garmin.tools._shared import _json_result  # noqa: E402
+from mcp_garmin.tools.activities import _summarize_activity_details  # noqa: E402
+from mcp_garmin.tools.daily import _summarize_sleep  # noqa: E402
+
+# Case -> (payload name, the hot path applied to it). The _json_result cases
+# encode what the tools actually return, so summarised payloads are summarised first.
+CASES: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "_summarize_sleep": ("sleep_day", _summarize_sleep),
+    "_summarize_activity_details": ("activity_details", _summarize_activity_details),
+    "_json_result[heart_rate_day]": ("heart_rate_day", _json_result),
+    "_json_result[activities]": ("activities", _json_result),
+    "_json_result[sleep_day]": ("sleep_day", lambda data: _json_result(_summarize_sleep(data))),
+    "_json_result[activity_details]": (
+        "activity_details",
+        lambda data: _json_result(_summarize_activity_details(data)),
+    ),
+}
+
+RUN_SECONDS = 0.02
+
+# Payload name -> the Garmin client method whose recorded responses stand in for it.
+RECORDED_METHODS = {
+    "sleep_day": "get_sleep_data",
+    "activity_details": "get_activity_details",
+    "heart_rate_day": "get_heart_rates",
+    "activities": "get_activities_by_date",
+}
+
+
+def recorded_payloads(directory: Path, name: str) -> dict[str, Any] | None:
+    """The smallest, median and largest recorded response for payload ``name``, by file size."""
+    paths = sorted(
+        (directory / RECORDED_METHODS[name]).glob("*.json"), key=lambda p: p.stat().st_size
+    )
+    if not paths:
+        return None
+    picks = dict(zip(SIZES, (paths[0], paths[len(paths) // 2], paths[-1]), strict=True))
+    return {size: json.loads(path.read_text())["response"] for size, path in picks.items()}
+
+
+def _size(result: Any) -> int:
+    if isinstance(result, list) and result and isinstance(result[0], TextContent):
+        return sum(len(c.text.encode()) for c in result)
+    return len(json.dumps(result, separators=(",", ":"), default=str).encode())
+
+
+def _calls_per_run(timer: timeit.Timer) -> int:
+    """Enough calls for one timing run to take about ``RUN_SECONDS``."""
+    number, seconds = timer.autorange()  # at least 0.2s
+    return max(1, round(number * RUN_SECONDS / seconds))
+
+
+def measure(func: Callable[[Any], Any], payload: Any, repeat: int) -> dict[str, Any]:
+    """Best-of-``repeat`` time per call, peak bytes allocated by one call and output size.
+
+    Many short runs and the fastest kept: interference from the rest of the
+    machine only ever adds time, so the minimum is the most repeatable figure.
+    """
+    timer = timeit.Timer(functools.partial(func, payload))
+    number = _calls_per_run(timer)
+    per_call = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = func(payload)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return {
+        "time_us": round(per_call * 1e6, 3),
+        "alloc_peak_bytes": peak,
+        "input_bytes": _size(payload),
+        "output_bytes": _size(result),
+    }
+
+
+def _git_commit() -> dict[str, Any]:
+    def git(*args: str) -> str:
+        proc = subprocess.run(  # noqa: S603 - fixed git arguments
+            ["git", *args],  # noqa: S607 - git from PATH
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=False,
+        )
+        return proc.stdout.strip()
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD") or None,
+        "dirty": bool(git("status", "--porcelain")),
+    }
+
+
+def build_cases(recorded: Path | None) -> dict[str, tuple[Callable[[Any], Any], Any]]:
+    """``<case>/<size>`` -> (hot path, payload) for every case and payload size."""
+    payloads: dict[str, dict[str, Any]] = {}
+    cases = {}
+    for case, (name, func) in CASES.items():
+        if name not in payloads:
+            from_recorded = recorded_payloads(recorded, name) if recorded else None
+            payloads[name] = from_recorded or {size: load(name, size) for size in SIZES}
+        for size in SIZES:
+            cases[f"{case}/{size}"] = (func, payloads[name][size])
+    return cases
+
+
+def _change(new: float, old: float | None) -> float | None:
+    return (new - old) / old * 100 if old else None
+
+
+def regressions(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float
+) -> list[str]:
+    """Cases more than ``threshold`` percent slower than in ``baseline``."""
+    slower = []
+    for case, stats in results.items():
+        change = _change(stats["time_us"], baseline.get(case, {}).get("time_us"))
+        if change is not None and change > threshold:
+            slower.append(case)
+    return slower
+
+
+def report(results: dict[str, dict[str, Any]], baseline: dict[str, Any] | None) -> None:
+    base = baseline["results"] if baseline else {}
+    if baseline:
+        print(f"compared with {baseline.get('commit')} ({baseline.get('timestamp')})")
+    header = f"{'case':<44}{'time us':>12}{'alloc KiB':>12}{'in KiB':>10}{'out KiB':>10}"
+    print(header + ("  time vs baseline" if baseline else ""))
+    for case, stats in results.items():
+        line = (
+            f"{case:<44}{stats['time_us']:>12.2f}{stats['alloc_peak_bytes'] / 1024:>12.1f}"
+            f"{stats['input_bytes'] / 1024:>10.1f}{stats['output_bytes'] / 1024:>10.1f}"
+        )
+        change = _change(stats["time_us"], base.get(case, {}).get("time_us"))
+        if change is not None:
+            line += f"  {change:+.1f}%"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=25, help="timing runs per case (best kept)")
+    parser.add_argument("--recorded", type=Path, default=None, help="a GARMIN_RECORD_DIR")
+    parser.add_argument("--output", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=None, help="earlier results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="fail when a case is this %% slower"
+    )
+    parser.add_argument(
+        "--confirm", type=int, default=3, help="re-measure slow cases up to N times before failing"
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    payloads = str(args.recorded) if args.recorded else "synthetic"
+    if baseline and baseline.get("payloads") != payloads:
+        print(f"warning: the baseline was measured on {baseline.get('payloads')} payloads")
+    cases = build_cases(args.recorded)
+    results = {case: measure(func, payload, args.repeat) for case, (func, payload) in cases.items()}
+    base = baseline["results"] if baseline else {}
+    slower = regressions(results, base, args.threshold)
+    for _ in range(args.confirm):
+        if not slower:
+            break
+        # A noisy neighbour can slow one case down for a moment; a real regression stays.
+        for case in slower:
+            again = measure(*cases[case], args.repeat)
+            results[case]["time_us"] = min(results[case]["time_us"], again["time_us"])
+        slower = regressions(results, base, args.threshold)
+    report(results, baseline)
+    if args.output:
+        document = {
+            "server": "mcp-garmin",
+            **_git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "payloads": payloads,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(document, indent=2))
+        print(f"Wrote {args.output}")
+    if slower:
+        print(f"More than {args.threshold:g}% slower than the baseline: {', '.join(slower)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
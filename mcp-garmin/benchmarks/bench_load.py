@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""End-to-end load test over MCP stdio against replayed Garmin responses.
+
+Starts ``mcp_garmin.server`` as a real stdio subprocess with
+``GARMIN_REPLAY_DIR`` pointing at recorded responses, so every request goes
+through the MCP transport, the worker pool, the rate limiter and the
+handlers exactly as it would in production, but without tokens or network.
+``--concurrency`` clients then send a weighted mix of tool calls and the
+harness reports p50/p95/p99 latency, throughput and response sizes per tool,
+plus the server's RSS growth. ``--output`` writes the results as JSON tagged
+with the git commit, and ``--compare`` prints the change against an earlier
+results file.
+
+By default the replay directory is seeded with synthetic payloads from
+``_payloads``. Pass ``--replay-dir`` to load-test against responses recorded
+with ``GARMIN_RECORD_DIR`` instead: the calls are then drawn from whatever was
+recorded.
+
+Run with:
+    poetry run python benchmarks/bench_load.py --calls 500 --concurrency 8 --latency-ms 50
+    poetry run python benchmarks/bench_load.py --output before.json
+    poetry run python benchmarks/bench_load.py --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.types import TextContent
+
+sys.path.insert(0, str(Path(__file__).parent))
+from _payloads import activities, activity_details, heart_rate_day, sleep_day  # noqa: E402
+
+from mcp_garmin.replay import write_fixture  # noqa: E402
+
+SERVER_MODULE = "mcp_garmin.server"
+DEFAULT_MIX = (
+    "get_daily_stats=4,get_sleep=3,get_heart_rate=2,get_activities=1,get_activity_details=1"
+)
+LAST_DAY = date(2026, 2, 23)
+
+type ToolArguments = Callable[[list[Any]], dict[str, Any]]
+
+
+def _activities_arguments(args: list[Any]) -> dict[str, Any]:
+    arguments = {"start_date": args[0], "end_date": args[1]}
+    if len(args) > 2:
+        arguments["activity_type"] = args[2]
+    return arguments
+
+
+# Tool -> (client method it calls, recorded call arguments -> tool arguments).
+TOOL_CALLS: dict[str, tuple[str, ToolArguments]] = {
+    "get_daily_stats": ("get_stats", lambda args: {"date": args[0]}),
+    "get_heart_rate": ("get_heart_rates", lambda args: {"date": args[0]}),
+    "get_sleep": ("get_sleep_data", lambda args: {"date": args[0]}),
+    "get_activities": ("get_activities_by_date", _activities_arguments),
+    "get_activity_details": ("get_activity_details", lambda args: {"activity_id": str(args[0])}),
+}
+
+
+def _daily_stats(day: str, rng: random.Random) -> dict[str, Any]:
+    return {
+        "calendarDate": day,
+        "totalSteps": rng.randint(3000, 20000),
+        "totalDistanceMeters": rng.randint(2000, 16000),
+        "totalKilocalories": rng.uniform(1800, 3500),
+        "activeKilocalories": rng.uniform(200, 1500),
+        "restingHeartRate": rng.randint(45, 60),
+        "averageStressLevel": rng.randint(15, 45),
+        "bodyBatteryHighestValue": rng.randint(60, 100),
+        "bodyBatteryLowestValue": rng.randint(5, 40),
+        "floorsAscended": rng.uniform(0, 30),
+        "moderateIntensityMinutes": rng.randint(0, 60),
+        "vigorousIntensityMinutes": rng.randint(0, 60),
+    }
+
+
+def seed(directory: Path, days: int) -> None:
+    """Write synthetic responses for every tool in ``TOOL_CALLS`` over the last ``days`` days."""
+    rng = random.Random(0)  # noqa: S311 - deterministic sample data
+    heart_rate, sleep = heart_rate_day(), sleep_day()
+    week = activities(count=7)
+    for offset in range(days):
+        day = str(LAST_DAY - timedelta(days=offset))
+        write_fixture(directory, "get_stats", (day,), {}, _daily_stats(day, rng))
+        write_fixture(directory, "get_heart_rates", (day,), {}, {**heart_rate, "calendarDate": day})
+        write_fixture(directory, "get_sleep_data", (day,), {}, sleep)
+    for offset in range(0, days, 7):
+        end = LAST_DAY - timedelta(days=offset)
+        window = (str(end - timedelta(days=6)), str(end))
+        write_fixture(directory, "get_activities_by_date", window, {}, week)
+    for activity in week:
+        # The tool passes the ID through as the string it was given.
+        activity_id = str(activity["activityId"])
+        details = activity_details(activity_id=activity["activityId"])
+        write_fixture(directory, "get_activity_details", (activity_id,), {}, details)
+
+
+def workload(directory: Path, mix: dict[str, float]) -> dict[str, list[dict[str, Any]]]:
+    """Tool arguments for every recorded call in ``directory``, per tool in ``mix``."""
+    calls: dict[str, list[dict[str, Any]]] = {}
+    for tool in mix:
+        method, to_arguments = TOOL_CALLS[tool]
+        records = sorted((directory / method).glob("*.json"))
+        arguments = [to_arguments(json.loads(p.read_text())["args"]) for p in records]
+        if arguments:
+            calls[tool] = arguments
+        else:
+            print(f"  no recorded {method} responses; skipping {tool}", file=sys.stderr)
+    if not calls:
+        raise SystemExit(f"No recorded responses for any tool in the mix under {directory}")
+    return calls
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for part in text.split(","):
+        tool, _, weight = part.strip().partition("=")
+        if tool not in TOOL_CALLS:
+            raise SystemExit(f"Unknown tool in --mix: {tool!r}. Known: {', '.join(TOOL_CALLS)}")
+        mix[tool] = float(weight or 1)
+    return mix
+
+
+@dataclass
+class Sample:
+    tool: str
+    seconds: float
+    response_bytes: int
+
+
+def _rss_kb(pid: int | None) -> dict[str, int] | None:
+    """Current (``VmRSS``) and peak (``VmHWM``) resident set of ``pid`` in KiB (Linux only)."""
+    if pid is None:
+        return None
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+    return {key: int(fields[key].split()[0]) for key in ("VmRSS", "VmHWM") if key in fields}
+
+
+def _server_pid() -> int | None:
+    """PID of the server subprocess: our child whose command line runs ``SERVER_MODULE``."""
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            ppid = int(stat.read_text().rsplit(")", 1)[1].split()[1])
+            cmdline = (stat.parent / "cmdline").read_bytes()
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == os.getpid() and SERVER_MODULE.encode() in cmdline:
+            return int(stat.parent.name)
+    return None
+
+
+async def server_metrics(session: ClientSession) -> dict[str, Any]:
+    result = await session.call_tool("get_server_metrics", {"format": "compact"})
+    text = "".join(c.text for c in result.content if isinstance(c, TextContent))
+    snapshot: dict[str, Any] = json.loads(text)
+    return snapshot
+
+
+def _errors(before: dict[str, Any], after: dict[str, Any]) -> dict[str, int]:
+    """Failed calls per tool between two metrics snapshots.
+
+    The server answers a failed call with an explanatory message rather than
+    an MCP error, so failures are read from its own counters.
+    """
+    errors: dict[str, int] = {}
+    for tool, stats in after["tools"].items():
+        earlier = before["tools"].get(tool, {}).get("errors", {})
+        errors[tool] = sum(stats["errors"].values()) - sum(earlier.values())
+    return errors
+
+
+async def _call(session: ClientSession, tool: str, arguments: dict[str, Any]) -> Sample:
+    started = time.perf_counter()
+    result = await session.call_tool(tool, arguments)
+    seconds = time.perf_counter() - started
+    size = sum(len(c.text.encode()) for c in result.content if isinstance(c, TextContent))
+    return Sample(tool, seconds, size)
+
+
+async def drive(
+    session: ClientSession,
+    calls: dict[str, list[dict[str, Any]]],
+    mix: dict[str, float],
+    rng: random.Random,
+    concurrency: int,
+    count: int | None,
+    duration: float | None,
+) -> list[Sample]:
+    """Send ``count`` calls (or calls for ``duration`` seconds) from ``concurrency`` clients."""
+    tools = list(calls)
+    weights = [mix[tool] for tool in tools]
+    samples: list[Sample] = []
+    deadline = time.perf_counter() + duration if duration else None
+    remaining = count
+
+    async def client() -> None:
+        nonlocal remaining
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            (tool,) = rng.choices(tools, weights)
+            samples.append(await _call(session, tool, rng.choice(calls[tool])))
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return samples
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def _latency_ms(samples: list[Sample]) -> dict[str, float]:
+    ordered = sorted(s.seconds * 1000 for s in samples)
+    return {
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": round(_percentile(ordered, 50), 3),
+        "p95": round(_percentile(ordered, 95), 3),
+        "p99": round(_percentile(ordered, 99), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def summarize(samples: list[Sample], errors: dict[str, int], seconds: float) -> dict[str, Any]:
+    tools: dict[str, Any] = {}
+    for tool in sorted({s.tool for s in samples}):
+        own = [s for s in samples if s.tool == tool]
+        sizes = [s.response_bytes for s in own]
+        tools[tool] = {
+            "calls": len(own),
+            "errors": errors.get(tool, 0),
+            "throughput_per_s": round(len(own) / seconds, 3),
+            "latency_ms": _latency_ms(own),
+            "response_bytes": {
+                "mean": round(sum(sizes) / len(sizes)),
+                "max": max(sizes),
+                "total": sum(sizes),
+            },
+        }
+    return {
+        "calls": len(samples),
+        "errors": sum(errors.values()),
+        "wall_seconds": round(seconds, 3),
+        "throughput_per_s": round(len(samples) / seconds, 3),
+        "latency_ms": _latency_ms(samples),
+        "tools": tools,
+    }
+
+
+def _git_commit() -> dict[str, Any]:
+    def git(*args: str) -> str:
+        proc = subprocess.run(  # noqa: S603 - fixed git arguments
+            ["git", *args],  # noqa: S607 - git from PATH
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=False,
+        )
+        return proc.stdout.strip()
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD") or None,
+        "dirty": bool(git("status", "--porcelain")),
+    }
+
+
+def _server_env(args: argparse.Namespace, replay_dir: Path, state_dir: Path) -> dict[str, str]:
+    env = {
+        **os.environ,
+        "GARMIN_REPLAY_DIR": str(replay_dir),
+        "GARMIN_REPLAY_LATENCY_MS": str(args.latency_ms),
+        "GARMIN_REPLAY_JITTER_MS": str(args.jitter_ms),
+        "GARMIN_REPLAY_ERROR_RATE": str(args.error_rate),
+        "GARMIN_REPLAY_SEED": str(args.seed),
+        "GARMIN_OUTPUT_FORMAT": args.format,
+        # The replayed upstream has no quota to protect; measure the server, not the throttle.
+        "GARMIN_RATE_LIMIT": "0",
+        "GARMIN_MAX_CONCURRENCY": str(max(args.concurrency, 1)),
+        "GARMIN_CACHE_ENABLED": str(args.cache).lower(),
+        "GARMIN_WAREHOUSE_ENABLED": str(args.cache).lower(),
+        # Never touch the user's cache or warehouse, even with --cache.
+        "GARMIN_CACHE_PATH": str(state_dir / "cache.db"),
+        "GARMIN_WAREHOUSE_PATH": str(state_dir / "warehouse.db"),
+    }
+    for name in ("GARMIN_RECORD_DIR", "GARMIN_PROFILE", "GARMIN_WAREHOUSE_SYNC_INTERVAL"):
+        env.pop(name, None)
+    return env
+
+
+async def run(args: argparse.Namespace, replay_dir: Path, state_dir: Path) -> dict[str, Any]:
+    mix = parse_mix(args.mix)
+    calls = workload(replay_dir, mix)
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible call mix
+    params = StdioServerParameters(
+        command=sys.executable,
+        # What the mcp-garmin console script runs.
+        args=["-c", f"from {SERVER_MODULE} import main; main()"],
+        env=_server_env(args, replay_dir, state_dir),
+    )
+    with (state_dir / "server.log").open("w") as errlog:
+        async with (
+            stdio_client(params, errlog=errlog) as (read_stream, write_stream),
+            ClientSession(read_stream, write_stream) as session,
+        ):
+            started = time.perf_counter()
+            await session.initialize()
+            startup = time.perf_counter() - started
+            pid = _server_pid()
+            await drive(session, calls, mix, rng, args.concurrency, args.warmup, None)
+            rss_before = _rss_kb(pid)
+            metrics_before = await server_metrics(session)
+            started = time.perf_counter()
+            samples = await drive(
+                session, calls, mix, rng, args.concurrency, args.calls, args.duration
+            )
+            seconds = time.perf_counter() - started
+            rss_after = _rss_kb(pid)
+            metrics = await server_metrics(session)
+    if not samples:
+        raise SystemExit("No calls completed; see the server log with --keep.")
+    rss: dict[str, int | None] = {"start": None, "end": None, "peak": None, "growth": None}
+    if rss_before and rss_after:
+        rss = {
+            "start": rss_before["VmRSS"],
+            "end": rss_after["VmRSS"],
+            "peak": rss_after.get("VmHWM"),
+            "growth": rss_after["VmRSS"] - rss_before["VmRSS"],
+        }
+    return {
+        "server": "mcp-garmin",
+        **_git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "config": {
+            "calls": args.calls if args.duration is None else None,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "mix": mix,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "cache": args.cache,
+            "format": args.format,
+            "seed": args.seed,
+            "replay_dir": str(args.replay_dir) if args.replay_dir else None,
+        },
+        "startup_seconds": round(startup, 3),
+        **summarize(samples, _errors(metrics_before, metrics), seconds),
+        "rss_kb": rss,
+        "server_metrics": metrics,
+    }
+
+
+def _change(new: float, old: float | None) -> str:
+    if not old:
+        return ""
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def report(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    base_tools = baseline["tools"] if baseline else {}
+    rss = results["rss_kb"]
+    print(
+        f"{results['calls']} calls, concurrency {results['config']['concurrency']}, "
+        f"{results['wall_seconds']:.2f}s, {results['errors']} errors"
+    )
+    if baseline:
+        print(f"  compared with {baseline.get('commit')} ({baseline.get('timestamp')})")
+    old_throughput = baseline["throughput_per_s"] if baseline else None
+    print(
+        f"  throughput: {results['throughput_per_s']:.1f} calls/s "
+        f"{_change(results['throughput_per_s'], old_throughput)}".rstrip()
+    )
+    if rss["growth"] is not None:
+        print(f"  server RSS: {rss['start']} -> {rss['end']} KiB (peak {rss['peak']} KiB)")
+    print(
+        f"  {'tool':<22}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'bytes':>10}"
+        + ("  p95 vs baseline" if baseline else "")
+    )
+    for tool, stats in results["tools"].items():
+        latency = stats["latency_ms"]
+        old = base_tools.get(tool, {}).get("latency_ms", {})
+        print(
+            f"  {tool:<22}{stats['calls']:>7}{latency['p50']:>10.1f}{latency['p95']:>10.1f}"
+            f"{latency['p99']:>10.1f}{stats['response_bytes']['mean']:>10}"
+            f"  {_change(latency['p95'], old.get('p95'))}".rstrip()
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500, help="measured tool calls")
+    parser.add_argument("--duration", type=float, default=None, help="run for S seconds instead")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured calls sent first")
+    parser.add_argument("--concurrency", type=int, default=8, help="calls in flight at once")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="tool=weight,... call mix")
+    parser.add_argument("--days", type=int, default=28, help="days of synthetic responses")
+    parser.add_argument("--replay-dir", type=Path, default=None, help="recorded responses")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="replayed upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="random extra latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="injected 503 share, 0-1")
+    parser.add_argument("--cache", action="store_true", help="enable cache and warehouse")
+    parser.add_argument("--format", default="pretty", help="GARMIN_OUTPUT_FORMAT for the run")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the mix and faults")
+    parser.add_argument("--output", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier results JSON")
+    parser.add_argument("--keep", action="store_true", help="keep the temp dir and server log")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    state_dir = Path(tempfile.mkdtemp(prefix="garmin-load-"))
+    try:
+        replay_dir = args.replay_dir
+        if replay_dir is None:
+            replay_dir = state_dir / "replay"
+            seed(replay_dir, args.days)
+        results = asyncio.run(run(args, replay_dir.expanduser(), state_dir))
+    finally:
+        if args.keep:
+            print(f"Kept {state_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(state_dir, ignore_errors=True)
+    report(results, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
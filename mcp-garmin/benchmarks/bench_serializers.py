@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""JSON encoder micro-benchmark: stdlib json vs orjson.
+
+Times ``stdlib_dumps`` and ``orjson_dumps`` from ``mcp_garmin.output`` on each
+benchmark payload (recorded fixtures in benchmarks/fixtures/ when present,
+synthetic stand-ins otherwise), in pretty and compact layouts. orjson is only
+measured when the optional "fast" extra is installed.
+
+Run with:
+    poetry install --extras fast
+    poetry run python benchmarks/bench_serializers.py --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _payloads import NAMES, load  # noqa: E402
+
+from mcp_garmin import output  # noqa: E402
+
+
+def _per_call_ms(func: Callable[[], str], number: int) -> float:
+    """Best-of-three time for one call, in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=3)) * 1000 / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="encodes per measurement")
+    args = parser.parse_args()
+
+    encoders = {"json": output.stdlib_dumps}
+    if output.ENCODER == "orjson":
+        encoders["orjson"] = output.orjson_dumps
+    else:
+        print("orjson not installed; install the 'fast' extra to compare.")
+
+    print(f"{'payload':<18} {'layout':<8} " + " ".join(f"{n + ' ms':>10}" for n in encoders))
+    for name in NAMES:
+        payload = load(name)
+        for layout, pretty in (("pretty", True), ("compact", False)):
+            timings = [
+                _per_call_ms(functools.partial(f, payload, pretty), args.repeat)
+                for f in encoders.values()
+            ]
+            cells = " ".join(f"{t:>10.3f}" for t in timings)
+            speedup = f"  ({timings[0] / timings[1]:.1f}x)" if len(timings) == 2 else ""
+            print(f"{name:<18} {layout:<8} {cells}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
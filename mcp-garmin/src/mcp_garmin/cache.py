@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from mcp.types import TextContent
+
+from mcp_garmin.config import env_bool, env_int
+from mcp_garmin.validation import parse_flag
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED_ENV = "GARMIN_CACHE_ENABLED"
+CACHE_PATH_ENV = "GARMIN_CACHE_PATH"
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "mcp-garmin" / "responses.sqlite3"
+
+BYPASS_ARGUMENT = "bypass_cache"
+
+# Arguments that name a calendar day; the latest one decides how long a response lives.
+_DATE_ARGUMENTS = ("date", "start_date", "end_date")
+
+_partial: ContextVar[bool] = ContextVar("partial_response", default=False)
+
+
+def mark_partial() -> None:
+    """Keep the response of the tool call in progress out of the cache.
+
+    Tools that return what they could fetch alongside an ``errors`` map call
+    this, so the failed parts are fetched again on the next call instead of
+    being served from the cache for the whole TTL.
+    """
+    _partial.set(True)
+
+
+@dataclass(frozen=True)
+class CacheTTLs:
+    """Lifetime in seconds for each class of cached response."""
+
+    past: int = 30 * 24 * 3600
+    recent: int = 5 * 60
+    undated: int = 6 * 3600
+    # Garmin keeps back-filling a day for a while after it ends (late watch syncs,
+    # sleep scored the next morning), so the last ``settle_days`` count as recent.
+    settle_days: int = 1
+
+    @classmethod
+    def from_env(cls) -> CacheTTLs:
+        return cls(
+            past=env_int("GARMIN_CACHE_TTL_PAST", cls.past, minimum=0),
+            recent=env_int("GARMIN_CACHE_TTL_RECENT", cls.recent, minimum=0),
+            undated=env_int("GARMIN_CACHE_TTL_UNDATED", cls.undated, minimum=0),
+        )
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+        }
+
+
+def cache_key(name: str, arguments: Mapping[str, Any]) -> str:
+    """Build a stable key from the tool name and its arguments, minus cache controls."""
+    normalized = {
+        k: v.strip() if isinstance(v, str) else v
+        for k, v in arguments.items()
+        if k != BYPASS_ARGUMENT
+    }
+    payload = json.dumps([name, normalized], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Tool responses in an in-memory LRU backed by an on-disk SQLite table.
+
+    Reads check memory first, then SQLite (promoting disk hits into memory).
+    Expiry depends on the dates in the arguments: responses about settled past
+    days live for ``ttls.past``, anything touching today or yesterday for
+    ``ttls.recent``, and calls without a date for ``ttls.undated``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        memory_entries: int = 256,
+        ttls: CacheTTLs | None = None,
+        clock: Callable[[], float] = time.time,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.ttls = ttls or CacheTTLs()
+        self.stats = CacheStats()
+        self._memory_entries = memory_entries
+        self._memory: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._db = _connect(path)
+
+    def ttl_for(self, arguments: Mapping[str, Any]) -> int:
+        dates = []
+        for name in _DATE_ARGUMENTS:
+            value = arguments.get(name)
+            if isinstance(value, str):
+                try:
+                    dates.append(date.fromisoformat(value))
+                except ValueError:
+                    continue
+        if not dates:
+            return self.ttls.undated
+        if max(dates) < self._today() - timedelta(days=self.ttls.settle_days):
+            return self.ttls.past
+        return self.ttls.recent
+
+    def get(self, key: str) -> list[str] | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, texts = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return texts
+                del self._memory[key]
+            row = self._db.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.stats.misses += 1
+                return None
+            stored: list[str] = json.loads(row[0])
+            self._remember(key, row[1], stored)
+            self.stats.disk_hits += 1
+            return stored
+
+    def put(self, key: str, tool: str, texts: list[str], ttl: int) -> None:
+        if ttl <= 0:
+            return
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._remember(key, expires_at, texts)
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, tool, value, expires_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, tool, json.dumps(texts), expires_at),
+                )
+
+    def call(
+        self,
+        name: str,
+        arguments: Mapping[str, Any],
+        fetch: Callable[[], list[TextContent]],
+    ) -> list[TextContent]:
+        """Return the cached response for this call, or run ``fetch`` and store it."""
+        key = cache_key(name, arguments)
+        if parse_flag(arguments.get(BYPASS_ARGUMENT, False), BYPASS_ARGUMENT):
+            with self._lock:
+                self.stats.bypasses += 1
+        else:
+            texts = self.get(key)
+            if texts is not None:
+                return [TextContent(type="text", text=t) for t in texts]
+        token = _partial.set(False)
+        try:
+            result = fetch()
+            partial = _partial.get()
+        finally:
+            _partial.reset(token)
+        if not partial:
+            self.put(key, name, [c.text for c in result], self.ttl_for(arguments))
+        return result
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from disk. Returns the number removed."""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (self._clock(),)
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _remember(self, key: str, expires_at: float, texts: list[str]) -> None:
+        self._memory[key] = (expires_at, texts)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    if str(path) != ":memory:":
+        path = Path(path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Responses contain personal health data; create the file owner-only.
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+    db = sqlite3.connect(str(path), check_same_thread=False)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, tool TEXT NOT NULL, value TEXT NOT NULL, "
+        "expires_at REAL NOT NULL)"
+    )
+    return db
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache | None:
+    """Return the shared response cache, or None when ``GARMIN_CACHE_ENABLED`` is off."""
+    global _cache
+    with _cache_lock:
+        if _cache is None and env_bool(CACHE_ENABLED_ENV, True):
+            path = os.environ.get(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH
+            _cache = ResponseCache(
+                path,
+                memory_entries=env_int("GARMIN_CACHE_MEMORY_ENTRIES", 256),
+                ttls=CacheTTLs.from_env(),
+            )
+            purged = _cache.purge_expired()
+            logger.info("Response cache opened at %s (%d expired entries purged)", path, purged)
+        return _cache
+
+
+def _reset_cache() -> None:
+    """Close and drop the shared cache. Used in tests only."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
@@ -1,26 +1,80 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
+from mcp_garmin.replay import recording, replay_client_from_env
+from mcp_garmin.tokens import TokenRefresher, start_token_refresher
+
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
 TOKEN_STORE = Path.home() / ".garminconnect"
 
 _client: Garmin | None = None
+_refresher: TokenRefresher | None = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> Garmin:
-    """Return the authenticated Garmin singleton, creating it on first call."""
-    global _client
-    if _client is None:
-        _client = _create_client()
-    return _client
+    """Return the authenticated Garmin singleton, creating it on first call.
+
+    Callers that arrive while another thread is logging in, such as the
+    startup warm-up, wait for that login instead of starting their own.
+    Once logged in, the OAuth2 token is renewed in the background before it
+    expires (see ``mcp_garmin.tokens``). With ``GARMIN_REPLAY_DIR`` set, the
+    client answers from recorded fixtures instead (see ``mcp_garmin.replay``).
+    """
+    global _client, _refresher
+    with _client_lock:
+        if _client is None:
+            replay = replay_client_from_env()
+            if replay is not None:
+                _client = replay
+            else:
+                garmin = _create_client()
+                _refresher = start_token_refresher(garmin, TOKEN_STORE)
+                _client = recording(garmin)
+        return _client
+
+
+def stop_token_refresher(timeout: float | None = None) -> None:
+    """Stop the background token refresher, if one is running."""
+    global _refresher
+    with _client_lock:
+        refresher, _refresher = _refresher, None
+    if refresher is not None:
+        refresher.stop(timeout)
+
+
+def warm_up() -> threading.Thread:
+    """Start logging in on a daemon thread so the first tool call finds the client ready."""
+    thread = threading.Thread(target=_warm_up, name="garmin-auth", daemon=True)
+    thread.start()
+    return thread
+
+
+def _warm_up() -> None:
+    started = time.perf_counter()
+    try:
+        get_client()
+    except Exception as exc:
+        # Not fatal: the first tool call retries the login and reports the error.
+        logger.warning("Garmin login at startup failed: %s", exc)
+        return
+    logger.info("Garmin client ready after %.2fs", time.perf_counter() - started)
 
 
 def _create_client() -> Garmin:
+    # garminconnect (and garth, requests) is imported here rather than at module
+    # level so the server can answer initialize/list_tools before it has loaded.
+    from garminconnect import Garmin
+
     if not TOKEN_STORE.exists():
         raise RuntimeError(
             f"Garmin tokens not found at {TOKEN_STORE}. Run scripts/login.py to authenticate."
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from mcp_garmin.config import env_int
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS_ENV = "GARMIN_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 4
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared tool-handler pool, creating it on first call.
+
+    The pool size (``GARMIN_MAX_WORKERS``, default 4) caps how many tool calls
+    can be talking to Garmin Connect at once; further calls queue for a worker.
+    """
+    global _executor
+    if _executor is None:
+        workers = env_int(MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS)
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="garmin-tool")
+        logger.info("Tool worker pool started with %d workers", workers)
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared pool. The next ``get_executor`` call starts a fresh one."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def run_blocking[T](func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking callable on the worker pool without stalling the event loop.
+
+    The caller's context variables are copied into the worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args)
+    return await loop.run_in_executor(get_executor(), call)
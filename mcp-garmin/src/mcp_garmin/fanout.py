@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from mcp_garmin.config import env_int
+
+FETCH_WORKERS_ENV = "GARMIN_FETCH_WORKERS"
+DEFAULT_FETCH_WORKERS = 4
+FETCH_THREAD_PREFIX = "garmin-fetch"
+
+
+def fetch_thread_prefix(thread_id: int) -> str:
+    """Name prefix of the workers ``fan_out`` starts from thread ``thread_id``."""
+    return f"{FETCH_THREAD_PREFIX}-{thread_id}"
+
+
+def fan_out[T, R](
+    func: Callable[[T], R], items: Iterable[T], max_workers: int | None = None
+) -> list[R | Exception]:
+    """Call ``func`` on every item concurrently and return the results in input order.
+
+    A failing item yields its exception in place of a result, so one bad item
+    never discards the others. ``max_workers`` defaults to ``GARMIN_FETCH_WORKERS``.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = max_workers or env_int(FETCH_WORKERS_ENV, DEFAULT_FETCH_WORKERS)
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(items)),
+        thread_name_prefix=fetch_thread_prefix(threading.get_ident()),
+    ) as pool:
+        futures = [pool.submit(func, item) for item in items]
+    results: list[R | Exception] = []
+    for future in futures:
+        exc = future.exception()
+        results.append(exc if isinstance(exc, Exception) else future.result())
+    return results
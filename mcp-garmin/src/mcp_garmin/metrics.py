@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mcp.types import TextContent, Tool
+
+from mcp_garmin.config import env_int
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILE_ENV = "GARMIN_METRICS_FILE"
+METRICS_INTERVAL_ENV = "GARMIN_METRICS_INTERVAL"
+DEFAULT_DUMP_INTERVAL = 60
+
+# Upper bounds of the histogram buckets; a final bucket takes anything larger.
+LATENCY_BOUNDS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+SIZE_BOUNDS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Where a handler's time goes: waiting on Garmin, reshaping the payload, encoding the result.
+PHASES = ("upstream", "transform", "serialize")
+
+METRICS_TOOL = Tool(
+    name="get_server_metrics",
+    description=(
+        "Server performance counters since start-up: per-tool call counts, latency "
+        "percentiles split into upstream/transform/serialize phases, response sizes, "
+        "errors by type, and cache, warehouse and rate-limiter statistics."
+    ),
+    inputSchema={"type": "object", "properties": {}, "required": []},
+)
+
+
+class Histogram:
+    """Bucketed distribution of observed values, with count, sum and max.
+
+    Percentiles are estimated as the upper bound of the bucket they fall in,
+    capped at the largest value seen.
+    """
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for i, n in enumerate(self.counts[:-1]):
+            seen += n
+            if seen >= rank:
+                return min(self.bounds[i], self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        buckets = {f"le_{b:g}": n for b, n in zip(self.bounds, self.counts, strict=False) if n}
+        if self.counts[-1]:
+            buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(0.50), 3),
+            "p95": round(self.percentile(0.95), 3),
+            "p99": round(self.percentile(0.99), 3),
+            "max": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class CallMetrics:
+    """Timings for one tool call, filled in by the server as the call runs."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.executed = False
+        self.handler: float | None = None
+        self.upstream = 0.0
+        self.upstream_calls = 0
+        self.serialize = 0.0
+        self.response_bytes: int | None = None
+        self.error: str | None = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._since = 0.0
+
+    @contextmanager
+    def upstream_call(self) -> Iterator[None]:
+        """Time one upstream request. Overlapping requests from a fan-out count once."""
+        with self._lock:
+            if self._in_flight == 0:
+                self._since = self._clock()
+            self._in_flight += 1
+            self.upstream_calls += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self.upstream += self._clock() - self._since
+
+    @contextmanager
+    def handling(self) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.handler = self._clock() - started
+
+    @contextmanager
+    def serializing(self) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.serialize += self._clock() - started
+
+    def respond(self, result: list[TextContent]) -> None:
+        self.response_bytes = sum(len(content.text.encode()) for content in result)
+
+    def phases(self) -> dict[str, float] | None:
+        """Seconds per phase, or None if the handler did not run (cache hit, coalesced)."""
+        if self.handler is None:
+            return None
+        transform = max(self.handler - self.upstream - self.serialize, 0.0)
+        return {"upstream": self.upstream, "transform": transform, "serialize": self.serialize}
+
+
+_current: ContextVar[CallMetrics | None] = ContextVar("call_metrics", default=None)
+
+
+def current_call() -> CallMetrics | None:
+    return _current.get()
+
+
+def mark_executed() -> None:
+    """Note that the current call is being run, not served by an identical call in flight."""
+    call = _current.get()
+    if call is not None:
+        call.executed = True
+
+
+@contextmanager
+def handling() -> Iterator[None]:
+    """Time the tool handler of the current call, if one is being tracked."""
+    call = _current.get()
+    if call is None:
+        yield
+        return
+    with call.handling():
+        yield
+
+
+@contextmanager
+def serializing() -> Iterator[None]:
+    """Time result encoding for the current call, if one is being tracked."""
+    call = _current.get()
+    if call is None:
+        yield
+        return
+    with call.serializing():
+        yield
+
+
+class MeteredClient:
+    """Proxy that counts the time spent in every method call on ``client`` as upstream."""
+
+    def __init__(self, client: Any, call: CallMetrics) -> None:
+        self._client = client
+        self._call = call
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self._call.upstream_call():
+                return attr(*args, **kwargs)
+
+        return timed
+
+
+def metered(client: Any) -> Any:
+    """Wrap ``client`` so its calls count as upstream time for the current call."""
+    call = _current.get()
+    return client if call is None else MeteredClient(client, call)
+
+
+@dataclass
+class ToolStats:
+    calls: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    latency_ms: dict[str, Histogram] = field(
+        default_factory=lambda: {p: Histogram(LATENCY_BOUNDS_MS) for p in ("total", *PHASES)}
+    )
+    response_bytes: Histogram = field(default_factory=lambda: Histogram(SIZE_BOUNDS_BYTES))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "cache_hit_rate": hit_rate(
+                self.cache_hits, self.calls - self.coalesced - self.cache_hits
+            ),
+            "coalesced": self.coalesced,
+            "errors": dict(sorted(self.errors.items())),
+            "latency_ms": {p: h.as_dict() for p, h in self.latency_ms.items()},
+            "response_bytes": self.response_bytes.as_dict(),
+        }
+
+
+def hit_rate(hits: int, misses: int) -> float | None:
+    total = hits + misses
+    return round(hits / total, 4) if total else None
+
+
+class ServerMetrics:
+    """Per-tool counters and histograms for every call since the server started."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._started_at = clock()
+        self._tools: dict[str, ToolStats] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[CallMetrics]:
+        """Measure one call of tool ``name``; the call is visible to ``current_call`` inside."""
+        call = CallMetrics()
+        token = _current.set(call)
+        started = time.perf_counter()
+        try:
+            yield call
+        except Exception as exc:
+            call.error = type(exc).__name__
+            raise
+        finally:
+            _current.reset(token)
+            self.record(name, call, time.perf_counter() - started)
+
+    def record(self, name: str, call: CallMetrics, seconds: float) -> None:
+        phases = call.phases()
+        with self._lock:
+            stats = self._tools.setdefault(name, ToolStats())
+            stats.calls += 1
+            stats.latency_ms["total"].observe(seconds * 1000)
+            if call.error is not None:
+                stats.errors[call.error] = stats.errors.get(call.error, 0) + 1
+            if not call.executed:
+                stats.coalesced += 1
+            elif phases is None and call.error is None:
+                stats.cache_hits += 1
+            for phase, phase_seconds in (phases or {}).items():
+                stats.latency_ms[phase].observe(phase_seconds * 1000)
+            if call.response_bytes is not None:
+                stats.response_bytes.observe(call.response_bytes)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            tools = {name: self._tools[name].as_dict() for name in sorted(self._tools)}
+        return {
+            "uptime_seconds": round(self._clock() - self._started_at, 1),
+            "calls": sum(t["calls"] for t in tools.values()),
+            "errors": sum(sum(t["errors"].values()) for t in tools.values()),
+            "tools": tools,
+        }
+
+
+_metrics: ServerMetrics | None = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> ServerMetrics:
+    """Return the shared metrics registry, creating it on first call."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = ServerMetrics()
+        return _metrics
+
+
+def _reset_metrics() -> None:
+    """Drop all recorded metrics. Used in tests only."""
+    global _metrics
+    with _metrics_lock:
+        _metrics = None
+
+
+class MetricsDump:
+    """Daemon thread that writes ``snapshot()`` as JSON to ``path`` every ``interval`` seconds.
+
+    Each write replaces the file atomically, so a reader never sees a partial
+    dump. A last dump is written when the thread is stopped.
+    """
+
+    def __init__(self, path: Path, snapshot: Callable[[], dict[str, Any]], interval: float) -> None:
+        self._path = path
+        self._snapshot = snapshot
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="garmin-metrics", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        self._write()
+
+    def write(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(f".{self._path.name}.tmp")
+        tmp.write_text(json.dumps(self._snapshot(), indent=2))
+        os.replace(tmp, self._path)
+
+    def _write(self) -> None:
+        try:
+            self.write()
+        except OSError as exc:
+            logger.warning("Could not write metrics to %s: %s", self._path, exc)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._write()
+
+
+def start_metrics_dump(snapshot: Callable[[], dict[str, Any]]) -> MetricsDump | None:
+    """Start dumping metrics when ``GARMIN_METRICS_FILE`` is set."""
+    path = os.environ.get(METRICS_FILE_ENV)
+    if not path:
+        return None
+    interval = env_int(METRICS_INTERVAL_ENV, DEFAULT_DUMP_INTERVAL)
+    dump = MetricsDump(Path(path).expanduser(), snapshot, interval)
+    dump.start()
+    logger.info("Writing server metrics to %s every %ds", path, interval)
+    return dump
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import math
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+
+from mcp.types import TextContent
+
+FORMAT_ENV = "GARMIN_OUTPUT_FORMAT"
+FORMATS = ("pretty", "compact", "columnar")
+MAX_PRECISION = 10
+MAX_FIELDS = 64
+
+# Compiled ``fields`` projection: key -> sub-projection, or None to keep the whole value.
+type Projection = dict[str, Projection | None]
+
+
+@dataclass(frozen=True)
+class OutputOptions:
+    """How a tool result is encoded: ``format``, float ``precision`` and ``fields`` to keep."""
+
+    format: str = "pretty"
+    precision: int | None = None
+    fields: tuple[str, ...] | None = None
+
+
+_options: ContextVar[OutputOptions | None] = ContextVar("output_options", default=None)
+
+
+def default_options() -> OutputOptions:
+    """Options used when a call does not set any, from ``GARMIN_OUTPUT_FORMAT``."""
+    fmt = (os.environ.get(FORMAT_ENV) or "pretty").strip().lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"{FORMAT_ENV} must be one of {', '.join(FORMATS)}, got {fmt!r}.")
+    return OutputOptions(format=fmt)
+
+
+def current_options() -> OutputOptions:
+    return _options.get() or default_options()
+
+
+def _parse_fields(raw: Any) -> tuple[str, ...] | None:
+    """Accept ``fields`` as a list of paths or one comma-separated string."""
+    if raw is None or raw == "" or raw == []:
+        return None
+    items = raw.split(",") if isinstance(raw, str) else raw
+    if not isinstance(items, list) or not all(isinstance(f, str) for f in items):
+        raise ValueError(f"Invalid fields: {raw!r}. Expected a list of dotted paths.")
+    fields = tuple(dict.fromkeys(f.strip() for f in items if f.strip()))
+    if len(fields) > MAX_FIELDS:
+        raise ValueError(f"Invalid fields: at most {MAX_FIELDS} paths are allowed.")
+    for path in fields:
+        if any(segment.strip() == "" for segment in path.split(".")):
+            raise ValueError(f"Invalid fields path: {path!r}. Empty path segment.")
+    return fields or None
+
+
+def parse_options(arguments: dict[str, Any]) -> OutputOptions:
+    """Read the ``format``, ``precision`` and ``fields`` tool arguments, with defaults."""
+    defaults = default_options()
+    fmt = str(arguments.get("format") or defaults.format).strip().lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Invalid format: {fmt!r}. Expected one of: {', '.join(FORMATS)}.")
+    raw = arguments.get("precision")
+    precision: int | None = None
+    if raw is not None and raw != "":
+        try:
+            precision = int(raw)
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"Invalid precision: {raw!r}. Expected an integer.") from err
+        if not 0 <= precision <= MAX_PRECISION:
+            raise ValueError(f"Invalid precision: {raw!r}. Must be between 0 and {MAX_PRECISION}.")
+    return OutputOptions(
+        format=fmt, precision=precision, fields=_parse_fields(arguments.get("fields"))
+    )
+
+
+@contextmanager
+def output_options(options: OutputOptions) -> Iterator[None]:
+    """Encode every ``encode`` call made inside the block with ``options``."""
+    token = _options.set(options)
+    try:
+        yield
+    finally:
+        _options.reset(token)
+
+
+def with_output_options(
+    handler: Callable[[Any, dict[str, Any]], list[TextContent]],
+) -> Callable[[Any, dict[str, Any]], list[TextContent]]:
+    """Wrap a tool handler so its ``format``/``precision`` arguments apply to its result."""
+
+    @functools.wraps(handler)
+    def wrapped(client: Any, arguments: dict[str, Any]) -> list[TextContent]:
+        with output_options(parse_options(arguments)):
+            return handler(client, arguments)
+
+    return wrapped
+
+
+def _merge(a: Projection | None, b: Projection | None) -> Projection | None:
+    if a is None or b is None:
+        return None
+    merged = dict(a)
+    for key, sub in b.items():
+        merged[key] = _merge(merged[key], sub) if key in merged else sub
+    return merged
+
+
+def _fold_wildcards(node: Projection) -> Projection:
+    """Merge each ``*`` branch into its named siblings so lookups need one probe."""
+    for key, sub in node.items():
+        if sub is not None:
+            node[key] = _fold_wildcards(sub)
+    if "*" in node:
+        wildcard = node["*"]
+        for key in node:
+            if key != "*":
+                node[key] = _merge(node[key], wildcard)
+    return node
+
+
+@functools.lru_cache(maxsize=256)
+def compile_fields(fields: tuple[str, ...]) -> Projection:
+    """Compile dotted ``fields`` paths into a projection tree, once per distinct tuple.
+
+    A path selects a key at each level; ``*`` selects every key of an object or
+    every element of a list, and lists met by a named key are mapped element by
+    element. A path that ends at an object keeps all of it.
+    """
+    root: Projection = {}
+    for path in fields:
+        node = root
+        segments = path.split(".")
+        for i, segment in enumerate(segments):
+            if segment in node and node[segment] is None:
+                break  # an ancestor path already keeps this whole subtree
+            if i == len(segments) - 1:
+                node[segment] = None
+            else:
+                child = node.setdefault(segment, {})
+                assert child is not None
+                node = child
+    return _fold_wildcards(root)
+
+
+def project(data: Any, projection: Projection | None) -> Any:
+    """Keep only the parts of ``data`` selected by a ``compile_fields`` projection."""
+    if projection is None:
+        return data
+    if isinstance(data, list):
+        element: Projection | None = projection
+        if "*" in projection:
+            # Named keys next to ``*`` describe the elements' fields, so keep them too.
+            named = {k: v for k, v in projection.items() if k != "*"}
+            element = _merge(projection["*"], named) if named else projection["*"]
+        return [project(item, element) for item in data]
+    if isinstance(data, dict):
+        kept: dict[str, Any] = {}
+        for key, value in data.items():
+            if key in projection:
+                kept[key] = project(value, projection[key])
+            elif "*" in projection:
+                kept[key] = project(value, projection["*"])
+        return kept
+    return data
+
+
+def round_floats(data: Any, precision: int) -> Any:
+    if isinstance(data, float):
+        return round(data, precision)
+    if isinstance(data, dict):
+        return {k: round_floats(v, precision) for k, v in data.items()}
+    if isinstance(data, list):
+        return [round_floats(v, precision) for v in data]
+    return data
+
+
+def columnar(data: Any) -> Any:
+    """Turn every list of two or more objects into ``{"columns": [...], "rows": [[...]]}``.
+
+    Columns are the union of the objects' keys in first-seen order; a key an
+    object lacks becomes null in its row. Other values are walked recursively.
+    """
+    if isinstance(data, dict):
+        return {k: columnar(v) for k, v in data.items()}
+    if isinstance(data, list):
+        if len(data) >= 2 and all(isinstance(item, dict) for item in data):
+            columns = list(dict.fromkeys(key for item in data for key in item))
+            return {
+                "columns": columns,
+                "rows": [[columnar(item.get(c)) for c in columns] for item in data],
+            }
+        return [columnar(item) for item in data]
+    return data
+
+
+def _load_orjson() -> ModuleType | None:
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:  # the optional "fast" extra is not installed
+        return None
+
+
+_orjson = _load_orjson()
+
+
+def null_non_finite(data: Any) -> Any:
+    """Replace NaN and infinite floats, which JSON cannot represent, with None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {k: null_non_finite(v) for k, v in data.items()}
+    if isinstance(data, list | tuple):
+        return [null_non_finite(v) for v in data]
+    return data
+
+
+def stdlib_dumps(data: Any, pretty: bool) -> str:
+    """Encode with the stdlib, writing NaN and infinities as null like orjson does.
+
+    Non-ASCII text is ``\\u``-escaped, so pretty output is byte-for-byte what
+    ``json.dumps(data, indent=2)`` wrote before orjson support was added.
+    """
+    layout: dict[str, Any] = {"indent": 2} if pretty else {"separators": (",", ":")}
+    try:
+        return json.dumps(data, allow_nan=False, **layout)
+    except ValueError:
+        # Rare enough that only payloads holding such a float pay for the extra walk.
+        return json.dumps(null_non_finite(data), allow_nan=False, **layout)
+
+
+def orjson_dumps(data: Any, pretty: bool) -> str:
+    """Encode with orjson, matching ``stdlib_dumps`` layout. Requires the "fast" extra."""
+    if _orjson is None:
+        raise RuntimeError("orjson is not installed; install the 'fast' extra.")
+    option = _orjson.OPT_NON_STR_KEYS | (_orjson.OPT_INDENT_2 if pretty else 0)
+    text: str = _orjson.dumps(data, option=option).decode()
+    return text
+
+
+ENCODER = "orjson" if _orjson is not None else "json"
+
+
+def dumps(data: Any, pretty: bool) -> str:
+    """Serialise ``data`` with orjson when it is installed, else the stdlib encoder.
+
+    Both produce the same layout (two-space indent or no whitespace, NaN and
+    infinities as null) and parse to the same value. orjson writes non-ASCII
+    text as-is where the stdlib escapes it, and the spelling of some floats,
+    e.g. ``1e-05`` vs ``0.00001``, can differ.
+    """
+    if _orjson is not None:
+        try:
+            return orjson_dumps(data, pretty)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which only the stdlib encoder accepts
+    return stdlib_dumps(data, pretty)
+
+
+def encode(data: Any, options: OutputOptions | None = None) -> str:
+    """Serialise a tool result according to ``options`` (default: the current call's)."""
+    options = options or current_options()
+    if options.fields:
+        data = project(data, compile_fields(options.fields))
+    if options.precision is not None:
+        data = round_floats(data, options.precision)
+    if options.format == "columnar":
+        data = columnar(data)
+    return dumps(data, pretty=options.format == "pretty")
+
+
+OUTPUT_PROPERTIES: dict[str, Any] = {
+    "format": {
+        "type": "string",
+        "enum": list(FORMATS),
+        "description": (
+            "Response encoding: pretty (indented JSON, default), compact (no whitespace) or "
+            "columnar (compact, with lists of records as one header row plus value rows)"
+        ),
+    },
+    "precision": {
+        "type": "integer",
+        "minimum": 0,
+        "maximum": MAX_PRECISION,
+        "description": "Round floating-point values to this many decimal places",
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": (
+            'Return only these dotted paths, e.g. ["restingHeartRate", "totals.protein"]. '
+            "Lists are matched element by element and * matches any key or element"
+        ),
+    },
+}
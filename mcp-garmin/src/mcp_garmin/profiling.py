@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import logging
+import marshal
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from mcp.types import TextContent
+
+from mcp_garmin.config import env_bool, env_float
+from mcp_garmin.fanout import fetch_thread_prefix
+from mcp_garmin.tokens import write_private
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "GARMIN_PROFILE"
+PROFILE_DIR_ENV = "GARMIN_PROFILE_DIR"
+PROFILE_MIN_MS_ENV = "GARMIN_PROFILE_MIN_MS"
+PROFILE_MEMORY_ENV = "GARMIN_PROFILE_MEMORY"
+DEFAULT_PROFILE_DIR = Path.home() / ".cache" / "mcp-garmin" / "profiles"
+
+# Roughly the interpreter's GIL switch interval; sampling faster only repeats stacks.
+SAMPLE_INTERVAL = 0.005
+
+_ALL = {"all", "*"}
+
+type Handler = Callable[[Any, dict[str, Any]], list[TextContent]]
+# A function as pstats names it, (filename, first line, name), and a stack of them root-first.
+type Function = tuple[str, int, str]
+type Stack = tuple[Function, ...]
+type FunctionStats = tuple[int, int, float, float, dict[Function, tuple[int, int, float, float]]]
+
+
+def should_profile(name: str) -> bool:
+    """True when ``GARMIN_PROFILE`` lists tool ``name`` (comma-separated) or is ``all``."""
+    raw = os.environ.get(PROFILE_ENV, "")
+    names = {part.strip() for part in raw.split(",") if part.strip()}
+    return bool(names & _ALL) or name in names
+
+
+def stack_of(frame: FrameType | None) -> Stack:
+    """The functions on the stack ending at ``frame``, outermost first."""
+    functions: list[Function] = []
+    while frame is not None:
+        code = frame.f_code
+        functions.append((code.co_filename, code.co_firstlineno, code.co_qualname))
+        frame = frame.f_back
+    return tuple(reversed(functions))
+
+
+def collapse(stack: Stack) -> str:
+    """Render a stack in the collapsed format read by flamegraph tools."""
+    return ";".join(f"{name} ({Path(filename).name}:{line})" for filename, line, name in stack)
+
+
+class StackSampler:
+    """Count the stacks of one thread and of the fan-out workers it starts.
+
+    Every ``interval`` seconds the sampler records the stack of the handler
+    thread and of the workers ``fan_out`` started from it, which are named
+    after that thread. Calls running at the same time on other threads are
+    left out. cProfile cannot be scoped like that: from Python 3.12 it
+    records every thread in the process, so concurrent tool calls would end
+    up in the profile.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL) -> None:
+        self.stacks: Counter[Stack] = Counter()
+        self.ticks = 0
+        self._thread_id = thread_id
+        # ThreadPoolExecutor names its threads "<prefix>_<n>".
+        self._workers = f"{fetch_thread_prefix(thread_id)}_"
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="garmin-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[Stack]:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        return self.stacks
+
+    def sample(self) -> None:
+        self.ticks += 1
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == self._thread_id or names.get(ident, "").startswith(self._workers):
+                self.stacks[stack_of(frame)] += 1
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.sample()
+
+
+def sampled_stats(
+    stacks: Counter[Stack], seconds_per_sample: float
+) -> dict[Function, FunctionStats]:
+    """Build pstats statistics from sampled stacks.
+
+    Call counts are sample counts. A function's own time is the time it was
+    the innermost frame, and its cumulative time the time it was anywhere on
+    the stack.
+    """
+    totals: dict[Function, list[float]] = {}
+    edges: dict[Function, dict[Function, list[float]]] = {}
+    for stack, count in stacks.items():
+        if not stack:
+            continue
+        seconds = count * seconds_per_sample
+        for function in set(stack):
+            total = totals.setdefault(function, [0, 0.0, 0.0])
+            total[0] += count
+            total[2] += seconds
+        totals[stack[-1]][1] += seconds
+        for pair in set(itertools.pairwise(stack)):
+            edge = edges.setdefault(pair[1], {}).setdefault(pair[0], [0, 0.0, 0.0])
+            edge[0] += count
+            edge[2] += seconds
+            if pair == stack[-2:]:
+                edge[1] += seconds
+    return {
+        function: (
+            int(n),
+            int(n),
+            own,
+            cumulative,
+            {
+                caller: (int(en), int(en), e_own, e_cumulative)
+                for caller, (en, e_own, e_cumulative) in edges.get(function, {}).items()
+            },
+        )
+        for function, (n, own, cumulative) in totals.items()
+    }
+
+
+_profile_lock = threading.Lock()
+_sequence = itertools.count(1)
+
+
+def _write(
+    name: str,
+    arguments: dict[str, Any],
+    sampler: StackSampler,
+    seconds: float,
+    peak_bytes: int | None,
+) -> Path:
+    """Write the profile files, owner-only since the arguments and stacks name user data."""
+    directory = Path(os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR).expanduser()
+    stem = directory / f"{time.strftime('%Y%m%dT%H%M%S')}-{name}-{next(_sequence)}"
+    stacks = sampler.stacks
+    # Spread the wall time over the ticks actually taken, which run a little
+    # slower than the nominal interval.
+    per_sample = seconds / sampler.ticks if sampler.ticks else SAMPLE_INTERVAL
+    write_private(Path(f"{stem}.pstats"), marshal.dumps(sampled_stats(stacks, per_sample)))
+    write_private(
+        Path(f"{stem}.collapsed"),
+        "".join(f"{collapse(stack)} {count}\n" for stack, count in stacks.most_common()),
+    )
+    summary = {
+        "tool": name,
+        "arguments": arguments,
+        "seconds": round(seconds, 6),
+        "samples": sampler.ticks,
+        "peak_bytes": peak_bytes,
+    }
+    write_private(Path(f"{stem}.json"), json.dumps(summary, indent=2, default=str))
+    return stem
+
+
+def _profile[R](name: str, arguments: dict[str, Any], call: Callable[[], R]) -> R:
+    memory = env_bool(PROFILE_MEMORY_ENV, False)
+    min_ms = env_float(PROFILE_MIN_MS_ENV, 0.0)
+    sampler = StackSampler(threading.get_ident())
+    sampler.start()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0] if memory else 0
+    started = time.perf_counter()
+    try:
+        return call()
+    finally:
+        seconds = time.perf_counter() - started
+        sampler.stop()
+        peak = tracemalloc.get_traced_memory()[1] - baseline if memory else None
+        if started_tracing:
+            tracemalloc.stop()
+        if seconds * 1000 >= min_ms:
+            try:
+                stem = _write(name, arguments, sampler, seconds, peak)
+                logger.info("Profiled %s in %.1f ms: %s.pstats", name, seconds * 1000, stem)
+            except OSError as exc:
+                logger.warning("Could not write profile for %s: %s", name, exc)
+
+
+def with_profiling(name: str, handler: Handler) -> Handler:
+    """Wrap tool ``name``'s handler so calls are profiled when ``GARMIN_PROFILE`` selects it.
+
+    A profiled call writes ``<stamp>-<tool>-<n>.pstats``, ``.collapsed`` and ``.json``
+    under ``GARMIN_PROFILE_DIR`` when it takes longer than ``GARMIN_PROFILE_MIN_MS``.
+    One call is profiled at a time; calls overlapping it run unprofiled.
+    """
+
+    @functools.wraps(handler)
+    def wrapped(client: Any, arguments: dict[str, Any]) -> list[TextContent]:
+        if not should_profile(name) or not _profile_lock.acquire(blocking=False):
+            return handler(client, arguments)
+        try:
+            return _profile(name, arguments, lambda: handler(client, arguments))
+        finally:
+            _profile_lock.release()
+
+    return wrapped
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from mcp_garmin.config import env_float, env_int
+
+GARMIN_HOST = "connectapi.garmin.com"
+UPSTREAM_NAME = "Garmin Connect"
+
+RATE_LIMIT_ENV = "GARMIN_RATE_LIMIT"
+DEFAULT_RATE_LIMIT = 4.0  # requests per second
+DEFAULT_BURST = 8
+
+CONCURRENCY_ENV = "GARMIN_MAX_CONCURRENCY"
+DEFAULT_CONCURRENCY = 4
+RETRIES_ENV = "GARMIN_MAX_RETRIES"
+DEFAULT_RETRIES = 3
+
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+# A Retry-After longer than this is reported to the user rather than slept through.
+MAX_RETRY_AFTER = 30.0
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Outcomes of one request, as reported to AdaptiveConcurrency.release.
+OK, THROTTLED, FAILED = "ok", "throttled", "failed"
+
+
+class UpstreamError(Exception):
+    """Raised when Garmin Connect keeps throttling or failing a request after retries."""
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per second, bursting up to ``burst``.
+
+    ``acquire`` reserves a slot under the lock and sleeps outside it, so waiting
+    threads are released in arrival order without holding each other up.
+    A ``rate`` of 0 disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns the number of seconds waited."""
+        with self._lock:
+            now = self._clock()
+            wait = max(self._paused_until - now, 0.0)
+            if self.rate > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds``, e.g. while the host asks us to back off."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class AdaptiveConcurrency:
+    """Cap on requests in flight to one host, adjusted AIMD-style.
+
+    Each successful request raises the limit by ``1 / limit`` (about one per
+    round of requests) up to ``maximum``. A throttled one halves it, at most
+    once per ``cooldown`` seconds so a burst of 429s from one round counts once.
+    Other failures leave it unchanged.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maximum = maximum
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self._cooldown = cooldown
+        self._clock = clock
+        self._last_decrease = -cooldown
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, outcome: str = OK) -> None:
+        """Free a slot; ``outcome`` is ``OK``, ``THROTTLED`` or ``FAILED``."""
+        with self._cond:
+            self.in_flight -= 1
+            now = self._clock()
+            if outcome == THROTTLED:
+                if now - self._last_decrease >= self._cooldown:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = now
+            elif outcome == OK:
+                self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+def _error_chain(exc: BaseException) -> Iterator[BaseException]:
+    """``exc`` and the errors it wraps, via ``__cause__``, ``__context__`` or ``.error``."""
+    seen: set[int] = set()
+    pending: list[BaseException] = [exc]
+    while pending:
+        err = pending.pop(0)
+        if id(err) in seen:
+            continue
+        seen.add(id(err))
+        yield err
+        for inner in (err.__cause__, err.__context__, getattr(err, "error", None)):
+            if isinstance(inner, BaseException):
+                pending.append(inner)
+
+
+def _response(exc: BaseException) -> Any:
+    for err in _error_chain(exc):
+        response = getattr(err, "response", None)
+        if isinstance(getattr(response, "status_code", None), int):
+            return response
+    return None
+
+
+def upstream_status(exc: BaseException) -> int | None:
+    """The HTTP status behind ``exc``, however deeply the client library wrapped it."""
+    response = _response(exc)
+    return None if response is None else int(response.status_code)
+
+
+def retry_after(exc: BaseException, now: Callable[[], float] = time.time) -> float | None:
+    """Seconds the host asked us to wait in its ``Retry-After`` header, if it sent one."""
+    response = _response(exc)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(when.timestamp() - now(), 0.0)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """True for throttling, 5xx responses and network failures that may succeed on retry."""
+    status = upstream_status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    return any(isinstance(err, OSError) for err in _error_chain(exc))
+
+
+@dataclass
+class LimiterStats:
+    calls: int = 0
+    retries: int = 0
+    throttled: int = 0
+    gave_up: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "gave_up": self.gave_up,
+        }
+
+
+class HostLimiter:
+    """Send calls to one host under a rate cap and adaptive concurrency, with retries.
+
+    Each attempt takes a token from ``bucket`` and a slot from ``concurrency``.
+    Throttled (429/503), 5xx and network failures are retried up to
+    ``max_retries`` times with full-jitter exponential backoff, or after the
+    host's ``Retry-After`` when it sends one. A throttle also pauses the whole
+    bucket and halves the concurrency limit, so every caller backs off.
+    """
+
+    def __init__(
+        self,
+        bucket: RateLimiter,
+        concurrency: AdaptiveConcurrency,
+        max_retries: int = DEFAULT_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.bucket = bucket
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.stats = LimiterStats()
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    def backoff(self, attempt: int) -> float:
+        return self._jitter() * min(BACKOFF_CAP, BACKOFF_BASE * 2.0**attempt)
+
+    def call[R](self, func: Callable[[], R]) -> R:
+        self._count(calls=1)
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            self.concurrency.acquire()
+            outcome = OK
+            try:
+                return func()
+            except Exception as exc:
+                status = upstream_status(exc)
+                throttled = status in THROTTLE_STATUSES
+                outcome = THROTTLED if throttled else FAILED
+                if not is_transient(exc):
+                    raise
+                delay = retry_after(exc)
+                if throttled:
+                    self._count(throttled=1)
+                    if delay is not None and delay <= MAX_RETRY_AFTER:
+                        self.bucket.pause(delay)
+                if attempt >= self.max_retries or (delay or 0.0) > MAX_RETRY_AFTER:
+                    self._count(gave_up=1)
+                    raise UpstreamError(_give_up_message(status, delay)) from exc
+            finally:
+                self.concurrency.release(outcome)
+            self._count(retries=1)
+            self._sleep(max(delay or 0.0, self.backoff(attempt)))
+            attempt += 1
+
+
+def _give_up_message(status: int | None, delay: float | None) -> str:
+    if status in THROTTLE_STATUSES:
+        problem = f"{UPSTREAM_NAME} is rate limiting requests (HTTP {status})"
+    elif status is not None:
+        problem = f"{UPSTREAM_NAME} returned HTTP {status}"
+    else:
+        problem = f"Could not reach {UPSTREAM_NAME}"
+    wait = f"in {math.ceil(delay)} seconds" if delay else "in a minute"
+    return f"{problem}. Try again {wait}."
+
+
+class LimitedClient:
+    """Proxy that sends every method call on ``client`` through ``limiter``."""
+
+    def __init__(self, client: Any, limiter: HostLimiter) -> None:
+        self._client = client
+        self._limiter = limiter
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._limiter.call(lambda: attr(*args, **kwargs))
+
+
+_limiters: dict[str, RateLimiter] = {}
+_host_limiters: dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(host: str = GARMIN_HOST) -> RateLimiter:
+    """Return the shared token bucket for ``host``, creating it on first call."""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(env_float(RATE_LIMIT_ENV, DEFAULT_RATE_LIMIT))
+            _limiters[host] = limiter
+        return limiter
+
+
+def get_host_limiter(host: str = GARMIN_HOST) -> HostLimiter:
+    """Return the shared rate, concurrency and retry policy for ``host``."""
+    bucket = get_limiter(host)
+    with _limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(
+                bucket,
+                AdaptiveConcurrency(env_int(CONCURRENCY_ENV, DEFAULT_CONCURRENCY)),
+                max_retries=env_int(RETRIES_ENV, DEFAULT_RETRIES, minimum=0),
+            )
+            _host_limiters[host] = limiter
+        return limiter
+
+
+def limited(client: Any, host: str = GARMIN_HOST) -> LimitedClient:
+    """Wrap ``client`` so its calls share ``host``'s limiter."""
+    return LimitedClient(client, get_host_limiter(host))
+
+
+def _reset_limiters() -> None:
+    """Drop all shared limiters. Used in tests only."""
+    with _limiters_lock:
+        _limiters.clear()
+        _host_limiters.clear()
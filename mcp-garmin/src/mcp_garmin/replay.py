@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from mcp_garmin.config import env_float, env_int
+from mcp_garmin.tokens import write_private
+
+logger = logging.getLogger(__name__)
+
+RECORD_DIR_ENV = "GARMIN_RECORD_DIR"
+REPLAY_DIR_ENV = "GARMIN_REPLAY_DIR"
+REPLAY_LATENCY_ENV = "GARMIN_REPLAY_LATENCY_MS"
+REPLAY_JITTER_ENV = "GARMIN_REPLAY_JITTER_MS"
+REPLAY_ERROR_RATE_ENV = "GARMIN_REPLAY_ERROR_RATE"
+REPLAY_ERROR_STATUS_ENV = "GARMIN_REPLAY_ERROR_STATUS"
+REPLAY_SEED_ENV = "GARMIN_REPLAY_SEED"
+DEFAULT_ERROR_STATUS = 503
+
+SCRUBBED = "REDACTED"
+
+# A key containing any of these (case-insensitive) holds a credential or identifies the user.
+_SECRET_KEY_PARTS = (
+    "token",
+    "secret",
+    "password",
+    "cookie",
+    "authorization",
+    "email",
+    "displayname",
+    "fullname",
+    "username",
+    "profileimage",
+    "userprofilepk",
+    "userprofileid",
+    "ownerid",
+    "userid",
+)
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9.=-]+")
+
+
+def _is_secret(key: str) -> bool:
+    normalized = key.replace("_", "").replace("-", "").lower()
+    return any(part in normalized for part in _SECRET_KEY_PARTS)
+
+
+def scrub(value: Any) -> Any:
+    """Return ``value`` with secret fields blanked and e-mail addresses masked.
+
+    Scrubbed fields keep their type (strings become ``REDACTED``, numbers 0)
+    so replayed payloads have the same shape as real ones.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _blank(item) if _is_secret(str(key)) else scrub(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [scrub(item) for item in value]
+    if isinstance(value, str):
+        return _EMAIL_RE.sub(SCRUBBED, value)
+    return value
+
+
+def _blank(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, str):
+        return SCRUBBED
+    if isinstance(value, int | float):
+        return 0
+    return scrub(value)
+
+
+def fixture_path(
+    directory: Path, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Path:
+    """``<directory>/<method>/<readable args>-<hash>.json`` for one call."""
+    parts = [str(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())]
+    readable = _UNSAFE_RE.sub("-", "_".join(parts))[:80] or "noargs"
+    canonical = json.dumps([list(args), kwargs], sort_keys=True, default=str)
+    digest = hashlib.sha256(canonical.encode()).hexdigest()[:10]
+    return directory / method / f"{readable}-{digest}.json"
+
+
+def write_fixture(
+    directory: Path, method: str, args: tuple[Any, ...], kwargs: dict[str, Any], response: Any
+) -> Path:
+    """Save one scrubbed response. The file is replaced atomically, owner-only."""
+    path = fixture_path(directory, method, args, kwargs)
+    record = {
+        "method": method,
+        "args": scrub(json.loads(json.dumps(list(args), default=str))),
+        "kwargs": scrub(json.loads(json.dumps(kwargs, default=str))),
+        "response": scrub(response),
+    }
+    # Fixtures hold health and diary data, so they are owner-only like the tokens.
+    write_private(path, json.dumps(record, indent=1, ensure_ascii=False, default=str))
+    return path
+
+
+class RecordingClient:
+    """Proxy that saves the response of every method call on ``client`` under ``directory``."""
+
+    def __init__(self, client: Any, directory: Path) -> None:
+        self._client = client
+        self._directory = directory
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            response = attr(*args, **kwargs)
+            try:
+                write_fixture(self._directory, name, args, kwargs, response)
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("Could not record %s response: %s", name, exc)
+            return response
+
+        return record
+
+
+class MissingFixtureError(LookupError):
+    """Raised by ``ReplayClient`` for a call that was never recorded."""
+
+
+class _InjectedResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+
+class InjectedError(OSError):
+    """An upstream HTTP failure made up by ``ReplayClient``.
+
+    It carries a ``response`` with a status code, like the errors garth and
+    requests raise, so the rate limiter retries or backs off as it would for
+    a real one.
+    """
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"{status_code} error injected by the replay client")
+        self.response = _InjectedResponse(status_code)
+
+
+class ReplayClient:
+    """Stand-in for ``garminconnect.Garmin`` that answers from recorded fixtures.
+
+    Each method call sleeps ``latency`` plus up to ``jitter`` seconds, then
+    fails with ``InjectedError(error_status)`` with probability ``error_rate``
+    or returns a fresh copy of the recorded response.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = DEFAULT_ERROR_STATUS,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.calls = 0
+        self.injected_errors = 0
+        self._directory = directory
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._sleep = sleep
+        self._rng = random.Random(seed)  # noqa: S311 - fault injection, not cryptography
+        self._texts: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self._call(name, args, kwargs)
+
+    def _call(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        with self._lock:
+            self.calls += 1
+            delay = self._latency + self._rng.uniform(0, self._jitter)
+            fail = self._rng.random() < self._error_rate
+            if fail:
+                self.injected_errors += 1
+        if delay > 0:
+            self._sleep(delay)
+        if fail:
+            raise InjectedError(self._error_status)
+        path = fixture_path(self._directory, method, args, kwargs)
+        return json.loads(self._text(path))["response"]
+
+    def _text(self, path: Path) -> str:
+        text = self._texts.get(path)
+        if text is None:
+            try:
+                text = path.read_text()
+            except FileNotFoundError:
+                raise MissingFixtureError(
+                    f"No recorded Garmin response at {path}. Record it with {RECORD_DIR_ENV}."
+                ) from None
+            self._texts[path] = text
+        return text
+
+
+def replay_client_from_env() -> ReplayClient | None:
+    """A ``ReplayClient`` configured from the environment, or None unless ``GARMIN_REPLAY_DIR``."""
+    directory = os.environ.get(REPLAY_DIR_ENV)
+    if not directory:
+        return None
+    error_rate = env_float(REPLAY_ERROR_RATE_ENV, 0.0)
+    if error_rate > 1:
+        raise ValueError(f"{REPLAY_ERROR_RATE_ENV} must be between 0 and 1, got {error_rate}.")
+    logger.info("Serving recorded Garmin responses from %s", directory)
+    return ReplayClient(
+        Path(directory).expanduser(),
+        latency=env_float(REPLAY_LATENCY_ENV, 0.0) / 1000,
+        jitter=env_float(REPLAY_JITTER_ENV, 0.0) / 1000,
+        error_rate=error_rate,
+        error_status=env_int(REPLAY_ERROR_STATUS_ENV, DEFAULT_ERROR_STATUS, minimum=100),
+        seed=env_int(REPLAY_SEED_ENV, 0, minimum=0) if os.environ.get(REPLAY_SEED_ENV) else None,
+    )
+
+
+def recording(client: Any) -> Any:
+    """Wrap ``client`` in a ``RecordingClient`` when ``GARMIN_RECORD_DIR`` is set."""
+    directory = os.environ.get(RECORD_DIR_ENV)
+    if not directory:
+        return client
+    logger.info("Recording Garmin responses to %s", directory)
+    return RecordingClient(client, Path(directory).expanduser())
@@ -2,37 +2,119 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from mcp_garmin import tools
-from mcp_garmin.client import get_client
+from mcp_garmin import metrics, tools
+from mcp_garmin.cache import BYPASS_ARGUMENT, get_cache
+from mcp_garmin.client import get_client, stop_token_refresher, warm_up
+from mcp_garmin.executor import run_blocking, shutdown_executor
+from mcp_garmin.metrics import METRICS_TOOL, get_metrics, hit_rate, start_metrics_dump
+from mcp_garmin.output import OUTPUT_PROPERTIES, encode, output_options, parse_options
+from mcp_garmin.ratelimit import UpstreamError, get_host_limiter, limited
+from mcp_garmin.singleflight import SingleFlight, call_key
+from mcp_garmin.sync import start_background_sync
+from mcp_garmin.tools import Handler
+from mcp_garmin.tools._shared import _with_properties
+from mcp_garmin.validation import parse_flag
+from mcp_garmin.warehouse import WarehouseClient, get_warehouse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 server: Server = Server("mcp-garmin")
 
+# Identical (tool, arguments) calls in flight at the same time share one upstream fetch.
+inflight = SingleFlight()
+
+SERVER_TOOLS: list[Tool] = [_with_properties(METRICS_TOOL, OUTPUT_PROPERTIES)]
+
 
 @server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
 async def list_tools() -> list[Tool]:
-    return tools.ALL_TOOLS
+    return tools.ALL_TOOLS + SERVER_TOOLS
+
+
+def _tool_client(arguments: dict[str, str]) -> Any:
+    """The client handlers see: the rate-limited Garmin client, behind the warehouse when enabled.
+
+    Warehouse hits never reach the limiter; only calls that go to Garmin spend its budget,
+    and only those count as upstream time in the server metrics.
+    """
+    client = metrics.metered(limited(get_client()))
+    warehouse = get_warehouse()
+    if warehouse is None:
+        return client
+    bypass = parse_flag(arguments.get(BYPASS_ARGUMENT, False), BYPASS_ARGUMENT)
+    return WarehouseClient(client, warehouse, read=not bypass)
+
+
+def _execute(name: str, handler: Handler, arguments: dict[str, str]) -> list[TextContent]:
+    """Run one tool call on a worker thread, through the response cache when enabled."""
+    metrics.mark_executed()
+    cache = get_cache()
+    if cache is None:
+        return _handle(handler, arguments)
+    return cache.call(name, arguments, lambda: _handle(handler, arguments))
+
+
+def _handle(handler: Handler, arguments: dict[str, str]) -> list[TextContent]:
+    client = _tool_client(arguments)
+    with metrics.handling():
+        return handler(client, arguments)
+
+
+def server_metrics() -> dict[str, Any]:
+    """Per-tool metrics plus the cache, warehouse, coalescing and limiter counters."""
+    snapshot = get_metrics().snapshot()
+    snapshot["coalescing"] = inflight.stats.as_dict()
+    snapshot["upstream_limiter"] = get_host_limiter().stats.as_dict()
+    cache = get_cache()
+    if cache is not None:
+        hits = cache.stats.memory_hits + cache.stats.disk_hits
+        snapshot["response_cache"] = {
+            **cache.stats.as_dict(),
+            "hit_rate": hit_rate(hits, cache.stats.misses),
+        }
+    warehouse = get_warehouse()
+    if warehouse is not None:
+        snapshot["warehouse"] = {
+            **warehouse.stats.as_dict(),
+            "hit_rate": hit_rate(warehouse.stats.hits, warehouse.stats.misses),
+        }
+    return snapshot
+
+
+def _metrics_result(arguments: dict[str, str]) -> list[TextContent]:
+    with output_options(parse_options(arguments)):
+        return [TextContent(type="text", text=encode(server_metrics()))]
 
 
 @server.call_tool()  # type: ignore[untyped-decorator]
 async def call_tool(name: str, arguments: dict[str, str]) -> list[TextContent]:
     logger.info("Tool called: %s", name)
     try:
-        client = get_client()
+        if name == METRICS_TOOL.name:
+            return _metrics_result(arguments)
         handler = tools.DISPATCH.get(name)
         if handler is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
-        return handler(client, arguments)
+        with get_metrics().track(name) as call:
+            result = await inflight.do(
+                call_key(name, arguments),
+                lambda: run_blocking(_execute, name, handler, arguments),
+            )
+            call.respond(result)
+        return result
     except RuntimeError as exc:
         logger.error("Auth error in tool %s: %s", name, exc)
         return [TextContent(type="text", text=str(exc))]
+    except UpstreamError as exc:
+        logger.error("Upstream error in tool %s: %s", name, exc)
+        return [TextContent(type="text", text=str(exc))]
     except ValueError as exc:
         logger.error("Validation error in tool %s: %s", name, exc)
         return [TextContent(type="text", text=f"Invalid argument: {exc}")]
@@ -42,8 +124,28 @@ async def call_tool(name: str, arguments: dict[str, str]) -> list[TextContent]:
 
 
 async def _run() -> None:
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    # Log in while the stdio transport and MCP handshake are being set up.
+    warm_up()
+    background_sync = start_background_sync(lambda: limited(get_client()))
+    metrics_dump = start_metrics_dump(server_metrics)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        if background_sync is not None:
+            background_sync.stop(timeout=5)
+        stop_token_refresher(timeout=5)
+        shutdown_executor()
+        if metrics_dump is not None:
+            metrics_dump.stop(timeout=5)
+        logger.info("Request coalescing stats: %s", inflight.stats.as_dict())
+        logger.info("Upstream limiter stats: %s", get_host_limiter().stats.as_dict())
+        cache = get_cache()
+        if cache is not None:
+            logger.info("Response cache stats: %s", cache.stats.as_dict())
+        warehouse = get_warehouse()
+        if warehouse is not None:
+            logger.info("Warehouse stats: %s", warehouse.stats.as_dict())
 
 
 def main() -> None:
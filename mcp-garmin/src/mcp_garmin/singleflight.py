@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+def call_key(name: str, arguments: Mapping[str, Any]) -> str:
+    """Identify a tool call by its name and every argument, independent of argument order.
+
+    Unlike a cache key, nothing is dropped: a call that asks to bypass the
+    cache must not join a flight that may be answered from it.
+    """
+    payload = json.dumps([name, arguments], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class SingleFlightStats:
+    executed: int = 0
+    deduplicated: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"executed": self.executed, "deduplicated": self.deduplicated}
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one in-flight execution.
+
+    The first caller for a key starts the work as a task; callers arriving while
+    it runs await the same task and receive its result or exception. The task is
+    shielded, so cancelling one caller does not cancel the fetch for the rest.
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def do[T](self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        existing = self._inflight.get(key)
+        if existing is None:
+            task: asyncio.Future[T] = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.stats.executed += 1
+        else:
+            task = existing
+            self.stats.deduplicated += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away.
+            task.exception()
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from mcp_garmin.client import get_client
+from mcp_garmin.config import env_int
+from mcp_garmin.fanout import fan_out
+from mcp_garmin.ratelimit import limited
+from mcp_garmin.tools.activities import ACTIVITY_WINDOW_DAYS
+from mcp_garmin.warehouse import (
+    ACTIVITIES,
+    METRICS,
+    Warehouse,
+    day_range,
+    get_warehouse,
+    split_activities,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncReport:
+    """What one sync run fetched. ``days`` counts stored (metric, day) rows."""
+
+    days: int = 0
+    requests: int = 0
+    bytes: int = 0
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def merge(self, other: SyncReport) -> None:
+        self.days += other.days
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.errors.extend(other.errors)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "days": self.days,
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "errors": len(self.errors),
+            "seconds": round(self.seconds, 3),
+        }
+
+    def describe(self) -> str:
+        """One line with totals and throughput, for the sync command's output."""
+        seconds = max(self.seconds, 1e-9)
+        return (
+            f"{self.days} days, {self.requests} requests, {self.bytes:,} bytes "
+            f"in {self.seconds:.1f}s ({self.days / seconds:.1f} days/s, "
+            f"{self.requests / seconds:.1f} req/s, {len(self.errors)} errors)"
+        )
+
+
+def _windows(days: list[date], size: int) -> list[tuple[date, date]]:
+    """Cover sorted ``days`` with contiguous ``(start, end)`` runs of at most ``size`` days."""
+    windows: list[tuple[date, date]] = []
+    for day in days:
+        if windows:
+            start, end = windows[-1]
+            if day == end + timedelta(days=1) and (day - start).days < size:
+                windows[-1] = (start, day)
+                continue
+        windows.append((day, day))
+    return windows
+
+
+def _sync_daily(
+    warehouse: Warehouse,
+    client: Any,
+    metric: str,
+    days: list[date],
+    max_workers: int | None,
+) -> SyncReport:
+    spec = METRICS[metric]
+    method = getattr(client, spec.method)
+
+    def fetch(day: date) -> Any:
+        iso = day.isoformat()
+        return method(iso, iso) if spec.ranged else method(iso)
+
+    report = SyncReport(requests=len(days))
+    for day, result in zip(days, fan_out(fetch, days, max_workers=max_workers), strict=True):
+        if isinstance(result, Exception):
+            report.errors.append(f"{metric} {day}: {result}")
+        else:
+            report.bytes += warehouse.put(metric, day, result)
+            report.days += 1
+    return report
+
+
+def _sync_activities(
+    warehouse: Warehouse, client: Any, days: list[date], max_workers: int | None
+) -> SyncReport:
+    windows = _windows(days, ACTIVITY_WINDOW_DAYS)
+    results = fan_out(
+        lambda w: client.get_activities_by_date(w[0].isoformat(), w[1].isoformat()),
+        windows,
+        max_workers=max_workers,
+    )
+    report = SyncReport(requests=len(windows))
+    for (start, end), result in zip(windows, results, strict=True):
+        if isinstance(result, Exception):
+            report.errors.append(f"{ACTIVITIES} {start}..{end}: {result}")
+            continue
+        for day, activities in split_activities(result, day_range(start, end)).items():
+            report.bytes += warehouse.put(ACTIVITIES, day, activities)
+            report.days += 1
+    return report
+
+
+def sync_range(
+    warehouse: Warehouse,
+    client: Any,
+    start: date,
+    end: date,
+    metrics: Iterable[str] | None = None,
+    max_workers: int | None = None,
+) -> SyncReport:
+    """Fetch every day in ``start..end`` that the warehouse lacks or holds stale.
+
+    Days inside a metric's watermarks are skipped without a lookup, and settled
+    days already stored final are not refetched, so repeated runs only touch
+    gaps and the last few days. When a metric's range ends up fully final, its
+    watermark is extended over it.
+    """
+    started = time.perf_counter()
+    report = SyncReport()
+    for metric in metrics or METRICS:
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}. Expected one of: {', '.join(METRICS)}.")
+        missing = warehouse.missing_days(metric, start, end)
+        if missing:
+            if metric == ACTIVITIES:
+                part = _sync_activities(warehouse, client, missing, max_workers)
+            else:
+                part = _sync_daily(warehouse, client, metric, missing, max_workers)
+            report.merge(part)
+            if part.errors:
+                continue
+        warehouse.extend_watermark(metric, start, end)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def backfill(
+    warehouse: Warehouse,
+    client: Any,
+    start: date,
+    end: date,
+    metrics: Iterable[str] | None = None,
+    max_workers: int | None = None,
+    chunk_days: int = 30,
+    on_chunk: Callable[[date, date, SyncReport], None] | None = None,
+) -> SyncReport:
+    """Sync ``start..end`` oldest first, ``chunk_days`` at a time.
+
+    Every chunk is stored, and its watermark extended, before the next one
+    starts, so an interrupted backfill picks up at the first unfinished chunk
+    when run again.
+    """
+    started = time.perf_counter()
+    metrics = list(metrics or METRICS)
+    total = SyncReport()
+    for chunk_start, chunk_end in _windows(day_range(start, end), chunk_days):
+        report = sync_range(warehouse, client, chunk_start, chunk_end, metrics, max_workers)
+        total.merge(report)
+        if on_chunk is not None:
+            on_chunk(chunk_start, chunk_end, report)
+    total.seconds = time.perf_counter() - started
+    return total
+
+
+class BackgroundSync:
+    """Daemon thread that keeps the last ``days`` days synced every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        warehouse: Warehouse,
+        client_factory: Callable[[], Any],
+        interval: float,
+        days: int,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self._warehouse = warehouse
+        self._client_factory = client_factory
+        self._interval = interval
+        self._days = days
+        self._today = today
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="garmin-sync", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def run_once(self) -> SyncReport:
+        end = self._today()
+        start = end - timedelta(days=self._days - 1)
+        return sync_range(self._warehouse, self._client_factory(), start, end)
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                report = self.run_once()
+                logger.info("Background sync: %s", report.as_dict())
+            except Exception as exc:
+                # Keep the thread alive; auth may become available later.
+                logger.warning("Background sync failed: %s", exc)
+            if self._stop.wait(self._interval):
+                return
+
+
+def start_background_sync(client_factory: Callable[[], Any]) -> BackgroundSync | None:
+    """Start periodic syncing when ``GARMIN_WAREHOUSE_SYNC_INTERVAL`` is set (seconds)."""
+    interval = env_int("GARMIN_WAREHOUSE_SYNC_INTERVAL", 0, minimum=0)
+    warehouse = get_warehouse()
+    if interval == 0 or warehouse is None:
+        return None
+    days = env_int("GARMIN_WAREHOUSE_SYNC_DAYS", 7)
+    sync = BackgroundSync(warehouse, client_factory, interval, days)
+    sync.start()
+    logger.info("Background sync every %ds over the last %d days", interval, days)
+    return sync
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="mcp-garmin-sync",
+        description="Backfill Garmin daily metrics into the local warehouse.",
+    )
+    parser.add_argument("--start", type=date.fromisoformat, help="first day (YYYY-MM-DD)")
+    parser.add_argument(
+        "--end", type=date.fromisoformat, help="last day (YYYY-MM-DD, default today)"
+    )
+    parser.add_argument(
+        "--days", type=int, default=30, help="days back from --end when --start is not given"
+    )
+    parser.add_argument(
+        "--metrics",
+        default=",".join(METRICS),
+        help=f"comma-separated metrics to sync (default: {','.join(METRICS)})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="concurrent requests (default $GARMIN_FETCH_WORKERS)",
+    )
+    parser.add_argument(
+        "--chunk-days", type=int, default=30, help="days stored per checkpoint (default 30)"
+    )
+    args = parser.parse_args(argv)
+    args.end = args.end or date.today()
+    args.start = args.start or args.end - timedelta(days=max(args.days, 1) - 1)
+    if args.start > args.end:
+        parser.error("--start must not be after --end")
+    if args.chunk_days < 1 or (args.workers is not None and args.workers < 1):
+        parser.error("--chunk-days and --workers must be >= 1")
+    args.metrics = [m.strip() for m in args.metrics.split(",") if m.strip()]
+    unknown = [m for m in args.metrics if m not in METRICS]
+    if unknown:
+        parser.error(f"unknown metrics: {', '.join(unknown)}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``mcp-garmin-sync``, e.g. from cron."""
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    warehouse = get_warehouse()
+    if warehouse is None:
+        print("The warehouse is disabled (GARMIN_WAREHOUSE_ENABLED=false).", file=sys.stderr)
+        return 2
+    try:
+        client = limited(get_client())
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    def progress(chunk_start: date, chunk_end: date, report: SyncReport) -> None:
+        print(f"{chunk_start}..{chunk_end}: {report.describe()}", flush=True)
+        for error in report.errors:
+            print(f"  {error}", file=sys.stderr)
+
+    total = backfill(
+        warehouse,
+        client,
+        args.start,
+        args.end,
+        args.metrics,
+        max_workers=args.workers,
+        chunk_days=args.chunk_days,
+        on_chunk=progress,
+    )
+    print(f"total {args.start}..{args.end}: {total.describe()}")
+    return 1 if total.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
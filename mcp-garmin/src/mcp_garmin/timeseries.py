@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+IndexArray = npt.NDArray[np.intp]
+
+
+def lttb_indices(x: FloatArray, y: FloatArray, threshold: int) -> IndexArray:
+    """Pick ``threshold`` sample indices with Largest-Triangle-Three-Buckets.
+
+    The first and last samples are always kept. The samples in between are
+    split into ``threshold - 2`` buckets, and from each bucket the point forming
+    the largest triangle with the previously chosen point and the average of
+    the next bucket is kept. Peaks and troughs survive, unlike with plain
+    decimation or bucket means. ``x`` must be sorted and free of NaNs.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n, dtype=np.intp)
+
+    every = (n - 2) / (threshold - 2)
+    # edges[i]..edges[i + 1] is bucket i; the final edge is the last sample.
+    edges = (np.floor(np.arange(threshold - 1) * every) + 1).astype(np.intp)
+    edges[-1] = n - 1
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = int(start + np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def decode_detail_metrics(details: dict[str, Any]) -> tuple[list[dict[str, Any]], FloatArray]:
+    """Decode ``activityDetailMetrics`` into a (samples x metrics) float matrix.
+
+    Returns the ``metricDescriptors`` ordered by ``metricsIndex`` and a matrix
+    whose column ``i`` holds that descriptor's values, with missing samples as NaN.
+    Descriptors without an integer ``metricsIndex`` or a ``key`` are skipped.
+    """
+    descriptors = sorted(
+        (
+            d
+            for d in details.get("metricDescriptors") or []
+            if isinstance(d, dict) and isinstance(d.get("metricsIndex"), int) and "key" in d
+        ),
+        key=lambda d: d["metricsIndex"],
+    )
+    rows = [sample.get("metrics") or [] for sample in details.get("activityDetailMetrics") or []]
+    if not rows or not descriptors:
+        return descriptors, np.empty((0, len(descriptors)))
+    width = descriptors[-1]["metricsIndex"] + 1
+    # Rows are normally uniform; pad or trim any that aren't so the matrix is rectangular.
+    uniform = [r if len(r) == width else (list(r) + [None] * width)[:width] for r in rows]
+    matrix = np.array(uniform, dtype=np.float64)
+    return descriptors, matrix[:, [d["metricsIndex"] for d in descriptors]]
+
+
+# Keys Garmin uses for the timestamp and the value of one epoch, in lookup order.
+_TIME_KEYS = ("startGMT", "startTimeGMT", "epochTimestamp", "timestamp")
+_VALUE_KEYS = ("value", "respirationValue", "spo2Reading", "activityLevel")
+
+
+def _epoch_ms(value: Any) -> float:
+    """Convert a Garmin timestamp (epoch ms or naive-UTC ISO string) to epoch ms."""
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        return float(np.datetime64(value.rstrip("Z"), "ms").astype(np.int64))
+    return np.nan
+
+
+def epoch_samples(items: list[Any]) -> tuple[FloatArray, FloatArray]:
+    """Extract (timestamp_ms, value) arrays from a Garmin epoch list.
+
+    Accepts ``[timestamp, value, ...]`` pairs as well as objects such as
+    ``{"startGMT": ..., "value": ...}`` or ``{"epochTimestamp": ..., "spo2Reading": ...}``.
+    Unparseable entries become NaN.
+    """
+    times = np.full(len(items), np.nan)
+    values = np.full(len(items), np.nan)
+    for i, item in enumerate(items):
+        if isinstance(item, list | tuple) and len(item) >= 2:
+            t, v = item[0], item[1]
+        elif isinstance(item, dict):
+            t = next((item[k] for k in _TIME_KEYS if k in item), None)
+            v = next((item[k] for k in _VALUE_KEYS if k in item), None)
+        else:
+            continue
+        try:
+            times[i] = _epoch_ms(t)
+        except ValueError:
+            continue
+        if isinstance(v, int | float) and not isinstance(v, bool):
+            values[i] = v
+    return times, values
+
+
+def stage_intervals(levels: list[Any]) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Decode ``sleepLevels`` into (start_ms, end_ms, stage) arrays sorted by start.
+
+    Entries without a numeric ``activityLevel`` or with unparseable times are skipped.
+    """
+    rows = []
+    for lvl in levels:
+        if not isinstance(lvl, dict) or not isinstance(lvl.get("activityLevel"), int | float):
+            continue
+        try:
+            start, end = _epoch_ms(lvl.get("startGMT")), _epoch_ms(lvl.get("endGMT"))
+        except ValueError:
+            continue
+        rows.append((start, end, lvl["activityLevel"]))
+    if not rows:
+        empty = np.empty(0)
+        return empty, empty, empty
+    starts, ends, stages = (np.array(col, dtype=np.float64) for col in zip(*rows, strict=True))
+    order = np.argsort(starts)
+    return starts[order], ends[order], stages[order]
+
+
+def series_stats(
+    times: FloatArray,
+    values: FloatArray,
+    stages: tuple[FloatArray, FloatArray, FloatArray] | None = None,
+    stage_names: dict[int, str] | None = None,
+) -> dict[str, Any] | None:
+    """Summarise one epoch series: range, mean, percentiles, trend and per-stage means.
+
+    NaNs and negative values (Garmin's no-data sentinels) are ignored. ``slopePerHour``
+    is the least-squares trend. ``stageMeans`` averages the samples that fall inside
+    each interval of ``stages``. Returns None when no valid samples remain.
+    """
+    valid = ~np.isnan(values) & (values >= 0)
+    v = values[valid]
+    if v.size == 0:
+        return None
+    t = times[valid]
+    p10, p50, p90 = np.percentile(v, [10, 50, 90])
+    stats: dict[str, Any] = {
+        "count": int(v.size),
+        "min": float(v.min()),
+        "max": float(v.max()),
+        "mean": round(float(v.mean()), 2),
+        "p10": round(float(p10), 2),
+        "p50": round(float(p50), 2),
+        "p90": round(float(p90), 2),
+    }
+    timed = ~np.isnan(t)
+    hours = t[timed] / 3_600_000.0
+    if hours.size >= 2 and np.ptp(hours) > 0:
+        stats["slopePerHour"] = round(float(np.polyfit(hours, v[timed], 1)[0]), 3)
+
+    if stages is not None and stages[0].size and timed.any():
+        starts, ends, levels = stages
+        t_timed, v_timed = t[timed], v[timed]
+        slot = np.searchsorted(starts, t_timed, side="right") - 1
+        inside = (slot >= 0) & (t_timed < ends[np.clip(slot, 0, None)])
+        sample_levels = levels[slot[inside]].astype(np.intp)
+        sums = np.bincount(sample_levels, weights=v_timed[inside])
+        counts = np.bincount(sample_levels)
+        names = stage_names or {}
+        stats["stageMeans"] = {
+            names.get(level, str(level)): round(float(sums[level] / counts[level]), 2)
+            for level in np.flatnonzero(counts).tolist()
+        }
+    return stats
+
+
+def column_samples(rows: list[Any], value_index: int = 1) -> tuple[FloatArray, FloatArray]:
+    """Extract (timestamp_ms, value) arrays from Garmin ``[timestamp, ..., value, ...]`` rows.
+
+    Rows that are too short or hold non-numeric entries become NaN.
+    """
+    times = np.full(len(rows), np.nan)
+    values = np.full(len(rows), np.nan)
+    for i, row in enumerate(rows):
+        if not isinstance(row, list | tuple) or len(row) <= value_index:
+            continue
+        t, v = row[0], row[value_index]
+        if isinstance(t, int | float) and not isinstance(t, bool):
+            times[i] = t
+        if isinstance(v, int | float) and not isinstance(v, bool):
+            values[i] = v
+    return times, values
+
+
+BUCKET_COLUMNS = ["startGMT", "min", "mean", "max", "count"]
+
+
+def bucket_rows(times: FloatArray, values: FloatArray, width_ms: int) -> list[list[Any]]:
+    """Aggregate a series into fixed ``width_ms`` buckets aligned to the epoch.
+
+    Returns one ``[startGMT, min, mean, max, count]`` row per bucket that holds
+    at least one valid sample, in time order. NaNs and negative values (Garmin's
+    no-data sentinels) are ignored rather than counted.
+    """
+    valid = ~np.isnan(times) & ~np.isnan(values) & (values >= 0)
+    if not valid.any():
+        return []
+    buckets = np.floor(times[valid] / width_ms).astype(np.int64)
+    order = np.argsort(buckets, kind="stable")
+    buckets, v = buckets[order], values[valid][order]
+    starts = np.flatnonzero(np.r_[True, np.diff(buckets) != 0])
+    counts = np.diff(np.r_[starts, v.size])
+    mins = np.minimum.reduceat(v, starts)
+    maxs = np.maximum.reduceat(v, starts)
+    means = np.round(np.add.reduceat(v, starts) / counts, 2)
+    labels = np.datetime_as_string((buckets[starts] * width_ms).astype("datetime64[ms]"), unit="s")
+    return [
+        list(row)
+        for row in zip(
+            labels.tolist(),
+            mins.tolist(),
+            means.tolist(),
+            maxs.tolist(),
+            counts.tolist(),
+            strict=True,
+        )
+    ]
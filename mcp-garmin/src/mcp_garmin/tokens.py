@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from mcp_garmin.config import env_bool, env_int
+
+logger = logging.getLogger(__name__)
+
+REFRESH_ENABLED_ENV = "GARMIN_TOKEN_REFRESH"
+REFRESH_MARGIN_ENV = "GARMIN_TOKEN_REFRESH_MARGIN"
+DEFAULT_REFRESH_MARGIN = 10 * 60
+RETRY_INTERVAL = 60
+
+OAUTH2_FILE = "oauth2_token.json"
+
+
+def write_private(path: Path, text: str | bytes) -> None:
+    """Replace ``path`` with ``text`` atomically, leaving it readable by the owner only.
+
+    The new content is written and fsynced to a temporary file in the same
+    directory, then renamed over ``path``, so a crash mid-write never leaves a
+    truncated token file behind.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkstemp creates the file with mode 0600.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(text, bytes) else "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _exchange(garth_client: Any) -> Any:
+    """Swap the long-lived OAuth1 token for a fresh OAuth2 token, as garth does on expiry."""
+    from garth import sso
+
+    return sso.exchange(garth_client.oauth1_token, garth_client)
+
+
+def _expires_at(garth_client: Any) -> float | None:
+    token = getattr(garth_client, "oauth2_token", None)
+    expires_at = getattr(token, "expires_at", None)
+    if isinstance(expires_at, int | float) and not isinstance(expires_at, bool):
+        return float(expires_at)
+    return None
+
+
+class TokenRefresher:
+    """Renew the garth OAuth2 token ``margin`` seconds before it expires.
+
+    garth only refreshes inside the request that finds the token expired, so
+    that request pays for the round-trip. It also does not write the new token
+    back to a token store loaded with ``login(path)``. This daemon thread
+    refreshes ahead of time and persists each new token to ``token_store``.
+    """
+
+    def __init__(
+        self,
+        garth_client: Any,
+        token_store: Path,
+        margin: float = DEFAULT_REFRESH_MARGIN,
+        exchange: Callable[[Any], Any] = _exchange,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.refreshes = 0
+        self.failures = 0
+        self._garth = garth_client
+        self._token_store = token_store
+        self._margin = margin
+        self._exchange = exchange
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="garmin-token", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def step(self) -> float:
+        """Refresh if the token is due, and return the seconds until the next check."""
+        expires_at = _expires_at(self._garth)
+        if expires_at is None:
+            return RETRY_INTERVAL
+        due_in = expires_at - self._margin - self._clock()
+        if due_in > 0:
+            return due_in
+        try:
+            token = self._exchange(self._garth)
+            self._garth.oauth2_token = token
+            write_private(self._token_store / OAUTH2_FILE, json.dumps(asdict(token), indent=4))
+        except Exception as exc:
+            self.failures += 1
+            logger.warning("Garmin token refresh failed, retrying in %ds: %s", RETRY_INTERVAL, exc)
+            return RETRY_INTERVAL
+        self.refreshes += 1
+        logger.info("Garmin OAuth2 token refreshed; valid until %s", time.ctime(token.expires_at))
+        return max(float(token.expires_at) - self._margin - self._clock(), RETRY_INTERVAL)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.step()):
+            pass
+
+
+def start_token_refresher(garmin: Any, token_store: Path) -> TokenRefresher | None:
+    """Start refreshing ``garmin``'s tokens unless ``GARMIN_TOKEN_REFRESH`` is off.
+
+    Returns None when the client holds no OAuth2 token with a known expiry.
+    """
+    if not env_bool(REFRESH_ENABLED_ENV, True):
+        return None
+    garth_client = getattr(garmin, "garth", None)
+    if _expires_at(garth_client) is None:
+        return None
+    margin = env_int(REFRESH_MARGIN_ENV, DEFAULT_REFRESH_MARGIN, minimum=0)
+    refresher = TokenRefresher(garth_client, token_store, margin=margin)
+    refresher.start()
+    return refresher
@@ -1,8 +1,11 @@
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
+from mcp_garmin.output import OUTPUT_PROPERTIES, with_output_options
+from mcp_garmin.profiling import with_profiling
+from mcp_garmin.tools._shared import CACHE_PROPERTIES, _with_properties
 from mcp_garmin.tools.activities import DISPATCH as _ACTIVITY_DISPATCH
 from mcp_garmin.tools.activities import TOOLS as _ACTIVITY_TOOLS
 from mcp_garmin.tools.body import DISPATCH as _BODY_DISPATCH
@@ -13,18 +16,43 @@ from mcp_garmin.tools.goals import DISPATCH as _GOALS_DISPATCH
 from mcp_garmin.tools.goals import TOOLS as _GOALS_TOOLS
 from mcp_garmin.tools.health import DISPATCH as _HEALTH_DISPATCH
 from mcp_garmin.tools.health import TOOLS as _HEALTH_TOOLS
+from mcp_garmin.tools.overview import DISPATCH as _OVERVIEW_DISPATCH
+from mcp_garmin.tools.overview import TOOLS as _OVERVIEW_TOOLS
+from mcp_garmin.tools.ranges import DISPATCH as _RANGE_DISPATCH
+from mcp_garmin.tools.ranges import TOOLS as _RANGE_TOOLS
 from mcp_garmin.tools.wellness import DISPATCH as _WELLNESS_DISPATCH
 from mcp_garmin.tools.wellness import TOOLS as _WELLNESS_TOOLS
 
-ALL_TOOLS: list[Tool] = (
-    _DAILY_TOOLS + _ACTIVITY_TOOLS + _HEALTH_TOOLS + _BODY_TOOLS + _GOALS_TOOLS + _WELLNESS_TOOLS
-)
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
 
-DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
-    **_DAILY_DISPATCH,
-    **_ACTIVITY_DISPATCH,
-    **_HEALTH_DISPATCH,
-    **_BODY_DISPATCH,
-    **_GOALS_DISPATCH,
-    **_WELLNESS_DISPATCH,
+ALL_TOOLS: list[Tool] = [
+    _with_properties(tool, {**CACHE_PROPERTIES, **OUTPUT_PROPERTIES})
+    for tool in (
+        _DAILY_TOOLS
+        + _ACTIVITY_TOOLS
+        + _HEALTH_TOOLS
+        + _BODY_TOOLS
+        + _GOALS_TOOLS
+        + _WELLNESS_TOOLS
+        + _RANGE_TOOLS
+        + _OVERVIEW_TOOLS
+    )
+]
+
+type Handler = Callable[[Garmin, dict[str, str]], list[TextContent]]
+
+# Every handler honours the shared format/precision arguments and can be profiled.
+DISPATCH: dict[str, Handler] = {
+    name: with_profiling(name, with_output_options(handler))
+    for name, handler in {
+        **_DAILY_DISPATCH,
+        **_ACTIVITY_DISPATCH,
+        **_HEALTH_DISPATCH,
+        **_BODY_DISPATCH,
+        **_GOALS_DISPATCH,
+        **_WELLNESS_DISPATCH,
+        **_RANGE_DISPATCH,
+        **_OVERVIEW_DISPATCH,
+    }.items()
 }
@@ -1,13 +1,100 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.types import TextContent, Tool
 
+from mcp_garmin.metrics import serializing
+from mcp_garmin.output import encode
+from mcp_garmin.validation import parse_resolution
+
+_Scalar = str | int | float | bool
+
+
+def _headline(data: Any, prefix: str = "", depth: int = 2) -> dict[str, _Scalar]:
+    """Flatten the scalar fields of a response, dropping lists and nulls.
+
+    Nested objects are expanded into dotted keys up to ``depth`` levels, which
+    keeps summaries like ``hrvSummary.lastNightAvg`` while the per-epoch arrays
+    that make single-day responses large are left out. A list response (e.g.
+    training readiness) is represented by its first entry.
+    """
+    if isinstance(data, list):
+        data = data[0] if data else None
+    if not isinstance(data, dict):
+        return {}
+    flat: dict[str, _Scalar] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, _Scalar):
+            flat[name] = value
+        elif isinstance(value, dict) and depth > 1:
+            flat.update(_headline(value, f"{name}.", depth - 1))
+    return flat
+
 
 def _json_result(data: Any) -> list[TextContent]:
-    return [TextContent(type="text", text=json.dumps(data, indent=2))]
+    with serializing():
+        text = encode(data)
+    return [TextContent(type="text", text=text)]
+
+
+CACHE_PROPERTIES: dict[str, Any] = {
+    "bypass_cache": {
+        "type": "boolean",
+        "description": "Skip the local response cache and fetch fresh data from Garmin",
+    },
+}
+
+
+RESOLUTION_PROPERTIES: dict[str, Any] = {
+    "resolution": {
+        "type": "string",
+        "description": (
+            "Aggregate the intraday samples into fixed buckets (e.g. 5m, 15m, 1h) holding "
+            "min/mean/max/count instead of returning every raw sample"
+        ),
+    },
+}
+
+# Intraday array key -> index of the value within each [timestamp, ...] row.
+ArraySpec = dict[str, int]
+
+
+def _bucketed(data: Any, arrays: ArraySpec, resolution: str | None) -> Any:
+    """Replace the intraday ``arrays`` in ``data`` with per-bucket aggregates.
+
+    Returns ``data`` unchanged when ``resolution`` is empty. Each replaced array
+    becomes ``{"resolution", "columns", "rows"}``; list responses (e.g. body
+    battery) are processed entry by entry.
+    """
+    if not resolution:
+        return data
+    # timeseries pulls in numpy, which is only worth loading once a tool needs it.
+    from mcp_garmin.timeseries import BUCKET_COLUMNS, bucket_rows, column_samples
+
+    width_ms = parse_resolution(resolution) * 1000
+    if isinstance(data, list):
+        return [_bucketed(item, arrays, resolution) for item in data]
+    if not isinstance(data, dict):
+        return data
+    result = dict(data)
+    for key, value_index in arrays.items():
+        rows = data.get(key)
+        if isinstance(rows, list):
+            result[key] = {
+                "resolution": resolution,
+                "columns": BUCKET_COLUMNS,
+                "rows": bucket_rows(*column_samples(rows, value_index), width_ms),
+            }
+    return result
+
+
+def _with_properties(tool: Tool, properties: dict[str, Any]) -> Tool:
+    """Return a copy of ``tool`` whose input schema also accepts ``properties``."""
+    schema = dict(tool.inputSchema)
+    schema["properties"] = {**schema.get("properties", {}), **properties}
+    return tool.model_copy(update={"inputSchema": schema})
 
 
 def _date_range_tool(name: str, description: str) -> Tool:
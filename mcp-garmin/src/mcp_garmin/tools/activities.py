@@ -1,21 +1,98 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Callable
-from typing import Any
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
-from mcp_garmin.tools._shared import _date_range_tool, _json_result
-from mcp_garmin.validation import validate_date
+from mcp_garmin.fanout import fan_out
+from mcp_garmin.tools._shared import _date_range_tool, _json_result, _with_properties
+from mcp_garmin.validation import parse_flag, validate_date
+
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
+
+ACTIVITY_WINDOW_DAYS = 31
+
+_ACTIVITY_TYPE_RE = re.compile(r"^[a-z_]{1,40}$")
+
+# Fields kept per activity when ``lean`` is requested.
+_LEAN_ACTIVITY_FIELDS = (
+    "activityId",
+    "activityName",
+    "startTimeLocal",
+    "duration",
+    "distance",
+    "calories",
+    "averageHR",
+    "maxHR",
+    "averageSpeed",
+    "elevationGain",
+    "aerobicTrainingEffect",
+    "anaerobicTrainingEffect",
+    "activityTrainingLoad",
+)
+
+
+def _windows(start: date, end: date, days: int) -> list[tuple[str, str]]:
+    """Split ``start``..``end`` (inclusive) into consecutive windows of at most ``days``."""
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=days - 1), end)
+        windows.append((str(start), str(window_end)))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+def _lean_activity(activity: dict[str, Any]) -> dict[str, Any]:
+    lean = {k: activity[k] for k in _LEAN_ACTIVITY_FIELDS if k in activity}
+    activity_type = activity.get("activityType")
+    if isinstance(activity_type, dict):
+        lean["activityType"] = activity_type.get("typeKey")
+    return lean
 
 
 def get_activities(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
     validate_date(arguments["start_date"], param_name="start_date")
     validate_date(arguments["end_date"], param_name="end_date")
-    return _json_result(
-        client.get_activities_by_date(arguments["start_date"], arguments["end_date"])
-    )
+    start = date.fromisoformat(arguments["start_date"])
+    end = date.fromisoformat(arguments["end_date"])
+    if start > end:
+        raise ValueError(
+            f"start_date {arguments['start_date']!r} must be on or before "
+            f"end_date {arguments['end_date']!r}."
+        )
+    activity_type = arguments.get("activity_type") or None
+    if activity_type is not None and not _ACTIVITY_TYPE_RE.match(activity_type):
+        raise ValueError(f"Invalid activity_type: {activity_type!r}. Example: running, cycling.")
+    lean = parse_flag(arguments.get("lean", False), "lean")
+
+    def fetch(window: tuple[str, str]) -> list[dict[str, Any]]:
+        if activity_type is None:
+            return list(client.get_activities_by_date(*window))
+        return list(client.get_activities_by_date(*window, activity_type))
+
+    # Long ranges are fetched as concurrent windows rather than one huge paged request.
+    results = fan_out(fetch, _windows(start, end, ACTIVITY_WINDOW_DAYS))
+
+    activities: list[dict[str, Any]] = []
+    seen: set[Any] = set()
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+        for activity in result:
+            # Windows share no days, but de-duplicate by ID in case Garmin's paging overlaps.
+            activity_id = activity.get("activityId")
+            if activity_id is not None:
+                if activity_id in seen:
+                    continue
+                seen.add(activity_id)
+            activities.append(activity)
+    # Garmin returns newest first; keep that order across windows.
+    activities.sort(key=lambda a: str(a.get("startTimeLocal", "")), reverse=True)
+    return _json_result([_lean_activity(a) for a in activities] if lean else activities)
 
 
 _ACTIVITY_DETAIL_TIMESERIES_KEYS = frozenset(
@@ -52,10 +129,111 @@ def get_activity_details(client: Garmin, arguments: dict[str, str]) -> list[Text
     return _json_result(_summarize_activity_details(client.get_activity_details(activity_id)))
 
 
+# Ask Garmin for (nearly) full resolution so downsampling works from the real samples.
+_TIMESERIES_SOURCE_SAMPLES = 20000
+_DEFAULT_TIMESERIES_POINTS = 300
+_MAX_TIMESERIES_POINTS = 2000
+
+# Elapsed-time keys in preference order; the first one present becomes the x axis.
+_TIMESERIES_X_KEYS = ("sumElapsedDuration", "sumDuration", "directTimestamp")
+_DEFAULT_TIMESERIES_CHANNELS = (
+    "directHeartRate",
+    "directSpeed",
+    "directPower",
+    "directRunCadence",
+    "directBikeCadence",
+    "directElevation",
+)
+
+
+def _parse_points(value: object) -> int:
+    try:
+        points = int(str(value))
+    except ValueError as err:
+        raise ValueError(f"Invalid points: {value!r}. Expected an integer.") from err
+    if not 3 <= points <= _MAX_TIMESERIES_POINTS:
+        raise ValueError(f"Invalid points: {points}. Expected 3 to {_MAX_TIMESERIES_POINTS}.")
+    return points
+
+
+def get_activity_timeseries(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
+    import numpy as np
+
+    from mcp_garmin.timeseries import decode_detail_metrics, lttb_indices
+
+    activity_id = arguments.get("activity_id", "")
+    if not activity_id:
+        raise ValueError("activity_id is required and must not be empty.")
+    points = _parse_points(arguments.get("points", _DEFAULT_TIMESERIES_POINTS))
+    requested = [c.strip() for c in arguments.get("channels", "").split(",") if c.strip()]
+
+    details = client.get_activity_details(
+        activity_id, maxchart=_TIMESERIES_SOURCE_SAMPLES, maxpoly=0
+    )
+    descriptors, matrix = decode_detail_metrics(details if isinstance(details, dict) else {})
+    columns = {d["key"]: i for i, d in enumerate(descriptors)}
+    units = {d["key"]: (d.get("unit") or {}).get("key") for d in descriptors}
+    x_key = next((k for k in _TIMESERIES_X_KEYS if k in columns), None)
+    if len(matrix) == 0:
+        return _json_result(
+            {
+                "activityId": activity_id,
+                "x": x_key or "sampleIndex",
+                "samples": 0,
+                "available": sorted(columns),
+                "channels": {},
+            }
+        )
+    if x_key is None:
+        x = np.arange(len(matrix), dtype=np.float64)
+    else:
+        x = matrix[:, columns[x_key]]
+        if x_key == "directTimestamp":
+            x = (x - np.nanmin(x)) / 1000.0  # epoch ms -> seconds since start
+
+    unknown = [c for c in requested if c not in columns]
+    if unknown:
+        raise ValueError(f"Unknown channels {unknown}. Available: {sorted(columns)}.")
+    channels = requested or [c for c in _DEFAULT_TIMESERIES_CHANNELS if c in columns]
+
+    series: dict[str, Any] = {}
+    for name in channels:
+        y = matrix[:, columns[name]]
+        valid = ~(np.isnan(x) | np.isnan(y))
+        keep = lttb_indices(x[valid], y[valid], points)
+        series[name] = {
+            "unit": units[name],
+            "x": np.round(x[valid][keep], 1).tolist(),
+            "y": np.round(y[valid][keep], 3).tolist(),
+        }
+
+    return _json_result(
+        {
+            "activityId": activity_id,
+            "x": x_key or "sampleIndex",
+            "samples": len(matrix),
+            "available": sorted(columns),
+            "channels": series,
+        }
+    )
+
+
 TOOLS: list[Tool] = [
-    _date_range_tool(
-        "get_activities",
-        "Workouts in a date range with type, duration, heart rate, distance, and pace.",
+    _with_properties(
+        _date_range_tool(
+            "get_activities",
+            "Workouts in a date range with type, duration, heart rate, distance, and pace.",
+        ),
+        {
+            "activity_type": {
+                "type": "string",
+                "description": "Only return this activity type, e.g. running, cycling, swimming",
+            },
+            "lean": {
+                "type": "boolean",
+                "description": "Return a small set of key fields per activity instead of all",
+            },
+        },
     ),
     Tool(
         name="get_activity_details",
@@ -68,9 +246,35 @@ TOOLS: list[Tool] = [
             "required": ["activity_id"],
         },
     ),
+    Tool(
+        name="get_activity_timeseries",
+        description=(
+            "Downsampled per-sample curves for one activity (heart rate, speed, power, cadence, "
+            "elevation) to inspect pacing or HR drift. Shape-preserving (LTTB) downsampling."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "activity_id": {"type": "string", "description": "Activity ID from get_activities"},
+                "channels": {
+                    "type": "string",
+                    "description": (
+                        "Comma-separated metric keys, e.g. directHeartRate,directSpeed. "
+                        "Defaults to HR, speed, power, cadence and elevation when recorded"
+                    ),
+                },
+                "points": {
+                    "type": "integer",
+                    "description": "Points per channel after downsampling (default 300, max 2000)",
+                },
+            },
+            "required": ["activity_id"],
+        },
+    ),
 ]
 
 DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
     "get_activities": get_activities,
     "get_activity_details": get_activity_details,
+    "get_activity_timeseries": get_activity_timeseries,
 }
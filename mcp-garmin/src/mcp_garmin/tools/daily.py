@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
-from mcp_garmin.tools._shared import _json_result
-from mcp_garmin.validation import validate_date
+from mcp_garmin.tools._shared import (
+    RESOLUTION_PROPERTIES,
+    ArraySpec,
+    _bucketed,
+    _json_result,
+    _with_properties,
+)
+from mcp_garmin.validation import parse_flag, validate_date
+
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
 
 
 def get_daily_stats(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
@@ -15,9 +23,14 @@ def get_daily_stats(client: Garmin, arguments: dict[str, str]) -> list[TextConte
     return _json_result(client.get_stats(arguments["date"]))
 
 
+_HEART_RATE_ARRAYS: ArraySpec = {"heartRateValues": 1}
+_BODY_BATTERY_ARRAYS: ArraySpec = {"bodyBatteryValuesArray": 1}
+
+
 def get_heart_rate(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
     validate_date(arguments["date"])
-    return _json_result(client.get_heart_rates(arguments["date"]))
+    data = client.get_heart_rates(arguments["date"])
+    return _json_result(_bucketed(data, _HEART_RATE_ARRAYS, arguments.get("resolution")))
 
 
 _SLEEP_TIMESERIES_KEYS = frozenset(
@@ -47,16 +60,46 @@ def _summarize_sleep(data: Any) -> Any:
     return {k: v for k, v in data.items() if k not in _SLEEP_TIMESERIES_KEYS}
 
 
+# sleepLevels activityLevel -> stage name.
+_SLEEP_STAGES = {0: "deep", 1: "light", 2: "rem", 3: "awake"}
+
+
+def _sleep_timeseries_stats(data: dict[str, Any]) -> dict[str, Any]:
+    """Reduce each dropped per-epoch array to summary statistics.
+
+    Per-stage means line each sample up with the ``sleepLevels`` interval it
+    falls in, so e.g. heart rate in deep sleep can be compared with REM.
+    """
+    from mcp_garmin.timeseries import epoch_samples, series_stats, stage_intervals
+
+    stages = stage_intervals(data.get("sleepLevels") or [])
+    summary: dict[str, Any] = {}
+    for key in sorted(_SLEEP_TIMESERIES_KEYS):
+        items = data.get(key)
+        if not isinstance(items, list) or not items:
+            continue
+        stats = series_stats(*epoch_samples(items), stages=stages, stage_names=_SLEEP_STAGES)
+        if stats is not None:
+            summary[key] = stats
+    return summary
+
+
 def get_sleep(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
     validate_date(arguments["date"])
-    return _json_result(_summarize_sleep(client.get_sleep_data(arguments["date"])))
+    with_stats = parse_flag(arguments.get("timeseries_stats", False), "timeseries_stats")
+    data = client.get_sleep_data(arguments["date"])
+    summary = _summarize_sleep(data)
+    if with_stats and isinstance(data, dict):
+        summary["timeseriesStats"] = _sleep_timeseries_stats(data)
+    return _json_result(summary)
 
 
 def get_body_battery(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
     validate_date(arguments["date"])
     date = arguments["date"]
     # get_body_battery takes a date range; pass the same date twice for a single day.
-    return _json_result(client.get_body_battery(date, date))
+    data = client.get_body_battery(date, date)
+    return _json_result(_bucketed(data, _BODY_BATTERY_ARRAYS, arguments.get("resolution")))
 
 
 def _date_tool(name: str, description: str) -> Tool:
@@ -77,15 +120,42 @@ TOOLS: list[Tool] = [
     _date_tool(
         "get_daily_stats", "Daily activity stats: steps, calories burned, stress, active minutes."
     ),
-    _date_tool(
-        "get_heart_rate", "Heart rate data for the day including resting HR and HR time series."
+    _with_properties(
+        _date_tool(
+            "get_heart_rate",
+            "Heart rate data for the day including resting HR and HR time series.",
+        ),
+        RESOLUTION_PROPERTIES,
     ),
-    _date_tool(
-        "get_sleep", "Sleep data: duration, stages (deep/light/REM/awake), and sleep score."
+    _with_properties(
+        _date_tool(
+            "get_sleep", "Sleep data: duration, stages (deep/light/REM/awake), and sleep score."
+        ),
+        {
+            "timeseries_stats": {
+                "type": "boolean",
+                "description": (
+                    "Add min/max/mean/p10/p50/p90, trend per hour and per-stage means for the "
+                    "overnight heart rate, stress, body battery, HRV, SpO2, respiration and "
+                    "movement series instead of dropping them (default false)"
+                ),
+            },
+        },
+    ),
+    _with_properties(
+        _date_tool("get_body_battery", "Body battery charge and drain data for the day."),
+        RESOLUTION_PROPERTIES,
     ),
-    _date_tool("get_body_battery", "Body battery charge and drain data for the day."),
 ]
 
+# Raw per-date fetchers, shared with the multi-date get_metric_range tool.
+FETCHERS: dict[str, Callable[[Garmin, str], Any]] = {
+    "get_daily_stats": lambda client, date: client.get_stats(date),
+    "get_heart_rate": lambda client, date: client.get_heart_rates(date),
+    "get_sleep": lambda client, date: _summarize_sleep(client.get_sleep_data(date)),
+    "get_body_battery": lambda client, date: client.get_body_battery(date, date),
+}
+
 DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
     "get_daily_stats": get_daily_stats,
     "get_heart_rate": get_heart_rate,
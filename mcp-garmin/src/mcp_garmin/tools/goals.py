@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
 from mcp_garmin.tools._shared import _date_range_tool, _json_result
 from mcp_garmin.validation import validate_date
 
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
+
 
 def _range_handler(
     method_name: str,
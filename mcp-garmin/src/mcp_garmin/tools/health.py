@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
-from mcp_garmin.tools._shared import _date_range_tool, _json_result
+from mcp_garmin.tools._shared import (
+    RESOLUTION_PROPERTIES,
+    ArraySpec,
+    _bucketed,
+    _date_range_tool,
+    _json_result,
+    _with_properties,
+)
 from mcp_garmin.validation import validate_date
 
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
+
 
 def _date_tool(name: str, description: str) -> Tool:
     return Tool(
@@ -23,12 +33,25 @@ def _date_tool(name: str, description: str) -> Tool:
     )
 
 
+# Intraday arrays that the ``resolution`` argument aggregates, per tool.
+# stressValuesArray rows are [ts, stress]; its bodyBatteryValuesArray rows are
+# [ts, status, level, version].
+_INTRADAY_ARRAYS: dict[str, ArraySpec] = {
+    "get_stress": {"stressValuesArray": 1, "bodyBatteryValuesArray": 2},
+    "get_respiration": {"respirationValuesArray": 1},
+    "get_spo2": {"spO2HourlyAverages": 1, "spO2SingleValues": 1},
+}
+
+
 def _single_date_handler(
-    method_name: str,
+    method_name: str, arrays: ArraySpec | None = None
 ) -> Callable[[Garmin, dict[str, str]], list[TextContent]]:
     def handler(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
         validate_date(arguments["date"])
-        return _json_result(getattr(client, method_name)(arguments["date"]))
+        data = getattr(client, method_name)(arguments["date"])
+        if arrays:
+            data = _bucketed(data, arrays, arguments.get("resolution"))
+        return _json_result(data)
 
     return handler
 
@@ -39,27 +62,49 @@ def get_menstrual_cycle(client: Garmin, arguments: dict[str, str]) -> list[TextC
     return _json_result(client.get_menstrual_data(arguments["start_date"], arguments["end_date"]))
 
 
+def _intraday_tool(name: str, description: str) -> Tool:
+    return _with_properties(_date_tool(name, description), RESOLUTION_PROPERTIES)
+
+
 TOOLS: list[Tool] = [
     _date_tool("get_hrv", "Heart Rate Variability data for the day."),
-    _date_tool("get_stress", "Detailed stress data throughout the day."),
+    _intraday_tool("get_stress", "Detailed stress data throughout the day."),
     _date_tool("get_training_readiness", "Training readiness score and contributing factors."),
     _date_tool("get_max_metrics", "VO2 max and fitness age estimates."),
     _date_tool("get_training_status", "Current training status and load."),
-    _date_tool("get_respiration", "Respiration rate data throughout the day."),
-    _date_tool("get_spo2", "Blood oxygen saturation (SpO2) data throughout the day."),
+    _intraday_tool("get_respiration", "Respiration rate data throughout the day."),
+    _intraday_tool("get_spo2", "Blood oxygen saturation (SpO2) data throughout the day."),
     _date_range_tool(
         "get_menstrual_cycle",
         "Menstrual cycle tracking: phase, symptoms, and cycle stats.",
     ),
 ]
 
+# Tool name -> Garmin client method for the tools that take a single date.
+_SINGLE_DATE_METHODS = {
+    "get_hrv": "get_hrv_data",
+    "get_stress": "get_stress_data",
+    "get_training_readiness": "get_training_readiness",
+    "get_max_metrics": "get_max_metrics",
+    "get_training_status": "get_training_status",
+    "get_respiration": "get_respiration_data",
+    "get_spo2": "get_spo2_data",
+}
+
+
+def _fetcher(method_name: str) -> Callable[[Garmin, str], Any]:
+    return lambda client, date: getattr(client, method_name)(date)
+
+
+# Raw per-date fetchers, shared with the multi-date get_metric_range tool.
+FETCHERS: dict[str, Callable[[Garmin, str], Any]] = {
+    name: _fetcher(method) for name, method in _SINGLE_DATE_METHODS.items()
+}
+
 DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
-    "get_hrv": _single_date_handler("get_hrv_data"),
-    "get_stress": _single_date_handler("get_stress_data"),
-    "get_training_readiness": _single_date_handler("get_training_readiness"),
-    "get_max_metrics": _single_date_handler("get_max_metrics"),
-    "get_training_status": _single_date_handler("get_training_status"),
-    "get_respiration": _single_date_handler("get_respiration_data"),
-    "get_spo2": _single_date_handler("get_spo2_data"),
+    **{
+        name: _single_date_handler(method, _INTRADAY_ARRAYS.get(name))
+        for name, method in _SINGLE_DATE_METHODS.items()
+    },
     "get_menstrual_cycle": get_menstrual_cycle,
 }
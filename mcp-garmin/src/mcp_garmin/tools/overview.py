@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from mcp.types import TextContent, Tool
+
+from mcp_garmin.cache import mark_partial
+from mcp_garmin.fanout import fan_out
+from mcp_garmin.tools._shared import _headline, _json_result
+from mcp_garmin.tools.daily import FETCHERS as _DAILY_FETCHERS
+from mcp_garmin.tools.health import FETCHERS as _HEALTH_FETCHERS
+from mcp_garmin.validation import validate_date
+
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
+
+# Overview section -> per-date fetcher. The sleep fetcher already applies _summarize_sleep.
+_SECTIONS: dict[str, Callable[[Garmin, str], Any]] = {
+    "stats": _DAILY_FETCHERS["get_daily_stats"],
+    "sleep": _DAILY_FETCHERS["get_sleep"],
+    "hrv": _HEALTH_FETCHERS["get_hrv"],
+    "training_readiness": _HEALTH_FETCHERS["get_training_readiness"],
+    "body_battery": _DAILY_FETCHERS["get_body_battery"],
+    "stress": _HEALTH_FETCHERS["get_stress"],
+}
+
+
+def get_daily_overview(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
+    date = arguments["date"]
+    validate_date(date)
+    sections = list(_SECTIONS.items())
+    results = fan_out(lambda section: section[1](client, date), sections)
+
+    overview: dict[str, Any] = {"date": date}
+    errors: dict[str, str] = {}
+    for (name, _), result in zip(sections, results, strict=True):
+        if isinstance(result, Exception):
+            errors[name] = str(result)
+        else:
+            # Depth 4 reaches nested scores such as dailySleepDTO.sleepScores.overall.value.
+            overview[name] = _headline(result, depth=4)
+    if len(errors) == len(sections):
+        raise next(r for r in results if isinstance(r, Exception))
+    if errors:
+        overview["errors"] = errors
+        mark_partial()
+    return _json_result(overview)
+
+
+TOOLS: list[Tool] = [
+    Tool(
+        name="get_daily_overview",
+        description=(
+            "Headline numbers for one day in a single call: daily stats, sleep, HRV, "
+            "training readiness, body battery and stress."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {"type": "string", "description": "Date in YYYY-MM-DD format"},
+            },
+            "required": ["date"],
+        },
+    ),
+]
+
+DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
+    "get_daily_overview": get_daily_overview,
+}
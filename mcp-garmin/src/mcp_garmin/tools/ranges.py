@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from mcp.types import TextContent, Tool
+
+from mcp_garmin.cache import mark_partial
+from mcp_garmin.fanout import fan_out
+from mcp_garmin.tools._shared import _headline, _json_result, _Scalar
+from mcp_garmin.tools.daily import FETCHERS as _DAILY_FETCHERS
+from mcp_garmin.tools.health import FETCHERS as _HEALTH_FETCHERS
+from mcp_garmin.tools.wellness import FETCHERS as _WELLNESS_FETCHERS
+from mcp_garmin.validation import validate_date_range
+
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
+
+MAX_RANGE_DAYS = 31
+
+FETCHERS: dict[str, Callable[[Garmin, str], Any]] = {
+    **_DAILY_FETCHERS,
+    **_HEALTH_FETCHERS,
+    **_WELLNESS_FETCHERS,
+}
+
+
+def get_metric_range(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
+    metric = arguments.get("metric", "")
+    fetch = FETCHERS.get(metric)
+    if fetch is None:
+        raise ValueError(f"Unknown metric {metric!r}. Expected one of: {', '.join(FETCHERS)}.")
+    start_str = arguments["start_date"]
+    end_str = arguments["end_date"]
+    validate_date_range(start_str, end_str, max_days=MAX_RANGE_DAYS)
+    start = date.fromisoformat(start_str)
+    days = [
+        str(start + timedelta(days=i))
+        for i in range((date.fromisoformat(end_str) - start).days + 1)
+    ]
+    results = fan_out(lambda day: fetch(client, day), days)
+
+    rows: dict[str, dict[str, _Scalar]] = {}
+    errors: dict[str, str] = {}
+    for day, result in zip(days, results, strict=True):
+        if isinstance(result, Exception):
+            errors[day] = str(result)
+        else:
+            rows[day] = _headline(result)
+    if not rows:
+        raise next(r for r in results if isinstance(r, Exception))
+
+    columns = list(dict.fromkeys(key for row in rows.values() for key in row))
+    table: dict[str, Any] = {
+        "metric": metric,
+        "columns": ["date", *columns],
+        "rows": [[day, *(row.get(c) for c in columns)] for day, row in rows.items()],
+    }
+    if errors:
+        table["errors"] = errors
+        mark_partial()
+    return _json_result(table)
+
+
+TOOLS: list[Tool] = [
+    Tool(
+        name="get_metric_range",
+        description=(
+            "One daily metric across a date range (up to 31 days) as a compact per-day table "
+            "of headline values. Use instead of calling a single-date tool once per day."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "metric": {
+                    "type": "string",
+                    "enum": list(FETCHERS),
+                    "description": "Name of the single-date tool to run for each day",
+                },
+                "start_date": {"type": "string", "description": "Start date in YYYY-MM-DD format"},
+                "end_date": {"type": "string", "description": "End date in YYYY-MM-DD format"},
+            },
+            "required": ["metric", "start_date", "end_date"],
+        },
+    ),
+]
+
+DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
+    "get_metric_range": get_metric_range,
+}
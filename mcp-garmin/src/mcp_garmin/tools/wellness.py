@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from garminconnect import Garmin  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
 from mcp_garmin.tools._shared import _json_result
 from mcp_garmin.validation import validate_date
 
+if TYPE_CHECKING:
+    from garminconnect import Garmin  # type: ignore[import-untyped]
+
 
 def get_hydration(client: Garmin, arguments: dict[str, str]) -> list[TextContent]:
     validate_date(arguments["date"])
@@ -28,6 +31,11 @@ TOOLS: list[Tool] = [
     ),
 ]
 
+# Raw per-date fetchers, shared with the multi-date get_metric_range tool.
+FETCHERS: dict[str, Callable[[Garmin, str], Any]] = {
+    "get_hydration": lambda client, date: client.get_hydration_data(date),
+}
+
 DISPATCH: dict[str, Callable[[Garmin, dict[str, str]], list[TextContent]]] = {
     "get_hydration": get_hydration,
 }
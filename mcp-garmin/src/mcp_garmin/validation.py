@@ -2,6 +2,7 @@ import re
 from datetime import date as _date
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_RESOLUTION_RE = re.compile(r"^(\d{1,4})(m|h)$")
 
 
 def validate_date(value: str, param_name: str = "date") -> None:
@@ -14,3 +15,38 @@ def validate_date(value: str, param_name: str = "date") -> None:
         raise ValueError(
             f"Invalid {param_name}: {value!r}. Expected a real calendar date."
         ) from err
+
+
+def parse_flag(value: object, param_name: str) -> bool:
+    """Interpret an optional boolean tool argument sent as a JSON bool or a string."""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in {"true", "1", "yes"}:
+        return True
+    if text in {"false", "0", "no", ""}:
+        return False
+    raise ValueError(f"Invalid {param_name}: {value!r}. Expected true or false.")
+
+
+def validate_date_range(start: str, end: str, max_days: int) -> None:
+    """Raise ValueError if start/end are not valid dates or span more than ``max_days``."""
+    validate_date(start, param_name="start_date")
+    validate_date(end, param_name="end_date")
+    start_dt = _date.fromisoformat(start)
+    end_dt = _date.fromisoformat(end)
+    if start_dt > end_dt:
+        raise ValueError(f"start_date {start!r} must be on or before end_date {end!r}.")
+    if (end_dt - start_dt).days >= max_days:
+        raise ValueError(f"Date range exceeds {max_days} days ({start} to {end}).")
+
+
+def parse_resolution(value: str, param_name: str = "resolution") -> int:
+    """Parse a bucket width such as ``5m``, ``15m`` or ``1h`` into seconds (1m to 24h)."""
+    match = _RESOLUTION_RE.match(value.strip().lower())
+    if match is None:
+        raise ValueError(f"Invalid {param_name}: {value!r}. Expected e.g. 5m, 15m or 1h.")
+    seconds = int(match.group(1)) * (3600 if match.group(2) == "h" else 60)
+    if not 60 <= seconds <= 24 * 3600:
+        raise ValueError(f"Invalid {param_name}: {value!r}. Must be between 1m and 24h.")
+    return seconds
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from mcp_garmin.config import env_bool, env_int
+
+logger = logging.getLogger(__name__)
+
+WAREHOUSE_ENABLED_ENV = "GARMIN_WAREHOUSE_ENABLED"
+WAREHOUSE_PATH_ENV = "GARMIN_WAREHOUSE_PATH"
+DEFAULT_WAREHOUSE_PATH = Path.home() / ".cache" / "mcp-garmin" / "warehouse.sqlite3"
+
+DEFAULT_SETTLE_DAYS = 1
+DEFAULT_RECENT_TTL = 5 * 60
+
+ACTIVITIES = "activities"
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A daily Garmin metric kept in the warehouse.
+
+    ``method`` is the ``Garmin`` client method that fetches one day. Ranged
+    methods take ``(start, end)`` and are stored per day from ``(day, day)`` calls.
+    """
+
+    name: str
+    method: str
+    ranged: bool = False
+
+
+METRICS: dict[str, Metric] = {
+    m.name: m
+    for m in (
+        Metric("stats", "get_stats"),
+        Metric("sleep", "get_sleep_data"),
+        Metric("hrv", "get_hrv_data"),
+        Metric("training_readiness", "get_training_readiness"),
+        Metric("training_status", "get_training_status"),
+        Metric("body_composition", "get_body_composition", ranged=True),
+        # Stored per day as that day's list of activities, from range fetches.
+        Metric(ACTIVITIES, "get_activities_by_date", ranged=True),
+    )
+}
+
+
+@dataclass
+class WarehouseStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+
+def day_range(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+class Warehouse:
+    """Per-day Garmin payloads in SQLite, keyed by (metric, day).
+
+    A row is *final* once it was fetched more than ``settle_days`` after the
+    day ended, since Garmin stops back-filling by then; final rows are served
+    forever. Rows for recent days are served for ``recent_ttl`` seconds and then
+    refetched. Each metric keeps watermarks, the spans of days known to be
+    final, so a sync can skip them without looking at individual rows.
+
+    A day Garmin has no data for is stored as a null payload, so it is not
+    fetched again on every read; ``get_many`` reports it as a hit with a
+    ``None`` value.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        settle_days: int = DEFAULT_SETTLE_DAYS,
+        recent_ttl: int = DEFAULT_RECENT_TTL,
+        clock: Callable[[], float] = time.time,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.settle_days = settle_days
+        self.recent_ttl = recent_ttl
+        self.stats = WarehouseStats()
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._db = _connect(path)
+
+    def last_final_day(self) -> date:
+        """The latest day whose rows become final if fetched now."""
+        return self._today() - timedelta(days=self.settle_days + 1)
+
+    def _is_final(self, day: date, fetched_at: float) -> bool:
+        fetched_on = date.fromtimestamp(fetched_at)
+        return (fetched_on - day).days > self.settle_days
+
+    def _usable(self, day: date, fetched_at: float) -> bool:
+        return self._is_final(day, fetched_at) or self._clock() - fetched_at < self.recent_ttl
+
+    def _lookup(self, metric: str, days: list[date]) -> dict[date, Any]:
+        if not days:
+            return {}
+        keys = [d.isoformat() for d in days]
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT day, payload, fetched_at FROM daily "  # noqa: S608 - placeholders only
+                f"WHERE metric = ? AND day IN ({placeholders})",
+                (metric, *keys),
+            ).fetchall()
+        return {
+            date.fromisoformat(day): json.loads(payload)
+            for day, payload, fetched_at in rows
+            if self._usable(date.fromisoformat(day), fetched_at)
+        }
+
+    def get_many(self, metric: str, days: Iterable[date]) -> dict[date, Any]:
+        """Return the usable stored payloads for ``days``; days without one are left out."""
+        wanted = list(days)
+        found = self._lookup(metric, wanted)
+        with self._lock:
+            self.stats.hits += len(found)
+            self.stats.misses += len(wanted) - len(found)
+        return found
+
+    def get(self, metric: str, day: date) -> Any | None:
+        """The stored payload for ``day``, or None if it is missing or holds no data."""
+        return self.get_many(metric, [day]).get(day)
+
+    def put(self, metric: str, day: date, payload: Any) -> int:
+        """Store one day's payload. Returns its size in bytes, or 0 if it can't be stored."""
+        try:
+            text = json.dumps(payload, separators=(",", ":"))
+        except (TypeError, ValueError):
+            logger.warning("Not storing unserialisable %s payload for %s", metric, day)
+            return 0
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO daily (metric, day, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (metric, day.isoformat(), text, self._clock()),
+            )
+            self.stats.writes += 1
+        return len(text)
+
+    def watermarks(self, metric: str) -> list[tuple[date, date]]:
+        """The spans of days known to be final for ``metric``, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT synced_from, synced_through FROM watermarks WHERE metric = ? "
+                "ORDER BY synced_from",
+                (metric,),
+            ).fetchall()
+        return [(date.fromisoformat(lo), date.fromisoformat(hi)) for lo, hi in rows]
+
+    def extend_watermark(self, metric: str, start: date, end: date) -> None:
+        """Record that every day in ``start..end`` is final for ``metric``.
+
+        The span is merged with the stored spans it overlaps or touches; the
+        others are kept as they are, so a recent sync never forgets an older one.
+        """
+        end = min(end, self.last_final_day())
+        if end < start:
+            return
+        absorbed: list[date] = []
+        for lo, hi in self.watermarks(metric):
+            if start <= hi + timedelta(days=1) and end >= lo - timedelta(days=1):
+                start, end = min(start, lo), max(end, hi)
+                absorbed.append(lo)
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM watermarks WHERE metric = ? AND synced_from = ?",
+                [(metric, lo.isoformat()) for lo in absorbed],
+            )
+            self._db.execute(
+                "INSERT INTO watermarks (metric, synced_from, synced_through) VALUES (?, ?, ?)",
+                (metric, start.isoformat(), end.isoformat()),
+            )
+
+    def missing_days(self, metric: str, start: date, end: date) -> list[date]:
+        """Days in ``start..end`` with no usable row, i.e. the ones a sync must fetch."""
+        spans = self.watermarks(metric)
+        days = [d for d in day_range(start, end) if not any(lo <= d <= hi for lo, hi in spans)]
+        present = self._lookup(metric, days)
+        return [d for d in days if d not in present]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def split_activities(activities: list[Any], days: Iterable[date]) -> dict[date, list[Any]]:
+    """Group a range fetch of activities by the local day they started on."""
+    by_day: dict[date, list[Any]] = {d: [] for d in days}
+    for activity in activities:
+        started = activity.get("startTimeLocal") if isinstance(activity, dict) else None
+        try:
+            day = date.fromisoformat(str(started)[:10])
+        except ValueError:
+            continue
+        if day in by_day:
+            by_day[day].append(activity)
+    return by_day
+
+
+def _parse_day(value: Any) -> date | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class WarehouseClient:
+    """Wrap a ``Garmin`` client so daily metrics are read from the warehouse first.
+
+    Calls for a single day of a warehouse metric are answered from a usable
+    row when there is one. Otherwise the live client is called and its result
+    written back, so the next read of that day is local. A ``(start, end)``
+    activities call is served locally only if every day in the range is
+    stored. Everything else passes straight through to the live client.
+    ``read=False`` skips the lookups but still writes live results back.
+    """
+
+    def __init__(self, client: Any, warehouse: Warehouse, read: bool = True) -> None:
+        self._client = client
+        self._warehouse = warehouse
+        self._read = read
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        metric = _METRICS_BY_METHOD.get(name)
+        if metric is None:
+            return attr
+        if metric.name == ACTIVITIES:
+            return lambda *args, **kwargs: self._activities(attr, *args, **kwargs)
+        return lambda *args, **kwargs: self._daily(metric, attr, *args, **kwargs)
+
+    def _daily(self, metric: Metric, fetch: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        day = _parse_day(args[0]) if args and not kwargs else None
+        single = len(args) == 1 or (metric.ranged and len(args) == 2 and args[1] in (None, args[0]))
+        if day is None or not single:
+            return fetch(*args, **kwargs)
+        if self._read:
+            stored = self._warehouse.get_many(metric.name, [day])
+            if day in stored:
+                return stored[day]
+        result = fetch(*args)
+        self._warehouse.put(metric.name, day, result)
+        return result
+
+    def _activities(self, fetch: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if len(args) != 2 or kwargs:
+            # Filtered or paged calls go to Garmin unchanged.
+            return fetch(*args, **kwargs)
+        start, end = _parse_day(args[0]), _parse_day(args[1])
+        if start is None or end is None or end < start:
+            return fetch(*args)
+        days = day_range(start, end)
+        if self._read:
+            stored = self._warehouse.get_many(ACTIVITIES, days)
+            if len(stored) == len(days):
+                merged = [a for d in days for a in stored[d]]
+                return sorted(merged, key=lambda a: str(a.get("startTimeLocal")), reverse=True)
+        result = fetch(*args)
+        if isinstance(result, list):
+            for day, activities in split_activities(result, days).items():
+                self._warehouse.put(ACTIVITIES, day, activities)
+        return result
+
+
+_METRICS_BY_METHOD = {m.method: m for m in METRICS.values()}
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    if str(path) != ":memory:":
+        path = Path(path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The warehouse holds personal health data; create the file owner-only.
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+    db = sqlite3.connect(str(path), check_same_thread=False)
+    db.executescript(
+        "CREATE TABLE IF NOT EXISTS daily ("
+        "metric TEXT NOT NULL, day TEXT NOT NULL, payload TEXT NOT NULL, "
+        "fetched_at REAL NOT NULL, PRIMARY KEY (metric, day));"
+        "CREATE TABLE IF NOT EXISTS watermarks ("
+        "metric TEXT NOT NULL, synced_from TEXT NOT NULL, synced_through TEXT NOT NULL, "
+        "PRIMARY KEY (metric, synced_from));"
+    )
+    return db
+
+
+_warehouse: Warehouse | None = None
+_warehouse_lock = threading.Lock()
+
+
+def get_warehouse() -> Warehouse | None:
+    """Return the shared warehouse, or None when ``GARMIN_WAREHOUSE_ENABLED`` is off."""
+    global _warehouse
+    with _warehouse_lock:
+        if _warehouse is None and env_bool(WAREHOUSE_ENABLED_ENV, True):
+            path = os.environ.get(WAREHOUSE_PATH_ENV) or DEFAULT_WAREHOUSE_PATH
+            _warehouse = Warehouse(
+                path,
+                recent_ttl=env_int("GARMIN_WAREHOUSE_TTL_RECENT", DEFAULT_RECENT_TTL, minimum=0),
+            )
+            logger.info("Metric warehouse opened at %s", path)
+        return _warehouse
+
+
+def _reset_warehouse() -> None:
+    """Close and drop the shared warehouse. Used in tests only."""
+    global _warehouse
+    with _warehouse_lock:
+        if _warehouse is not None:
+            _warehouse.close()
+        _warehouse = None
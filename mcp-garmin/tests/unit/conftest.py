@@ -0,0 +1,24 @@
+import pytest
+
+from mcp_garmin import cache, ratelimit, warehouse
+
+
+@pytest.fixture(autouse=True)
+def unthrottled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the Garmin rate cap so fan-out tests don't sleep."""
+    monkeypatch.setenv("GARMIN_RATE_LIMIT", "0")
+    ratelimit._reset_limiters()
+
+
+@pytest.fixture(autouse=True)
+def in_memory_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the response cache off disk and empty for every test."""
+    monkeypatch.setenv("GARMIN_CACHE_PATH", ":memory:")
+    cache._reset_cache()
+
+
+@pytest.fixture(autouse=True)
+def in_memory_warehouse(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the metric warehouse off disk and empty for every test."""
+    monkeypatch.setenv("GARMIN_WAREHOUSE_PATH", ":memory:")
+    warehouse._reset_warehouse()
@@ -0,0 +1,157 @@
+import stat
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mcp.types import TextContent
+
+import mcp_garmin.server as server_module
+from mcp_garmin.cache import CacheTTLs, ResponseCache, cache_key, mark_partial
+
+TODAY = date(2026, 3, 10)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(path: str | Path = ":memory:", **kwargs: object) -> tuple[ResponseCache, FakeClock]:
+    clock = FakeClock()
+    cache = ResponseCache(path, clock=clock, today=lambda: TODAY, **kwargs)  # type: ignore[arg-type]
+    return cache, clock
+
+
+def fetcher(text: str = "payload") -> MagicMock:
+    return MagicMock(return_value=[TextContent(type="text", text=text)])
+
+
+def test_cache_key_ignores_argument_order_whitespace_and_bypass() -> None:
+    a = cache_key("get_activities", {"start_date": "2026-01-01", "end_date": "2026-01-31"})
+    b = cache_key(
+        "get_activities",
+        {"end_date": " 2026-01-31", "start_date": "2026-01-01", "bypass_cache": True},
+    )
+    assert a == b
+    assert a != cache_key("get_weigh_ins", {"start_date": "2026-01-01", "end_date": "2026-01-31"})
+
+
+@pytest.mark.parametrize(
+    ("arguments", "expected"),
+    [
+        ({"date": "2026-01-15"}, CacheTTLs.past),
+        ({"date": "2026-03-10"}, CacheTTLs.recent),
+        ({"date": "2026-03-09"}, CacheTTLs.recent),
+        ({"start_date": "2026-01-01", "end_date": "2026-03-10"}, CacheTTLs.recent),
+        ({"start_date": "2026-01-01", "end_date": "2026-02-01"}, CacheTTLs.past),
+        ({}, CacheTTLs.undated),
+        ({"activity_id": "123"}, CacheTTLs.undated),
+    ],
+)
+def test_ttl_depends_on_dates(arguments: dict[str, str], expected: int) -> None:
+    cache, _ = make_cache()
+    assert cache.ttl_for(arguments) == expected
+
+
+def test_second_call_is_served_from_memory() -> None:
+    cache, _ = make_cache()
+    fetch = fetcher()
+    first = cache.call("get_sleep", {"date": "2026-01-15"}, fetch)
+    second = cache.call("get_sleep", {"date": "2026-01-15"}, fetch)
+    assert fetch.call_count == 1
+    assert first[0].text == second[0].text == "payload"
+    assert cache.stats.as_dict() == {"memory_hits": 1, "disk_hits": 0, "misses": 1, "bypasses": 0}
+
+
+def test_recent_entries_expire_within_minutes() -> None:
+    cache, clock = make_cache()
+    fetch = fetcher()
+    cache.call("get_stats", {"date": "2026-03-10"}, fetch)
+    clock.now += CacheTTLs.recent + 1
+    cache.call("get_stats", {"date": "2026-03-10"}, fetch)
+    assert fetch.call_count == 2
+
+
+def test_bypass_refetches_and_refreshes_entry() -> None:
+    cache, _ = make_cache()
+    cache.call("get_sleep", {"date": "2026-01-15"}, fetcher("old"))
+    fresh = cache.call("get_sleep", {"date": "2026-01-15", "bypass_cache": "true"}, fetcher("new"))
+    cached = cache.call("get_sleep", {"date": "2026-01-15"}, fetcher("unused"))
+    assert fresh[0].text == "new"
+    assert cached[0].text == "new"
+    assert cache.stats.bypasses == 1
+
+
+def test_errors_are_not_cached() -> None:
+    cache, _ = make_cache()
+    with pytest.raises(ValueError):
+        cache.call("get_sleep", {"date": "2026-01-15"}, MagicMock(side_effect=ValueError))
+    fetch = fetcher()
+    cache.call("get_sleep", {"date": "2026-01-15"}, fetch)
+    assert fetch.call_count == 1
+
+
+def test_partial_responses_are_not_cached() -> None:
+    cache, _ = make_cache()
+
+    def partial() -> list[TextContent]:
+        mark_partial()
+        return [TextContent(type="text", text="partial")]
+
+    cache.call("get_daily_overview", {"date": "2026-01-15"}, partial)
+    fetch = fetcher("complete")
+    assert cache.call("get_daily_overview", {"date": "2026-01-15"}, fetch)[0].text == "complete"
+    assert cache.call("get_daily_overview", {"date": "2026-01-15"}, fetch)[0].text == "complete"
+    assert fetch.call_count == 1
+
+
+def test_memory_tier_is_bounded_and_falls_back_to_disk(tmp_path: Path) -> None:
+    cache, _ = make_cache(tmp_path / "cache.sqlite3", memory_entries=2)
+    for day in range(1, 4):
+        cache.call("get_sleep", {"date": f"2026-01-0{day}"}, fetcher(str(day)))
+    result = cache.call("get_sleep", {"date": "2026-01-01"}, fetcher("unused"))
+    assert result[0].text == "1"
+    assert cache.stats.disk_hits == 1
+
+
+def test_entries_persist_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "cache.sqlite3"
+    first, _ = make_cache(path)
+    first.call("get_personal_records", {}, fetcher("records"))
+    first.close()
+
+    second, _ = make_cache(path)
+    fetch = fetcher("unused")
+    assert second.call("get_personal_records", {}, fetch)[0].text == "records"
+    fetch.assert_not_called()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+
+async def test_server_serves_repeat_calls_from_cache() -> None:
+    mock_client = MagicMock()
+    mock_client.get_stats.return_value = {"totalSteps": 5000}
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+        result = await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+
+    assert "totalSteps" in result[0].text
+    mock_client.get_stats.assert_called_once()
+
+
+async def test_server_skips_cache_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_CACHE_ENABLED", "false")
+    monkeypatch.setenv("GARMIN_WAREHOUSE_ENABLED", "false")
+    mock_client = MagicMock()
+    mock_client.get_stats.return_value = {"totalSteps": 5000}
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+
+    assert mock_client.get_stats.call_count == 2
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,7 +18,7 @@ def test_get_client_loads_tokens_from_token_store(tmp_path: Path) -> None:
 
     with (
         patch.object(client_module, "TOKEN_STORE", tmp_path),
-        patch("mcp_garmin.client.Garmin", return_value=mock_garmin),
+        patch("garminconnect.Garmin", return_value=mock_garmin),
     ):
         tmp_path.mkdir(parents=True, exist_ok=True)
         result = client_module.get_client()
@@ -32,7 +33,7 @@ def test_get_client_returns_same_instance_on_second_call(tmp_path: Path) -> None
 
     with (
         patch.object(client_module, "TOKEN_STORE", tmp_path),
-        patch("mcp_garmin.client.Garmin", return_value=mock_garmin),
+        patch("garminconnect.Garmin", return_value=mock_garmin),
     ):
         tmp_path.mkdir(parents=True, exist_ok=True)
         first = client_module.get_client()
@@ -48,3 +49,46 @@ def test_get_client_raises_when_token_store_missing(tmp_path: Path) -> None:
     with patch.object(client_module, "TOKEN_STORE", missing):
         with pytest.raises(RuntimeError, match="scripts/login.py"):
             client_module.get_client()
+
+
+def test_get_client_waits_for_login_already_in_progress(tmp_path: Path) -> None:
+    _reset_singleton()
+    login_started = threading.Event()
+    release = threading.Event()
+    garmin_cls = MagicMock()
+
+    def slow_login(_: str) -> None:
+        login_started.set()
+        release.wait(5)
+
+    garmin_cls.return_value.login.side_effect = slow_login
+
+    with (
+        patch.object(client_module, "TOKEN_STORE", tmp_path),
+        patch("garminconnect.Garmin", garmin_cls),
+    ):
+        warm = client_module.warm_up()
+        assert login_started.wait(5)
+        results: list[object] = []
+        caller = threading.Thread(target=lambda: results.append(client_module.get_client()))
+        caller.start()
+        release.set()
+        caller.join(5)
+        warm.join(5)
+
+    garmin_cls.assert_called_once()
+    assert results == [garmin_cls.return_value]
+
+
+def test_warm_up_failure_is_retried_by_the_first_call(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    _reset_singleton()
+    missing = tmp_path / "does_not_exist"
+
+    with patch.object(client_module, "TOKEN_STORE", missing):
+        client_module.warm_up().join(5)
+        with pytest.raises(RuntimeError, match="scripts/login.py"):
+            client_module.get_client()
+
+    assert "login at startup failed" in caplog.text
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+
+import pytest
+
+from mcp_garmin import executor as executor_module
+
+
+@pytest.fixture(autouse=True)
+def reset_executor() -> None:
+    executor_module.shutdown_executor()
+
+
+async def test_run_blocking_runs_off_the_event_loop_thread() -> None:
+    loop_thread = threading.get_ident()
+    worker_thread = await executor_module.run_blocking(threading.get_ident)
+    assert worker_thread != loop_thread
+
+
+async def test_run_blocking_returns_result_and_propagates_errors() -> None:
+    assert await executor_module.run_blocking(sum, [1, 2, 3]) == 6
+    with pytest.raises(ZeroDivisionError):
+        await executor_module.run_blocking(lambda: 1 / 0)
+
+
+async def test_run_blocking_overlaps_calls() -> None:
+    barrier = threading.Barrier(3, timeout=2)
+    await asyncio.gather(*(executor_module.run_blocking(barrier.wait) for _ in range(3)))
+
+
+def test_pool_size_comes_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_MAX_WORKERS", "2")
+    assert executor_module.get_executor()._max_workers == 2
+
+
+def test_invalid_pool_size_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_MAX_WORKERS", "0")
+    with pytest.raises(ValueError, match="GARMIN_MAX_WORKERS"):
+        executor_module.get_executor()
@@ -0,0 +1,293 @@
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_garmin import ratelimit
+from mcp_garmin.ratelimit import (
+    FAILED,
+    THROTTLED,
+    AdaptiveConcurrency,
+    HostLimiter,
+    LimitedClient,
+    RateLimiter,
+    UpstreamError,
+    is_transient,
+    retry_after,
+    upstream_status,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status
+        self.headers = headers or {}
+
+
+class HTTPError(OSError):
+    """Shaped like ``requests.HTTPError``: an OSError carrying the response."""
+
+    def __init__(self, status: int, headers: dict[str, str] | None = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.response = FakeResponse(status, headers)
+
+
+class WrappedError(Exception):
+    """Shaped like garth's GarthHTTPError, which keeps the HTTPError in ``.error``."""
+
+    def __init__(self, error: Exception) -> None:
+        super().__init__("wrapped")
+        self.error = error
+
+
+def make_host_limiter(clock: FakeClock, retries: int = 3, maximum: int = 4) -> HostLimiter:
+    return HostLimiter(
+        RateLimiter(rate=0, clock=clock, sleep=clock.sleep),
+        AdaptiveConcurrency(maximum, clock=clock),
+        max_retries=retries,
+        sleep=clock.sleep,
+        jitter=lambda: 1.0,
+    )
+
+
+def test_burst_is_free_then_requests_are_spaced_by_rate() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=2, clock=clock, sleep=clock.sleep)
+    waits = [limiter.acquire() for _ in range(4)]
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+
+
+def test_tokens_refill_over_time() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1.0, burst=1, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    clock.now += 5
+    assert limiter.acquire() == 0.0
+
+
+def test_zero_rate_disables_limiting() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=0, burst=1, clock=clock, sleep=clock.sleep)
+    assert [limiter.acquire() for _ in range(10)] == [0.0] * 10
+    assert clock.sleeps == []
+
+
+def test_get_limiter_is_shared_per_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_RATE_LIMIT", "3")
+    ratelimit._reset_limiters()
+    limiter = ratelimit.get_limiter()
+    assert limiter is ratelimit.get_limiter()
+    assert limiter.rate == 3.0
+    assert ratelimit.get_limiter("other.example") is not limiter
+
+
+def test_pause_holds_callers_even_without_rate_cap() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=0, clock=clock, sleep=clock.sleep)
+    limiter.pause(3)
+    assert limiter.acquire() == 3
+    assert limiter.acquire() == 0.0
+
+
+# --- AdaptiveConcurrency ---
+
+
+def test_concurrency_grows_additively_and_halves_on_throttle() -> None:
+    clock = FakeClock()
+    aimd = AdaptiveConcurrency(8, clock=clock)
+    aimd.limit = 4.0
+    for _ in range(4):
+        aimd.acquire()
+        aimd.release()
+    grown = aimd.limit
+    assert 4.9 < grown < 5.0
+    aimd.acquire()
+    aimd.release(THROTTLED)
+    assert aimd.limit == grown / 2
+
+
+def test_throttles_within_cooldown_count_once() -> None:
+    clock = FakeClock()
+    aimd = AdaptiveConcurrency(8, clock=clock)
+    for _ in range(3):
+        aimd.acquire()
+    for _ in range(3):
+        aimd.release(THROTTLED)
+    assert aimd.limit == 4.0
+    clock.now += 1
+    aimd.acquire()
+    aimd.release(THROTTLED)
+    assert aimd.limit == 2.0
+
+
+def test_other_failures_leave_limit_unchanged() -> None:
+    aimd = AdaptiveConcurrency(4)
+    aimd.limit = 2.0
+    aimd.acquire()
+    aimd.release(FAILED)
+    assert aimd.limit == 2.0
+
+
+def test_acquire_blocks_at_the_limit() -> None:
+    aimd = AdaptiveConcurrency(1)
+    aimd.acquire()
+    entered = threading.Event()
+
+    def second() -> None:
+        aimd.acquire()
+        entered.set()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    assert not entered.wait(0.05)
+    aimd.release()
+    assert entered.wait(5)
+    thread.join(5)
+
+
+# --- error classification ---
+
+
+def test_status_found_through_cause_and_wrapped_error() -> None:
+    try:
+        try:
+            raise WrappedError(HTTPError(429))
+        except WrappedError as inner:
+            raise RuntimeError("Rate limit exceeded") from inner
+    except RuntimeError as exc:
+        assert upstream_status(exc) == 429
+        assert is_transient(exc)
+
+
+def test_status_found_behind_garminconnect_exceptions() -> None:
+    from garminconnect import GarminConnectTooManyRequestsError, GarthHTTPError
+
+    try:
+        try:
+            raise GarthHTTPError(msg="Error in request", error=HTTPError(429))  # type: ignore[arg-type]
+        except GarthHTTPError as inner:
+            raise GarminConnectTooManyRequestsError("Rate limit exceeded") from inner
+    except GarminConnectTooManyRequestsError as exc:
+        assert upstream_status(exc) == 429
+
+
+def test_retry_after_seconds_and_http_date() -> None:
+    assert retry_after(HTTPError(429, {"Retry-After": "7"})) == 7.0
+    date_header = {"Retry-After": "Wed, 21 Oct 2015 07:28:10 GMT"}
+    assert retry_after(HTTPError(503, date_header), now=lambda: 1445412480.0) == 10.0
+    assert retry_after(HTTPError(429)) is None
+
+
+@pytest.mark.parametrize(
+    ("exc", "transient"),
+    [
+        (HTTPError(503), True),
+        (HTTPError(502), True),
+        (HTTPError(404), False),
+        (HTTPError(401), False),
+        (ConnectionResetError(), True),
+        (ValueError("bad date"), False),
+    ],
+)
+def test_is_transient(exc: Exception, transient: bool) -> None:
+    assert is_transient(exc) is transient
+
+
+# --- HostLimiter ---
+
+
+def test_call_retries_transient_errors_with_backoff() -> None:
+    clock = FakeClock()
+    limiter = make_host_limiter(clock)
+    results: list[Any] = [HTTPError(502), HTTPError(500), "ok"]
+
+    def flaky() -> str:
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return str(result)
+
+    assert limiter.call(flaky) == "ok"
+    assert clock.sleeps == [0.5, 1.0]
+    assert limiter.stats.as_dict() == {"calls": 1, "retries": 2, "throttled": 0, "gave_up": 0}
+
+
+def test_call_honours_retry_after_and_pauses_the_host() -> None:
+    clock = FakeClock()
+    limiter = make_host_limiter(clock)
+    results: list[Any] = [HTTPError(429, {"Retry-After": "5"}), "ok"]
+
+    def throttled_once() -> str:
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return str(result)
+
+    assert limiter.call(throttled_once) == "ok"
+    # The retry sleeps out Retry-After; the bucket pause has elapsed by then.
+    assert clock.sleeps == [5.0]
+    # Halved from 4 by the 429, then grown by the successful retry.
+    assert limiter.concurrency.limit == 2.5
+    assert limiter.stats.throttled == 1
+
+
+def test_call_gives_up_with_upstream_error() -> None:
+    clock = FakeClock()
+    limiter = make_host_limiter(clock, retries=2)
+    func = MagicMock(side_effect=HTTPError(429))
+    with pytest.raises(UpstreamError, match="rate limiting requests \\(HTTP 429\\)"):
+        limiter.call(func)
+    assert func.call_count == 3
+    assert limiter.stats.gave_up == 1
+
+
+def test_call_does_not_sleep_through_long_retry_after() -> None:
+    clock = FakeClock()
+    limiter = make_host_limiter(clock)
+    func = MagicMock(side_effect=HTTPError(429, {"Retry-After": "3600"}))
+    with pytest.raises(UpstreamError, match="Try again in 3600 seconds"):
+        limiter.call(func)
+    func.assert_called_once()
+    assert clock.sleeps == []
+
+
+def test_call_raises_non_transient_errors_unchanged() -> None:
+    limiter = make_host_limiter(FakeClock())
+    with pytest.raises(HTTPError):
+        limiter.call(MagicMock(side_effect=HTTPError(404)))
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_limited_client_routes_method_calls_through_limiter() -> None:
+    clock = FakeClock()
+    limiter = make_host_limiter(clock)
+    client = MagicMock()
+    client.get_stats.side_effect = [HTTPError(503), "day"]
+    client.display_name = "runner"
+    proxy = LimitedClient(client, limiter)
+    assert proxy.get_stats("2026-03-01") == "day"
+    assert proxy.display_name == "runner"
+    assert limiter.stats.retries == 1
+
+
+def test_get_host_limiter_is_shared_and_uses_host_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_MAX_CONCURRENCY", "2")
+    ratelimit._reset_limiters()
+    limiter = ratelimit.get_host_limiter()
+    assert limiter is ratelimit.get_host_limiter()
+    assert limiter.bucket is ratelimit.get_limiter()
+    assert limiter.concurrency.maximum == 2
@@ -0,0 +1,186 @@
+import json
+import stat
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import mcp_garmin.client as client_module
+import mcp_garmin.server as server_module
+from mcp_garmin.ratelimit import is_transient, upstream_status
+from mcp_garmin.replay import (
+    SCRUBBED,
+    InjectedError,
+    MissingFixtureError,
+    RecordingClient,
+    ReplayClient,
+    fixture_path,
+    replay_client_from_env,
+    scrub,
+    write_fixture,
+)
+
+STATS = {"totalSteps": 5000, "displayName": "runner42", "userProfilePK": 123456}
+
+
+@pytest.fixture(autouse=True)
+def reset_client() -> None:
+    client_module._client = None
+
+
+def test_scrub_blanks_secrets_but_keeps_their_type() -> None:
+    data = {
+        "displayName": "runner42",
+        "userProfilePK": 123456,
+        "oauth_token_secret": "s3cr3t",
+        "isOwner": {"ownerId": 7, "ownerFullName": "Jane Doe"},
+        "restingHeartRate": 52,
+        "notes": ["mail me at jane@example.com"],
+        "userPro": True,
+    }
+
+    assert scrub(data) == {
+        "displayName": SCRUBBED,
+        "userProfilePK": 0,
+        "oauth_token_secret": SCRUBBED,
+        "isOwner": {"ownerId": 0, "ownerFullName": SCRUBBED},
+        "restingHeartRate": 52,
+        "notes": [f"mail me at {SCRUBBED}"],
+        "userPro": True,
+    }
+
+
+def test_fixture_path_is_readable_and_stable(tmp_path: Path) -> None:
+    path = fixture_path(tmp_path, "get_stats", ("2026-02-20",), {})
+
+    assert path.parent == tmp_path / "get_stats"
+    assert path.name.startswith("2026-02-20-")
+    assert path == fixture_path(tmp_path, "get_stats", ("2026-02-20",), {})
+    assert path != fixture_path(tmp_path, "get_stats", ("2026-02-21",), {})
+
+
+def test_recording_client_saves_scrubbed_responses(tmp_path: Path) -> None:
+    garmin = MagicMock()
+    garmin.get_stats.return_value = STATS
+    garmin.garth = "garth-client"
+
+    client = RecordingClient(garmin, tmp_path)
+
+    assert client.get_stats("2026-02-20") == STATS  # the caller still sees real data
+    assert client.garth == "garth-client"
+    record = json.loads(fixture_path(tmp_path, "get_stats", ("2026-02-20",), {}).read_text())
+    assert record["method"] == "get_stats"
+    assert record["args"] == ["2026-02-20"]
+    assert record["response"]["displayName"] == SCRUBBED
+    assert record["response"]["totalSteps"] == 5000
+
+
+def test_replay_client_serves_recorded_responses(tmp_path: Path) -> None:
+    write_fixture(tmp_path, "get_stats", ("2026-02-20",), {}, STATS)
+    client = ReplayClient(tmp_path)
+
+    first = client.get_stats("2026-02-20")
+    first["totalSteps"] = 0
+    second = client.get_stats("2026-02-20")
+
+    assert second["totalSteps"] == 5000
+    assert second["userProfilePK"] == 0
+    assert client.calls == 2
+
+
+def test_fixtures_are_owner_only(tmp_path: Path) -> None:
+    fixtures = tmp_path / "fixtures"
+    path = write_fixture(fixtures, "get_stats", ("2026-03-01",), {}, STATS)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+
+def test_replay_client_reports_unrecorded_calls(tmp_path: Path) -> None:
+    with pytest.raises(MissingFixtureError, match="GARMIN_RECORD_DIR"):
+        ReplayClient(tmp_path).get_stats("2026-02-20")
+
+
+def test_replay_client_injects_latency(tmp_path: Path) -> None:
+    write_fixture(tmp_path, "get_stats", ("2026-02-20",), {}, STATS)
+    sleeps: list[float] = []
+    client = ReplayClient(tmp_path, latency=0.2, jitter=0.1, seed=1, sleep=sleeps.append)
+
+    for _ in range(20):
+        client.get_stats("2026-02-20")
+
+    assert len(sleeps) == 20
+    assert all(0.2 <= s <= 0.3 for s in sleeps)
+    assert len(set(sleeps)) > 1
+
+
+def test_injected_errors_look_like_transient_http_failures(tmp_path: Path) -> None:
+    client = ReplayClient(tmp_path, error_rate=1.0, error_status=429)
+
+    with pytest.raises(InjectedError) as raised:
+        client.get_stats("2026-02-20")
+
+    assert upstream_status(raised.value) == 429
+    assert is_transient(raised.value)
+    assert client.injected_errors == 1
+
+
+def test_error_rate_is_seeded(tmp_path: Path) -> None:
+    write_fixture(tmp_path, "get_stats", ("2026-02-20",), {}, STATS)
+
+    def failures(seed: int) -> list[bool]:
+        client = ReplayClient(tmp_path, error_rate=0.5, seed=seed)
+        outcomes = []
+        for _ in range(20):
+            try:
+                client.get_stats("2026-02-20")
+                outcomes.append(False)
+            except InjectedError:
+                outcomes.append(True)
+        return outcomes
+
+    assert failures(3) == failures(3)
+    assert 0 < sum(failures(3)) < 20
+
+
+def test_replay_client_from_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    assert replay_client_from_env() is None
+
+    monkeypatch.setenv("GARMIN_REPLAY_DIR", str(tmp_path))
+    monkeypatch.setenv("GARMIN_REPLAY_ERROR_RATE", "1.5")
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        replay_client_from_env()
+
+    monkeypatch.setenv("GARMIN_REPLAY_ERROR_RATE", "0.1")
+    assert isinstance(replay_client_from_env(), ReplayClient)
+
+
+def test_get_client_replays_without_tokens(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(client_module, "TOKEN_STORE", tmp_path / "missing")
+    monkeypatch.setenv("GARMIN_REPLAY_DIR", str(tmp_path))
+
+    assert isinstance(client_module.get_client(), ReplayClient)
+    assert client_module._refresher is None
+
+
+def test_get_client_records_when_asked(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("GARMIN_RECORD_DIR", str(tmp_path))
+    garmin = MagicMock()
+    monkeypatch.setattr(client_module, "_create_client", lambda: garmin)
+    monkeypatch.setattr(client_module, "start_token_refresher", lambda *args: None)
+
+    client: Any = client_module.get_client()
+
+    assert isinstance(client, RecordingClient)
+    assert client._client is garmin
+
+
+async def test_tool_call_against_replayed_responses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("GARMIN_REPLAY_DIR", str(tmp_path))
+    write_fixture(tmp_path, "get_stats", ("2026-02-20",), {}, STATS)
+
+    result = await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+
+    assert json.loads(result[0].text)["totalSteps"] == 5000
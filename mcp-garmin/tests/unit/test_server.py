@@ -1,9 +1,15 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 from mcp.types import TextContent
 
 import mcp_garmin.server as server_module
+from mcp_garmin import metrics
 
 
 @pytest.fixture(autouse=True)
@@ -18,7 +24,8 @@ async def test_list_tools_returns_all_tools() -> None:
     result = await server_module.list_tools()
     from mcp_garmin import tools
 
-    assert len(result) == len(tools.ALL_TOOLS)
+    assert len(result) == len(tools.ALL_TOOLS) + 1
+    assert result[-1].name == "get_server_metrics"
 
 
 async def test_call_tool_dispatches_correctly() -> None:
@@ -50,3 +57,121 @@ async def test_call_tool_returns_error_on_validation_failure() -> None:
     with patch("mcp_garmin.server.get_client", return_value=mock_client):
         result = await server_module.call_tool("get_daily_stats", {"date": "bad-date"})
     assert "Invalid" in result[0].text
+
+
+async def test_call_tool_runs_concurrent_calls_in_parallel() -> None:
+    barrier = threading.Barrier(2, timeout=2)
+    mock_client = MagicMock()
+    mock_client.get_stats.side_effect = lambda date: {"barrier": barrier.wait()}
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        results = await asyncio.gather(
+            server_module.call_tool("get_daily_stats", {"date": "2026-02-20"}),
+            server_module.call_tool("get_daily_stats", {"date": "2026-02-21"}),
+        )
+
+    # Both handlers must reach the barrier together, so neither can time out.
+    assert all("Unexpected error" not in r[0].text for r in results)
+
+
+async def test_identical_concurrent_calls_share_one_upstream_request() -> None:
+    release = threading.Event()
+    mock_client = MagicMock()
+    mock_client.get_sleep_data.side_effect = lambda date: release.wait(2) and {"sleep": 1}
+    before = server_module.inflight.stats.deduplicated
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        calls = [
+            asyncio.create_task(server_module.call_tool("get_sleep", {"date": "2026-02-20"}))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+    mock_client.get_sleep_data.assert_called_once()
+    assert all('"sleep": 1' in r[0].text for r in results)
+    assert server_module.inflight.stats.deduplicated - before == 2
+
+
+async def test_bypass_call_does_not_join_a_cached_call_in_flight() -> None:
+    release = threading.Event()
+    mock_client = MagicMock()
+    mock_client.get_sleep_data.side_effect = lambda date: release.wait(2) and {"sleep": 1}
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        calls = [
+            asyncio.create_task(server_module.call_tool("get_sleep", arguments))
+            for arguments in ({"date": "2026-02-20"}, {"date": "2026-02-20", "bypass_cache": True})
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(*calls)
+
+    assert mock_client.get_sleep_data.call_count == 2
+
+
+async def test_run_starts_login_before_the_transport() -> None:
+    order: list[str] = []
+
+    def stdio_server() -> None:
+        order.append("stdio")
+        raise OSError("stdin closed")
+
+    with (
+        patch("mcp_garmin.server.warm_up", side_effect=lambda: order.append("warm_up")),
+        patch("mcp_garmin.server.stdio_server", side_effect=stdio_server),
+        pytest.raises(OSError),
+    ):
+        await server_module._run()
+    assert order == ["warm_up", "stdio"]
+
+
+def test_server_import_does_not_load_vendor_sdks() -> None:
+    code = (
+        "import sys, mcp_garmin.server; "
+        "print(','.join(m for m in ('garminconnect', 'numpy') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+async def test_call_tool_reports_persistent_throttling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_MAX_RETRIES", "0")
+    monkeypatch.setenv("GARMIN_CACHE_ENABLED", "false")
+    error = OSError("429 Too Many Requests")
+    error.response = MagicMock(status_code=429, headers={})  # type: ignore[attr-defined]
+    mock_client = MagicMock()
+    mock_client.get_stats.side_effect = error
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        result = await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+
+    assert result[0].text == (
+        "Garmin Connect is rate limiting requests (HTTP 429). Try again in a minute."
+    )
+
+
+async def test_server_metrics_track_phases_cache_hits_and_errors() -> None:
+    metrics._reset_metrics()
+    mock_client = MagicMock()
+    mock_client.get_stats.return_value = {"totalSteps": 5000}
+
+    with patch("mcp_garmin.server.get_client", return_value=mock_client):
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+        await server_module.call_tool("get_daily_stats", {"date": "bad-date"})
+        result = await server_module.call_tool("get_server_metrics", {"format": "compact"})
+
+    snapshot = json.loads(result[0].text)
+    stats = snapshot["tools"]["get_daily_stats"]
+    assert stats["calls"] == 3
+    assert stats["cache_hits"] == 1
+    assert stats["errors"] == {"ValueError": 1}
+    # The failed call ran its handler too; only the cache hit has no phases.
+    assert stats["latency_ms"]["upstream"]["count"] == 2
+    assert stats["response_bytes"]["count"] == 2
+    assert snapshot["response_cache"]["hit_rate"] == stats["cache_hit_rate"] == 0.3333
+    assert "get_server_metrics" not in snapshot["tools"]
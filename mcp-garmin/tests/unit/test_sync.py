@@ -0,0 +1,201 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_garmin.sync import (
+    BackgroundSync,
+    _windows,
+    backfill,
+    main,
+    start_background_sync,
+    sync_range,
+)
+from mcp_garmin.warehouse import Warehouse
+
+TODAY = date(2026, 3, 10)
+NOON = datetime(2026, 3, 10, 12).timestamp()
+
+
+class Clock:
+    def __init__(self, now: float = NOON) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_warehouse(clock: Clock | None = None) -> Warehouse:
+    return Warehouse(":memory:", recent_ttl=300, clock=clock or Clock(), today=lambda: TODAY)
+
+
+def test_windows_split_runs_of_days() -> None:
+    days = [date(2026, 1, 1) + timedelta(days=i) for i in range(40)] + [date(2026, 3, 1)]
+    assert _windows(days, 31) == [
+        (date(2026, 1, 1), date(2026, 1, 31)),
+        (date(2026, 2, 1), date(2026, 2, 9)),
+        (date(2026, 3, 1), date(2026, 3, 1)),
+    ]
+
+
+def test_sync_fetches_only_missing_days() -> None:
+    wh = make_warehouse()
+    client = MagicMock()
+    client.get_stats.side_effect = lambda d: {"calendarDate": d}
+
+    first = sync_range(wh, client, date(2026, 3, 1), date(2026, 3, 5), metrics=["stats"])
+    second = sync_range(wh, client, date(2026, 3, 1), date(2026, 3, 7), metrics=["stats"])
+
+    assert (first.days, first.requests) == (5, 5)
+    assert (second.days, second.requests) == (2, 2)
+    assert first.bytes > 0
+    assert wh.watermarks("stats") == [(date(2026, 3, 1), date(2026, 3, 7))]
+
+
+def test_sync_refetches_recent_days_once_stale() -> None:
+    clock = Clock()
+    wh = make_warehouse(clock)
+    client = MagicMock()
+    client.get_hrv_data.return_value = {}
+
+    sync_range(wh, client, date(2026, 3, 6), date(2026, 3, 10), metrics=["hrv"])
+    clock.now += 600
+    report = sync_range(wh, client, date(2026, 3, 6), date(2026, 3, 10), metrics=["hrv"])
+
+    # Only 9 and 10 March are still settling; the rest are inside the watermark.
+    assert report.requests == 2
+
+
+def test_sync_ranged_metric_uses_single_day_ranges() -> None:
+    wh = make_warehouse()
+    client = MagicMock()
+    client.get_body_composition.return_value = {"totalAverage": {}}
+    sync_range(wh, client, date(2026, 3, 1), date(2026, 3, 1), metrics=["body_composition"])
+    client.get_body_composition.assert_called_once_with("2026-03-01", "2026-03-01")
+
+
+def test_sync_activities_in_windows_and_stores_every_day() -> None:
+    wh = make_warehouse()
+    client = MagicMock()
+    client.get_activities_by_date.return_value = [
+        {"activityId": 1, "startTimeLocal": "2026-01-05 07:00:00"}
+    ]
+    report = sync_range(wh, client, date(2026, 1, 1), date(2026, 2, 9), metrics=["activities"])
+    assert report.requests == 2
+    assert report.days == 40
+    assert wh.get("activities", date(2026, 1, 5)) == [
+        {"activityId": 1, "startTimeLocal": "2026-01-05 07:00:00"}
+    ]
+    assert wh.get("activities", date(2026, 1, 6)) == []
+
+
+def test_sync_errors_are_reported_and_hold_back_the_watermark() -> None:
+    wh = make_warehouse()
+    client = MagicMock()
+
+    def get_stats(day: str) -> dict[str, int]:
+        if day == "2026-03-02":
+            raise RuntimeError("boom")
+        return {}
+
+    client.get_stats.side_effect = get_stats
+    report = sync_range(wh, client, date(2026, 3, 1), date(2026, 3, 3), metrics=["stats"])
+    assert report.days == 2
+    assert report.errors == ["stats 2026-03-02: boom"]
+    assert wh.watermarks("stats") == []
+
+
+def test_sync_rejects_unknown_metric() -> None:
+    with pytest.raises(ValueError, match="Unknown metric"):
+        sync_range(make_warehouse(), MagicMock(), TODAY, TODAY, metrics=["steps"])
+
+
+def test_background_sync_run_once_covers_last_days() -> None:
+    wh = make_warehouse()
+    client = MagicMock()
+    client.get_stats.return_value = {}
+    client.get_activities_by_date.return_value = []
+    sync = BackgroundSync(wh, lambda: client, interval=60, days=3, today=lambda: TODAY)
+    sync.run_once()
+    assert sorted(c.args[0] for c in client.get_stats.call_args_list) == [
+        "2026-03-08",
+        "2026-03-09",
+        "2026-03-10",
+    ]
+
+
+def test_background_sync_is_off_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GARMIN_WAREHOUSE_SYNC_INTERVAL", raising=False)
+    assert start_background_sync(MagicMock) is None
+
+
+def test_background_sync_starts_and_stops(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_WAREHOUSE_SYNC_INTERVAL", "3600")
+    client = MagicMock()
+    client.get_activities_by_date.return_value = []
+    sync = start_background_sync(lambda: client)
+    assert sync is not None
+    sync.stop(timeout=5)
+    assert client.get_stats.called
+
+
+class Interrupted(BaseException):
+    """Stands in for the process being killed mid-run; fan_out doesn't swallow it."""
+
+
+def test_backfill_resumes_after_an_interrupted_chunk() -> None:
+    wh = make_warehouse()
+    client = MagicMock()
+    calls: list[str] = []
+    interrupted: list[str] = []
+
+    def get_stats(day: str) -> dict[str, int]:
+        calls.append(day)
+        if day == "2026-02-12" and not interrupted:
+            interrupted.append(day)
+            raise Interrupted
+        return {}
+
+    client.get_stats.side_effect = get_stats
+    with pytest.raises(Interrupted):
+        backfill(wh, client, date(2026, 2, 1), date(2026, 2, 20), ["stats"], 1, chunk_days=10)
+    assert wh.watermarks("stats") == [(date(2026, 2, 1), date(2026, 2, 10))]
+
+    calls.clear()
+    chunks: list[tuple[date, date]] = []
+    report = backfill(
+        wh,
+        client,
+        date(2026, 2, 1),
+        date(2026, 2, 20),
+        ["stats"],
+        1,
+        chunk_days=10,
+        on_chunk=lambda s, e, _: chunks.append((s, e)),
+    )
+    assert calls[0] == "2026-02-11"
+    assert report.days == 10
+    assert chunks == [(date(2026, 2, 1), date(2026, 2, 10)), (date(2026, 2, 11), date(2026, 2, 20))]
+
+
+def test_main_backfills_and_prints_throughput(capsys: pytest.CaptureFixture[str]) -> None:
+    client = MagicMock()
+    client.get_stats.return_value = {}
+    with patch("mcp_garmin.sync.get_client", return_value=client):
+        code = main(["--start", "2026-01-01", "--end", "2026-01-03", "--metrics", "stats"])
+    out = capsys.readouterr().out
+    assert code == 0
+    assert client.get_stats.call_count == 3
+    assert "total 2026-01-01..2026-01-03: 3 days, 3 requests" in out
+    assert "days/s" in out and "req/s" in out
+
+
+def test_main_reports_auth_failure(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch("mcp_garmin.sync.get_client", side_effect=RuntimeError("no tokens")):
+        assert main(["--days", "1"]) == 1
+    assert "no tokens" in capsys.readouterr().err
+
+
+def test_main_rejects_unknown_metric() -> None:
+    with pytest.raises(SystemExit):
+        main(["--metrics", "steps"])
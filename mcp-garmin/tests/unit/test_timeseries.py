@@ -0,0 +1,154 @@
+import numpy as np
+
+from mcp_garmin.timeseries import (
+    bucket_rows,
+    column_samples,
+    decode_detail_metrics,
+    epoch_samples,
+    lttb_indices,
+    series_stats,
+    stage_intervals,
+)
+
+
+def test_lttb_returns_everything_when_under_threshold() -> None:
+    x = np.arange(10, dtype=np.float64)
+    assert lttb_indices(x, x, 20).tolist() == list(range(10))
+
+
+def test_lttb_keeps_endpoints_and_requested_count() -> None:
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 300)
+    idx = lttb_indices(x, y, 200)
+    assert len(idx) == 200
+    assert idx[0] == 0
+    assert idx[-1] == 9_999
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_preserves_spikes() -> None:
+    x = np.arange(5_000, dtype=np.float64)
+    y = np.zeros(5_000)
+    y[1234] = 100.0
+    y[3210] = -50.0
+    idx = lttb_indices(x, y, 50)
+    assert 1234 in idx
+    assert 3210 in idx
+
+
+def test_decode_detail_metrics_orders_columns_by_metrics_index() -> None:
+    details = {
+        "metricDescriptors": [
+            {"metricsIndex": 1, "key": "directHeartRate"},
+            {"metricsIndex": 0, "key": "sumElapsedDuration"},
+        ],
+        "activityDetailMetrics": [{"metrics": [0.0, 120]}, {"metrics": [1.0, None]}],
+    }
+    descriptors, matrix = decode_detail_metrics(details)
+    assert [d["key"] for d in descriptors] == ["sumElapsedDuration", "directHeartRate"]
+    assert matrix.shape == (2, 2)
+    assert matrix[0, 1] == 120
+    assert np.isnan(matrix[1, 1])
+
+
+def test_decode_detail_metrics_handles_missing_data() -> None:
+    descriptors, matrix = decode_detail_metrics({})
+    assert descriptors == []
+    assert matrix.shape == (0, 0)
+
+
+def test_decode_detail_metrics_skips_descriptors_without_index() -> None:
+    details = {
+        "metricDescriptors": [
+            {"metricsIndex": 1, "key": "directHeartRate"},
+            {"key": "directSpeed"},
+            {"metricsIndex": 0, "key": "sumElapsedDuration"},
+        ],
+        "activityDetailMetrics": [{"metrics": [0.0, 120]}],
+    }
+    descriptors, matrix = decode_detail_metrics(details)
+    assert [d["key"] for d in descriptors] == ["sumElapsedDuration", "directHeartRate"]
+    np.testing.assert_array_equal(matrix, [[0.0, 120]])
+
+
+# --- epoch series ---
+
+
+def test_epoch_samples_accepts_pairs_and_objects() -> None:
+    times, values = epoch_samples(
+        [
+            [1000, 5],
+            {"startGMT": "1970-01-01T00:00:02.0", "value": 6},
+            {"startTimeGMT": 3000, "respirationValue": 14.5},
+            {"startGMT": 4000, "value": None},
+            "junk",
+        ]
+    )
+    np.testing.assert_array_equal(times[:4], [1000, 2000, 3000, 4000])
+    np.testing.assert_array_equal(values[:3], [5, 6, 14.5])
+    assert np.isnan(values[3]) and np.isnan(values[4])
+
+
+def test_series_stats_percentiles_and_slope() -> None:
+    hour = 3_600_000.0
+    times = np.array([0, hour, 2 * hour])
+    stats = series_stats(times, np.array([10.0, 20.0, 30.0]))
+    assert stats is not None
+    assert stats["p50"] == 20.0
+    assert stats["slopePerHour"] == 10.0
+    assert "stageMeans" not in stats
+
+
+def test_series_stats_none_when_no_valid_samples() -> None:
+    assert series_stats(np.array([0.0, 1.0]), np.array([np.nan, -1.0])) is None
+
+
+def test_series_stats_skips_samples_outside_stage_intervals() -> None:
+    stages = stage_intervals([{"startGMT": 100, "endGMT": 200, "activityLevel": 1}])
+    stats = series_stats(np.array([50.0, 150.0, 250.0]), np.array([1.0, 2.0, 3.0]), stages)
+    assert stats is not None
+    assert stats["stageMeans"] == {"1": 2.0}
+
+
+def test_stage_intervals_skips_unparseable_levels() -> None:
+    starts, ends, stages = stage_intervals(
+        [
+            {"startGMT": 300, "endGMT": 400, "activityLevel": 2},
+            {"startGMT": "not a time", "endGMT": 200, "activityLevel": 1},
+            {"startGMT": 100, "endGMT": 200, "activityLevel": 0},
+        ]
+    )
+    np.testing.assert_array_equal(starts, [100, 300])
+    np.testing.assert_array_equal(ends, [200, 400])
+    np.testing.assert_array_equal(stages, [0, 2])
+
+
+# --- bucketing ---
+
+
+def test_column_samples_reads_value_index() -> None:
+    times, values = column_samples([[1000, "MEASURED", 40, 2.0], [2000, "MEASURED", None], [3]], 2)
+    np.testing.assert_array_equal(times[:2], [1000, 2000])
+    assert values[0] == 40
+    assert np.isnan(values[1]) and np.isnan(times[2])
+
+
+def test_bucket_rows_aggregates_fixed_windows() -> None:
+    minute = 60_000
+    start = 1771804800000  # 2026-02-23T00:00:00Z
+    times = np.array([start + i * minute for i in range(10)], dtype=np.float64)
+    values = np.array([50, 52, 54, 56, 58, 60, -1, 64, np.nan, 68], dtype=np.float64)
+    rows = bucket_rows(times, values, 5 * minute)
+    assert rows == [
+        ["2026-02-23T00:00:00", 50.0, 54.0, 58.0, 5],
+        ["2026-02-23T00:05:00", 60.0, 64.0, 68.0, 3],
+    ]
+
+
+def test_bucket_rows_sorts_out_of_order_samples() -> None:
+    rows = bucket_rows(np.array([7200000.0, 0.0]), np.array([2.0, 1.0]), 3_600_000)
+    assert [r[0] for r in rows] == ["1970-01-01T00:00:00", "1970-01-01T02:00:00"]
+
+
+def test_bucket_rows_empty_when_all_missing() -> None:
+    assert bucket_rows(np.array([0.0]), np.array([-2.0]), 60_000) == []
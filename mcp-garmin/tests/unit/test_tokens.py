@@ -0,0 +1,139 @@
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_garmin import client as client_module
+from mcp_garmin.tokens import (
+    OAUTH2_FILE,
+    RETRY_INTERVAL,
+    TokenRefresher,
+    start_token_refresher,
+    write_private,
+)
+
+NOW = 1_800_000_000.0
+
+
+@dataclass
+class FakeToken:
+    access_token: str
+    expires_at: int
+
+
+def make_garth(expires_at: float) -> SimpleNamespace:
+    return SimpleNamespace(oauth1_token="oauth1", oauth2_token=FakeToken("old", int(expires_at)))
+
+
+def make_refresher(garth: SimpleNamespace, store: Path, exchange: Any = None) -> TokenRefresher:
+    new_token = FakeToken("new", int(NOW + 3600))
+    return TokenRefresher(
+        garth,
+        store,
+        margin=600,
+        exchange=exchange or (lambda _: new_token),
+        clock=lambda: NOW,
+    )
+
+
+# --- write_private ---
+
+
+def test_write_private_replaces_file_owner_only(tmp_path: Path) -> None:
+    path = tmp_path / "store" / "token.json"
+    write_private(path, "one")
+    write_private(path, "two")
+    assert path.read_text() == "two"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+    assert [p.name for p in path.parent.iterdir()] == ["token.json"]
+
+
+def test_write_private_leaves_old_file_when_write_fails(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    write_private(path, "good")
+    with patch("mcp_garmin.tokens.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            write_private(path, "bad")
+    assert path.read_text() == "good"
+    assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
+
+
+# --- TokenRefresher ---
+
+
+def test_step_waits_until_margin_before_expiry(tmp_path: Path) -> None:
+    refresher = make_refresher(make_garth(NOW + 1000), tmp_path)
+    assert refresher.step() == 400
+    assert refresher.refreshes == 0
+
+
+def test_step_refreshes_and_persists_when_due(tmp_path: Path) -> None:
+    garth = make_garth(NOW + 300)
+    refresher = make_refresher(garth, tmp_path)
+
+    assert refresher.step() == 3000
+    assert garth.oauth2_token.access_token == "new"
+    stored = tmp_path / OAUTH2_FILE
+    assert json.loads(stored.read_text())["access_token"] == "new"
+    assert stored.stat().st_mode & 0o777 == 0o600
+    assert refresher.refreshes == 1
+
+
+def test_step_retries_after_failed_refresh(tmp_path: Path) -> None:
+    garth = make_garth(NOW - 5)
+
+    def exchange(_: Any) -> FakeToken:
+        raise ConnectionError("offline")
+
+    refresher = make_refresher(garth, tmp_path, exchange)
+    assert refresher.step() == RETRY_INTERVAL
+    assert garth.oauth2_token.access_token == "old"
+    assert not (tmp_path / OAUTH2_FILE).exists()
+    assert refresher.failures == 1
+
+
+def test_thread_refreshes_expired_token_in_background(tmp_path: Path) -> None:
+    refreshed = threading.Event()
+
+    def exchange(_: Any) -> FakeToken:
+        refreshed.set()
+        return FakeToken("new", int(NOW + 3600))
+
+    refresher = make_refresher(make_garth(NOW - 5), tmp_path, exchange)
+    refresher.start()
+    assert refreshed.wait(5)
+    refresher.stop(timeout=5)
+    assert refresher.refreshes == 1
+
+
+def test_start_skips_clients_without_token_expiry(tmp_path: Path) -> None:
+    assert start_token_refresher(MagicMock(), tmp_path) is None
+
+
+def test_start_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_TOKEN_REFRESH", "false")
+    garmin = SimpleNamespace(garth=make_garth(NOW + 3600))
+    assert start_token_refresher(garmin, tmp_path) is None
+
+
+def test_get_client_starts_refresher_after_login(tmp_path: Path) -> None:
+    client_module._client = None
+    garmin = MagicMock()
+    garmin.garth = make_garth(NOW + 10**9)
+
+    with (
+        patch.object(client_module, "TOKEN_STORE", tmp_path),
+        patch("garminconnect.Garmin", return_value=garmin),
+    ):
+        client_module.get_client()
+
+    assert client_module._refresher is not None
+    client_module.stop_token_refresher(timeout=5)
+    assert client_module._refresher is None
+    client_module._client = None
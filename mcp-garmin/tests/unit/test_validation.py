@@ -1,6 +1,11 @@
 import pytest
 
-from mcp_garmin.validation import validate_date
+from mcp_garmin.validation import (
+    parse_flag,
+    parse_resolution,
+    validate_date,
+    validate_date_range,
+)
 
 
 def test_valid_date_passes() -> None:
@@ -35,3 +40,43 @@ def test_impossible_month_raises() -> None:
 def test_impossible_day_raises() -> None:
     with pytest.raises(ValueError, match="real calendar date"):
         validate_date("2026-02-30")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(True, True), (False, False), ("true", True), ("False", False), ("1", True), ("", False)],
+)
+def test_parse_flag_accepts_bools_and_strings(value: object, expected: bool) -> None:
+    assert parse_flag(value, "flag") is expected
+
+
+def test_parse_flag_rejects_other_values() -> None:
+    with pytest.raises(ValueError, match="flag"):
+        parse_flag("maybe", "flag")
+
+
+def test_validate_date_range_rejects_reversed_range() -> None:
+    with pytest.raises(ValueError, match="on or before"):
+        validate_date_range("2026-02-10", "2026-02-01", max_days=31)
+
+
+def test_validate_date_range_enforces_max_days() -> None:
+    validate_date_range("2026-01-01", "2026-01-31", max_days=31)
+    with pytest.raises(ValueError, match="exceeds 31 days"):
+        validate_date_range("2026-01-01", "2026-02-01", max_days=31)
+
+
+# --- parse_resolution ---
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"), [("5m", 300), ("15m", 900), ("1h", 3600), ("24h", 86400)]
+)
+def test_parse_resolution(value: str, seconds: int) -> None:
+    assert parse_resolution(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["", "5", "5s", "0m", "25h", "1d", "m5"])
+def test_parse_resolution_rejects_bad_values(value: str) -> None:
+    with pytest.raises(ValueError, match="resolution"):
+        parse_resolution(value)
@@ -0,0 +1,210 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import mcp_garmin.server as server_module
+from mcp_garmin.warehouse import Warehouse, WarehouseClient, get_warehouse, split_activities
+
+TODAY = date(2026, 3, 10)
+NOON = datetime(2026, 3, 10, 12).timestamp()
+
+
+class Clock:
+    def __init__(self, now: float = NOON) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_warehouse(clock: Clock | None = None) -> Warehouse:
+    return Warehouse(":memory:", recent_ttl=300, clock=clock or Clock(), today=lambda: TODAY)
+
+
+# --- Warehouse ---
+
+
+def test_settled_day_is_kept_for_good() -> None:
+    clock = Clock()
+    wh = make_warehouse(clock)
+    wh.put("stats", date(2026, 3, 1), {"totalSteps": 8000})
+    clock.now += 365 * 24 * 3600
+    assert wh.get("stats", date(2026, 3, 1)) == {"totalSteps": 8000}
+
+
+def test_recent_day_expires_after_ttl() -> None:
+    clock = Clock()
+    wh = make_warehouse(clock)
+    wh.put("stats", date(2026, 3, 9), {"totalSteps": 100})
+    assert wh.get("stats", date(2026, 3, 9)) == {"totalSteps": 100}
+    clock.now += 301
+    assert wh.get("stats", date(2026, 3, 9)) is None
+
+
+def test_stats_count_hits_misses_and_writes() -> None:
+    wh = make_warehouse()
+    wh.put("stats", date(2026, 3, 1), {})
+    wh.get_many("stats", [date(2026, 3, 1), date(2026, 3, 2)])
+    assert wh.stats.as_dict() == {"hits": 1, "misses": 1, "writes": 1}
+
+
+def test_unserialisable_payload_is_not_stored() -> None:
+    wh = make_warehouse()
+    assert wh.put("stats", date(2026, 3, 1), MagicMock()) == 0
+    assert wh.get("stats", date(2026, 3, 1)) is None
+
+
+def test_watermark_merges_adjacent_spans_and_clips_to_settled_days() -> None:
+    wh = make_warehouse()
+    wh.extend_watermark("hrv", date(2026, 3, 1), date(2026, 3, 10))
+    assert wh.watermarks("hrv") == [(date(2026, 3, 1), date(2026, 3, 8))]
+    wh.extend_watermark("hrv", date(2026, 2, 1), date(2026, 2, 28))
+    assert wh.watermarks("hrv") == [(date(2026, 2, 1), date(2026, 3, 8))]
+
+
+def test_watermark_keeps_disjoint_spans_and_joins_them_when_the_gap_fills() -> None:
+    wh = make_warehouse()
+    wh.extend_watermark("hrv", date(2026, 2, 1), date(2026, 3, 8))
+    wh.extend_watermark("hrv", date(2026, 1, 1), date(2026, 1, 5))
+    wh.extend_watermark("hrv", date(2025, 12, 1), date(2025, 12, 3))
+    assert wh.watermarks("hrv") == [
+        (date(2025, 12, 1), date(2025, 12, 3)),
+        (date(2026, 1, 1), date(2026, 1, 5)),
+        (date(2026, 2, 1), date(2026, 3, 8)),
+    ]
+    assert date(2026, 1, 3) not in wh.missing_days("hrv", date(2026, 1, 1), date(2026, 1, 10))
+
+    wh.extend_watermark("hrv", date(2025, 12, 4), date(2026, 1, 31))
+    assert wh.watermarks("hrv") == [(date(2025, 12, 1), date(2026, 3, 8))]
+
+
+def test_missing_days_skips_watermark_and_stored_days() -> None:
+    wh = make_warehouse()
+    wh.extend_watermark("stats", date(2026, 3, 1), date(2026, 3, 3))
+    wh.put("stats", date(2026, 3, 4), {})
+    assert wh.missing_days("stats", date(2026, 2, 28), date(2026, 3, 6)) == [
+        date(2026, 2, 28),
+        date(2026, 3, 5),
+        date(2026, 3, 6),
+    ]
+
+
+def test_split_activities_groups_by_local_start_day() -> None:
+    days = [date(2026, 3, 1), date(2026, 3, 2)]
+    grouped = split_activities(
+        [
+            {"activityId": 1, "startTimeLocal": "2026-03-02 07:00:00"},
+            {"activityId": 2, "startTimeLocal": "2026-03-05 07:00:00"},
+            {"activityId": 3},
+        ],
+        days,
+    )
+    assert grouped == {
+        date(2026, 3, 1): [],
+        date(2026, 3, 2): [{"activityId": 1, "startTimeLocal": "2026-03-02 07:00:00"}],
+    }
+
+
+# --- WarehouseClient ---
+
+
+def test_client_reads_stored_day_before_calling_garmin() -> None:
+    live = MagicMock()
+    live.get_stats.return_value = {"totalSteps": 8000}
+    client = WarehouseClient(live, make_warehouse())
+    assert client.get_stats("2026-03-01") == {"totalSteps": 8000}
+    assert client.get_stats("2026-03-01") == {"totalSteps": 8000}
+    live.get_stats.assert_called_once_with("2026-03-01")
+
+
+def test_client_does_not_refetch_days_without_data() -> None:
+    live = MagicMock()
+    live.get_hrv_data.return_value = None
+    client = WarehouseClient(live, make_warehouse())
+    assert client.get_hrv_data("2026-03-01") is None
+    assert client.get_hrv_data("2026-03-01") is None
+    live.get_hrv_data.assert_called_once_with("2026-03-01")
+
+
+def test_client_without_read_refetches_but_still_stores() -> None:
+    live = MagicMock()
+    live.get_hrv_data.side_effect = [{"v": 1}, {"v": 2}]
+    wh = make_warehouse()
+    WarehouseClient(live, wh).get_hrv_data("2026-03-01")
+    assert WarehouseClient(live, wh, read=False).get_hrv_data("2026-03-01") == {"v": 2}
+    assert wh.get("hrv", date(2026, 3, 1)) == {"v": 2}
+
+
+def test_client_passes_through_other_calls() -> None:
+    live = MagicMock()
+    live.get_personal_record.return_value = [{"id": 1}]
+    live.get_stats.return_value = {}
+    client = WarehouseClient(live, make_warehouse())
+    assert client.get_personal_record() == [{"id": 1}]
+    client.get_stats("not-a-date")
+    client.get_stats("not-a-date")
+    assert live.get_stats.call_count == 2
+
+
+def test_client_stores_ranged_metric_only_for_single_day() -> None:
+    live = MagicMock()
+    live.get_body_composition.return_value = {"totalAverage": {"weight": 70000}}
+    client = WarehouseClient(live, make_warehouse())
+    client.get_body_composition("2026-03-01", "2026-03-01")
+    client.get_body_composition("2026-03-01", "2026-03-01")
+    client.get_body_composition("2026-03-01", "2026-03-05")
+    client.get_body_composition("2026-03-01", "2026-03-05")
+    assert live.get_body_composition.call_count == 3
+
+
+def test_client_serves_activity_range_once_every_day_is_stored() -> None:
+    live = MagicMock()
+    live.get_activities_by_date.return_value = [
+        {"activityId": 1, "startTimeLocal": "2026-03-01 07:00:00"},
+        {"activityId": 2, "startTimeLocal": "2026-03-03 07:00:00"},
+    ]
+    client = WarehouseClient(live, make_warehouse())
+    client.get_activities_by_date("2026-03-01", "2026-03-03")
+    assert [a["activityId"] for a in client.get_activities_by_date("2026-03-02", "2026-03-03")] == [
+        2
+    ]
+    live.get_activities_by_date.assert_called_once()
+    # A range reaching past the stored days goes back to Garmin.
+    client.get_activities_by_date("2026-03-01", "2026-03-04")
+    assert live.get_activities_by_date.call_count == 2
+
+
+def test_client_passes_filtered_activity_calls_through() -> None:
+    live = MagicMock()
+    live.get_activities_by_date.return_value = []
+    client = WarehouseClient(live, make_warehouse())
+    client.get_activities_by_date("2026-03-01", "2026-03-03", "running")
+    client.get_activities_by_date("2026-03-01", "2026-03-03", "running")
+    assert live.get_activities_by_date.call_count == 2
+
+
+# --- server integration ---
+
+
+async def test_server_reads_through_warehouse(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_CACHE_ENABLED", "false")
+    live = MagicMock()
+    live.get_stats.return_value = {"totalSteps": 5000}
+
+    with patch("mcp_garmin.server.get_client", return_value=live):
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+        await server_module.call_tool("get_daily_stats", {"date": "2026-02-20"})
+        await server_module.call_tool(
+            "get_daily_stats", {"date": "2026-02-20", "bypass_cache": True}
+        )
+
+    assert live.get_stats.call_count == 2
+    warehouse = get_warehouse()
+    assert warehouse is not None
+    assert warehouse.stats.hits == 1
+
+
+def test_warehouse_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GARMIN_WAREHOUSE_ENABLED", "false")
+    assert get_warehouse() is None
@@ -35,6 +35,96 @@ def test_get_activities_rejects_bad_end_date() -> None:
         DISPATCH["get_activities"](client, {"start_date": "2026-02-01", "end_date": "bad"})
 
 
+def test_get_activities_splits_long_ranges_into_windows() -> None:
+    client = MagicMock()
+    client.get_activities_by_date.return_value = []
+    DISPATCH["get_activities"](client, {"start_date": "2026-01-01", "end_date": "2026-03-31"})
+    windows = sorted(c.args for c in client.get_activities_by_date.call_args_list)
+    assert windows == [
+        ("2026-01-01", "2026-01-31"),
+        ("2026-02-01", "2026-03-03"),
+        ("2026-03-04", "2026-03-31"),
+    ]
+
+
+def test_get_activities_merges_windows_newest_first_without_duplicates() -> None:
+    by_window = {
+        "2026-01-01": [
+            {"activityId": 1, "startTimeLocal": "2026-01-05 07:00:00"},
+            {"activityId": 2, "startTimeLocal": "2026-01-31 07:00:00"},
+        ],
+        "2026-02-01": [
+            {"activityId": 3, "startTimeLocal": "2026-02-10 07:00:00"},
+            {"activityId": 2, "startTimeLocal": "2026-01-31 07:00:00"},
+        ],
+    }
+    client = MagicMock()
+    client.get_activities_by_date.side_effect = lambda start, end: by_window[start]
+    result = DISPATCH["get_activities"](
+        client, {"start_date": "2026-01-01", "end_date": "2026-02-20"}
+    )
+    assert [a["activityId"] for a in json.loads(result[0].text)] == [3, 2, 1]
+
+
+def test_get_activities_fails_if_any_window_fails() -> None:
+    client = MagicMock()
+    client.get_activities_by_date.side_effect = [[], ConnectionError("timeout")]
+    with pytest.raises(ConnectionError):
+        DISPATCH["get_activities"](client, {"start_date": "2026-01-01", "end_date": "2026-02-20"})
+
+
+def test_get_activities_passes_activity_type_filter() -> None:
+    client = MagicMock()
+    client.get_activities_by_date.return_value = []
+    DISPATCH["get_activities"](
+        client,
+        {"start_date": "2026-02-01", "end_date": "2026-02-20", "activity_type": "running"},
+    )
+    client.get_activities_by_date.assert_called_once_with("2026-02-01", "2026-02-20", "running")
+
+
+def test_get_activities_rejects_bad_activity_type() -> None:
+    with pytest.raises(ValueError, match="activity_type"):
+        DISPATCH["get_activities"](
+            MagicMock(),
+            {"start_date": "2026-02-01", "end_date": "2026-02-20", "activity_type": "run&x=1"},
+        )
+
+
+def test_get_activities_rejects_reversed_range() -> None:
+    with pytest.raises(ValueError, match="on or before"):
+        DISPATCH["get_activities"](
+            MagicMock(), {"start_date": "2026-02-20", "end_date": "2026-02-01"}
+        )
+
+
+def test_get_activities_lean_keeps_key_fields_only() -> None:
+    client = MagicMock()
+    client.get_activities_by_date.return_value = [
+        {
+            "activityId": 1,
+            "activityName": "Morning Run",
+            "activityType": {"typeKey": "running", "typeId": 1},
+            "distance": 5000.0,
+            "averageHR": 150,
+            "ownerDisplayName": "someone",
+            "splitSummaries": [{"noOfSplits": 5}],
+        }
+    ]
+    result = DISPATCH["get_activities"](
+        client, {"start_date": "2026-02-01", "end_date": "2026-02-20", "lean": True}
+    )
+    assert json.loads(result[0].text) == [
+        {
+            "activityId": 1,
+            "activityName": "Morning Run",
+            "distance": 5000.0,
+            "averageHR": 150,
+            "activityType": "running",
+        }
+    ]
+
+
 # --- get_activity_details ---
 
 
@@ -84,3 +174,90 @@ def test_tools_list_contains_both_activity_tools() -> None:
     names = {t.name for t in TOOLS}
     assert "get_activities" in names
     assert "get_activity_details" in names
+
+
+# --- get_activity_timeseries ---
+
+
+def make_details(samples: int) -> dict:
+    return {
+        "metricDescriptors": [
+            {"metricsIndex": 0, "key": "sumElapsedDuration", "unit": {"key": "second"}},
+            {"metricsIndex": 1, "key": "directHeartRate", "unit": {"key": "bpm"}},
+            {"metricsIndex": 2, "key": "directSpeed", "unit": {"key": "mps"}},
+            {"metricsIndex": 3, "key": "directLatitude", "unit": {"key": "dd"}},
+        ],
+        "activityDetailMetrics": [
+            {"metrics": [float(i), 120 + i % 40, 3.0 if i % 100 else None, 51.5]}
+            for i in range(samples)
+        ],
+    }
+
+
+def test_get_activity_timeseries_requests_full_resolution() -> None:
+    client = MagicMock()
+    client.get_activity_details.return_value = make_details(10)
+    DISPATCH["get_activity_timeseries"](client, {"activity_id": "999"})
+    client.get_activity_details.assert_called_once_with("999", maxchart=20000, maxpoly=0)
+
+
+def test_get_activity_timeseries_downsamples_default_channels() -> None:
+    client = MagicMock()
+    client.get_activity_details.return_value = make_details(10_800)
+    result = DISPATCH["get_activity_timeseries"](client, {"activity_id": "999", "points": "200"})
+    data = json.loads(result[0].text)
+
+    assert data["samples"] == 10_800
+    assert data["x"] == "sumElapsedDuration"
+    assert set(data["channels"]) == {"directHeartRate", "directSpeed"}
+    hr = data["channels"]["directHeartRate"]
+    assert hr["unit"] == "bpm"
+    assert len(hr["x"]) == len(hr["y"]) == 200
+    assert hr["x"][0] == 0.0
+    assert hr["x"][-1] == 10_799.0
+    assert len(result[0].text) < 20_000
+
+
+def test_get_activity_timeseries_skips_missing_samples() -> None:
+    client = MagicMock()
+    client.get_activity_details.return_value = make_details(100)
+    result = DISPATCH["get_activity_timeseries"](
+        client, {"activity_id": "999", "channels": "directSpeed"}
+    )
+    speed = json.loads(result[0].text)["channels"]["directSpeed"]
+    assert 0.0 not in speed["x"]  # sample 0 has no speed
+    assert None not in speed["y"]
+
+
+def test_get_activity_timeseries_handles_activity_without_samples() -> None:
+    client = MagicMock()
+    client.get_activity_details.return_value = {
+        "metricDescriptors": [
+            {"metricsIndex": 0, "key": "directTimestamp", "unit": {"key": "gmt"}},
+            {"metricsIndex": 1, "key": "directHeartRate", "unit": {"key": "bpm"}},
+        ],
+        "activityDetailMetrics": [],
+    }
+    result = DISPATCH["get_activity_timeseries"](client, {"activity_id": "999"})
+    data = json.loads(result[0].text)
+    assert data["x"] == "directTimestamp"
+    assert data["samples"] == 0
+    assert data["channels"] == {}
+    assert data["available"] == ["directHeartRate", "directTimestamp"]
+
+
+def test_get_activity_timeseries_rejects_unknown_channel() -> None:
+    client = MagicMock()
+    client.get_activity_details.return_value = make_details(10)
+    with pytest.raises(ValueError, match="Unknown channels"):
+        DISPATCH["get_activity_timeseries"](client, {"activity_id": "999", "channels": "nope"})
+
+
+def test_get_activity_timeseries_rejects_bad_points() -> None:
+    with pytest.raises(ValueError, match="points"):
+        DISPATCH["get_activity_timeseries"](MagicMock(), {"activity_id": "1", "points": "1"})
+
+
+def test_get_activity_timeseries_requires_activity_id() -> None:
+    with pytest.raises(ValueError, match="activity_id"):
+        DISPATCH["get_activity_timeseries"](MagicMock(), {"activity_id": ""})
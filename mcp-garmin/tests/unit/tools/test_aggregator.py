@@ -7,6 +7,7 @@ ALL_EXPECTED = {
     "get_body_battery",
     "get_activities",
     "get_activity_details",
+    "get_activity_timeseries",
     "get_hrv",
     "get_stress",
     "get_training_readiness",
@@ -21,6 +22,8 @@ ALL_EXPECTED = {
     "get_race_predictions",
     "get_personal_records",
     "get_hydration",
+    "get_metric_range",
+    "get_daily_overview",
 }
 
 
@@ -36,3 +39,13 @@ def test_dispatch_covers_all_tools() -> None:
 def test_no_duplicate_tool_names() -> None:
     names = [t.name for t in tools.ALL_TOOLS]
     assert len(names) == len(set(names))
+
+
+def test_all_tools_advertise_bypass_cache() -> None:
+    for tool in tools.ALL_TOOLS:
+        assert tool.inputSchema["properties"]["bypass_cache"]["type"] == "boolean"
+
+
+def test_all_tools_advertise_output_options() -> None:
+    for tool in tools.ALL_TOOLS:
+        assert {"format", "precision", "fields"} <= set(tool.inputSchema["properties"]), tool.name
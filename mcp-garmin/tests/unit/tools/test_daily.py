@@ -57,6 +57,37 @@ def test_get_heart_rate_rejects_bad_date() -> None:
         DISPATCH["get_heart_rate"](client, {"date": "not-a-date"})
 
 
+def test_get_heart_rate_resolution_buckets_samples() -> None:
+    start = 1771804800000
+    raw = {
+        "restingHeartRate": 50,
+        "heartRateValues": [[start + i * 120_000, 60 + i] for i in range(15)] + [[start, None]],
+    }
+    client = make_client(get_heart_rates=raw)
+    result = DISPATCH["get_heart_rate"](client, {"date": "2026-02-23", "resolution": "15m"})
+    data = json.loads(result[0].text)
+    assert data["restingHeartRate"] == 50
+    table = data["heartRateValues"]
+    assert table["columns"] == ["startGMT", "min", "mean", "max", "count"]
+    assert table["rows"] == [
+        ["2026-02-23T00:00:00", 60.0, 63.5, 67.0, 8],
+        ["2026-02-23T00:15:00", 68.0, 71.0, 74.0, 7],
+    ]
+
+
+def test_get_heart_rate_without_resolution_returns_raw() -> None:
+    raw = {"heartRateValues": [[1771804800000, 60]]}
+    client = make_client(get_heart_rates=raw)
+    result = DISPATCH["get_heart_rate"](client, {"date": "2026-02-23"})
+    assert json.loads(result[0].text) == raw
+
+
+def test_get_heart_rate_rejects_bad_resolution() -> None:
+    client = make_client(get_heart_rates={})
+    with pytest.raises(ValueError, match="resolution"):
+        DISPATCH["get_heart_rate"](client, {"date": "2026-02-23", "resolution": "7s"})
+
+
 # --- get_sleep ---
 
 
@@ -109,6 +140,70 @@ def test_get_sleep_strips_timeseries_arrays() -> None:
     assert data["sleepLevels"] == raw["sleepLevels"]
 
 
+def _sleep_with_series() -> dict[str, object]:
+    start = 1771804800000  # 2026-02-23T00:00:00Z
+    minute = 60_000
+    return {
+        "dailySleepDTO": {"sleepTimeSeconds": 7200},
+        "sleepLevels": [
+            {
+                "startGMT": "2026-02-23T00:00:00.0",
+                "endGMT": "2026-02-23T01:00:00.0",
+                "activityLevel": 0,
+            },
+            {
+                "startGMT": "2026-02-23T01:00:00.0",
+                "endGMT": "2026-02-23T02:00:00.0",
+                "activityLevel": 2,
+            },
+        ],
+        # 50 bpm through deep sleep, 60 bpm through REM.
+        "sleepHeartRate": [
+            {"value": 50 if i < 60 else 60, "startGMT": start + i * minute} for i in range(120)
+        ],
+        "sleepStress": [[start, -1], [start + minute, 20], [start + 2 * minute, None]],
+        "wellnessEpochSPO2DataDTOList": [
+            {"epochTimestamp": "2026-02-23T00:30:00.0", "spo2Reading": 94},
+            {"epochTimestamp": "2026-02-23T01:30:00.0", "spo2Reading": 98},
+        ],
+    }
+
+
+def test_get_sleep_timeseries_stats_off_by_default() -> None:
+    client = make_client(get_sleep_data=_sleep_with_series())
+    data = json.loads(DISPATCH["get_sleep"](client, {"date": "2026-02-23"})[0].text)
+    assert "timeseriesStats" not in data
+    assert "sleepHeartRate" not in data
+
+
+def test_get_sleep_timeseries_stats_summarises_dropped_arrays() -> None:
+    client = make_client(get_sleep_data=_sleep_with_series())
+    result = DISPATCH["get_sleep"](client, {"date": "2026-02-23", "timeseries_stats": "true"})
+    data = json.loads(result[0].text)
+    assert "sleepHeartRate" not in data
+    hr = data["timeseriesStats"]["sleepHeartRate"]
+    assert hr["count"] == 120
+    assert (hr["min"], hr["max"], hr["mean"]) == (50.0, 60.0, 55.0)
+    assert hr["stageMeans"] == {"deep": 50.0, "rem": 60.0}
+    assert hr["slopePerHour"] > 0
+    spo2 = data["timeseriesStats"]["wellnessEpochSPO2DataDTOList"]
+    assert spo2["stageMeans"] == {"deep": 94.0, "rem": 98.0}
+
+
+def test_get_sleep_timeseries_stats_ignores_sentinels() -> None:
+    client = make_client(get_sleep_data=_sleep_with_series())
+    result = DISPATCH["get_sleep"](client, {"date": "2026-02-23", "timeseries_stats": True})
+    stress = json.loads(result[0].text)["timeseriesStats"]["sleepStress"]
+    assert stress["count"] == 1
+    assert stress["mean"] == 20.0
+
+
+def test_get_sleep_timeseries_stats_rejects_bad_flag() -> None:
+    client = make_client(get_sleep_data={})
+    with pytest.raises(ValueError, match="timeseries_stats"):
+        DISPATCH["get_sleep"](client, {"date": "2026-02-23", "timeseries_stats": "maybe"})
+
+
 def test_get_sleep_rejects_bad_date() -> None:
     client = MagicMock()
     with pytest.raises(ValueError, match="YYYY-MM-DD"):
@@ -118,6 +213,17 @@ def test_get_sleep_rejects_bad_date() -> None:
 # --- get_body_battery ---
 
 
+def test_get_body_battery_resolution_buckets_each_entry() -> None:
+    start = 1771804800000
+    raw = [{"date": "2026-02-23", "bodyBatteryValuesArray": [[start, 80], [start + 60_000, 78]]}]
+    client = make_client(get_body_battery=raw)
+    result = DISPATCH["get_body_battery"](client, {"date": "2026-02-23", "resolution": "1h"})
+    data = json.loads(result[0].text)
+    assert data[0]["bodyBatteryValuesArray"]["rows"] == [
+        ["2026-02-23T00:00:00", 78.0, 79.0, 80.0, 2]
+    ]
+
+
 def test_get_body_battery_calls_correct_method() -> None:
     client = make_client(get_body_battery=[{"date": "2026-02-20", "charged": 80, "drained": 30}])
     DISPATCH["get_body_battery"](client, {"date": "2026-02-20"})
@@ -86,3 +86,30 @@ def test_get_menstrual_cycle_rejects_bad_end_date() -> None:
     client = MagicMock()
     with pytest.raises(ValueError, match="end_date"):
         DISPATCH["get_menstrual_cycle"](client, {"start_date": "2026-02-01", "end_date": "bad"})
+
+
+# --- resolution ---
+
+
+def test_get_stress_resolution_buckets_stress_and_body_battery() -> None:
+    start = 1771804800000
+    raw = {
+        "avgStressLevel": 30,
+        "stressValuesArray": [[start, 20], [start + 180_000, -1], [start + 360_000, 40]],
+        "bodyBatteryValuesArray": [
+            [start, "MEASURED", 70, 2.0],
+            [start + 180_000, "MEASURED", 68, 2.0],
+        ],
+    }
+    client = MagicMock()
+    client.get_stress_data.return_value = raw
+    result = DISPATCH["get_stress"](client, {"date": "2026-02-23", "resolution": "1h"})
+    data = json.loads(result[0].text)
+    assert data["avgStressLevel"] == 30
+    assert data["stressValuesArray"]["rows"] == [["2026-02-23T00:00:00", 20.0, 30.0, 40.0, 2]]
+    assert data["bodyBatteryValuesArray"]["rows"] == [["2026-02-23T00:00:00", 68.0, 69.0, 70.0, 2]]
+
+
+def test_resolution_only_advertised_on_intraday_tools() -> None:
+    with_resolution = {t.name for t in TOOLS if "resolution" in t.inputSchema["properties"]}
+    assert with_resolution == {"get_stress", "get_respiration", "get_spo2"}
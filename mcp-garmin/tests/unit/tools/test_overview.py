@@ -0,0 +1,97 @@
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import mcp_garmin.server as server_module
+from mcp_garmin.tools.overview import DISPATCH, TOOLS
+
+
+def make_client() -> MagicMock:
+    client = MagicMock()
+    client.get_stats.return_value = {"totalSteps": 9000, "restingHeartRate": 52}
+    client.get_sleep_data.return_value = {
+        "dailySleepDTO": {"sleepTimeSeconds": 28800, "sleepScores": {"overall": {"value": 82}}},
+        "sleepHeartRate": [[1, 50]] * 300,
+        "avgOvernightHrv": 45,
+    }
+    client.get_hrv_data.return_value = {"hrvSummary": {"lastNightAvg": 48}, "hrvReadings": []}
+    client.get_training_readiness.return_value = [{"score": 71, "level": "HIGH"}]
+    client.get_body_battery.return_value = [{"charged": 60, "drained": 40}]
+    client.get_stress_data.return_value = {"avgStressLevel": 28, "stressValuesArray": [[1, 2]]}
+    return client
+
+
+def test_overview_merges_headline_values_from_every_endpoint() -> None:
+    client = make_client()
+    result = DISPATCH["get_daily_overview"](client, {"date": "2026-02-20"})
+    data = json.loads(result[0].text)
+
+    assert data["date"] == "2026-02-20"
+    assert data["stats"] == {"totalSteps": 9000, "restingHeartRate": 52}
+    assert data["sleep"]["dailySleepDTO.sleepScores.overall.value"] == 82
+    assert data["sleep"]["avgOvernightHrv"] == 45
+    assert data["hrv"] == {"hrvSummary.lastNightAvg": 48}
+    assert data["training_readiness"] == {"score": 71, "level": "HIGH"}
+    assert data["body_battery"] == {"charged": 60, "drained": 40}
+    assert data["stress"] == {"avgStressLevel": 28}
+    assert "errors" not in data
+    client.get_body_battery.assert_called_once_with("2026-02-20", "2026-02-20")
+
+
+def test_overview_fetches_endpoints_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=2)
+    client = make_client()
+    client.get_stats.side_effect = lambda d: {"waited": barrier.wait() >= 0}
+    client.get_hrv_data.side_effect = lambda d: {"waited": barrier.wait() >= 0}
+    data = json.loads(DISPATCH["get_daily_overview"](client, {"date": "2026-02-20"})[0].text)
+    assert "errors" not in data
+
+
+def test_overview_reports_failed_sections() -> None:
+    client = make_client()
+    client.get_hrv_data.side_effect = ConnectionError("no HRV")
+    data = json.loads(DISPATCH["get_daily_overview"](client, {"date": "2026-02-20"})[0].text)
+    assert "hrv" not in data
+    assert data["errors"] == {"hrv": "no HRV"}
+    assert data["stats"]["totalSteps"] == 9000
+
+
+async def test_partial_overview_is_not_cached() -> None:
+    client = make_client()
+    client.get_hrv_data.side_effect = RuntimeError("HRV unavailable")
+
+    with patch("mcp_garmin.server.get_client", return_value=client):
+        first = await server_module.call_tool("get_daily_overview", {"date": "2026-02-20"})
+        client.get_hrv_data.side_effect = None
+        second = await server_module.call_tool("get_daily_overview", {"date": "2026-02-20"})
+
+    assert json.loads(first[0].text)["errors"] == {"hrv": "HRV unavailable"}
+    recovered = json.loads(second[0].text)
+    assert "errors" not in recovered
+    assert recovered["hrv"] == {"hrvSummary.lastNightAvg": 48}
+
+
+def test_overview_raises_when_every_endpoint_fails() -> None:
+    client = MagicMock()
+    for method in (
+        "get_stats",
+        "get_sleep_data",
+        "get_hrv_data",
+        "get_training_readiness",
+        "get_body_battery",
+        "get_stress_data",
+    ):
+        getattr(client, method).side_effect = ConnectionError("offline")
+    with pytest.raises(ConnectionError):
+        DISPATCH["get_daily_overview"](client, {"date": "2026-02-20"})
+
+
+def test_overview_rejects_bad_date() -> None:
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        DISPATCH["get_daily_overview"](MagicMock(), {"date": "bad"})
+
+
+def test_tools_list() -> None:
+    assert {t.name for t in TOOLS} == {"get_daily_overview"}
@@ -0,0 +1,128 @@
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import mcp_garmin.server as server_module
+from mcp_garmin.tools.ranges import DISPATCH, FETCHERS, TOOLS
+
+
+def call(client: MagicMock, metric: str, start: str, end: str) -> dict:
+    result = DISPATCH["get_metric_range"](
+        client, {"metric": metric, "start_date": start, "end_date": end}
+    )
+    return json.loads(result[0].text)
+
+
+def test_fetchers_cover_every_single_date_tool() -> None:
+    assert set(FETCHERS) == {
+        "get_daily_stats",
+        "get_heart_rate",
+        "get_sleep",
+        "get_body_battery",
+        "get_hrv",
+        "get_stress",
+        "get_training_readiness",
+        "get_max_metrics",
+        "get_training_status",
+        "get_respiration",
+        "get_spo2",
+        "get_hydration",
+    }
+
+
+def test_metric_range_calls_upstream_once_per_day() -> None:
+    client = MagicMock()
+    client.get_hrv_data.side_effect = lambda d: {"hrvSummary": {"lastNightAvg": int(d[-2:])}}
+    data = call(client, "get_hrv", "2026-02-01", "2026-02-07")
+    assert client.get_hrv_data.call_count == 7
+    assert data["metric"] == "get_hrv"
+    assert data["columns"] == ["date", "hrvSummary.lastNightAvg"]
+    assert data["rows"][0] == ["2026-02-01", 1]
+    assert data["rows"][-1] == ["2026-02-07", 7]
+
+
+def test_metric_range_keeps_scalars_and_drops_time_series() -> None:
+    client = MagicMock()
+    client.get_stress_data.return_value = {
+        "avgStressLevel": 30,
+        "maxStressLevel": 90,
+        "stressValuesArray": [[1, 20]] * 500,
+        "calendarDate": "2026-02-01",
+        "nullField": None,
+    }
+    data = call(client, "get_stress", "2026-02-01", "2026-02-01")
+    assert data["columns"] == ["date", "avgStressLevel", "maxStressLevel", "calendarDate"]
+
+
+def test_metric_range_uses_first_entry_of_list_responses() -> None:
+    client = MagicMock()
+    client.get_training_readiness.return_value = [{"score": 70}, {"score": 50}]
+    data = call(client, "get_training_readiness", "2026-02-01", "2026-02-01")
+    assert data["rows"] == [["2026-02-01", 70]]
+
+
+def test_metric_range_fans_out_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=2)
+    client = MagicMock()
+    client.get_stats.side_effect = lambda d: {"wait": barrier.wait()}
+    data = call(client, "get_daily_stats", "2026-02-01", "2026-02-03")
+    assert "errors" not in data
+
+
+def test_metric_range_reports_failed_days_without_dropping_others() -> None:
+    client = MagicMock()
+
+    def get_stats(d: str) -> dict:
+        if d == "2026-02-02":
+            raise ConnectionError("timeout")
+        return {"totalSteps": 1000}
+
+    client.get_stats.side_effect = get_stats
+    data = call(client, "get_daily_stats", "2026-02-01", "2026-02-03")
+    assert [row[0] for row in data["rows"]] == ["2026-02-01", "2026-02-03"]
+    assert data["errors"] == {"2026-02-02": "timeout"}
+
+
+async def test_metric_range_with_failed_days_is_not_cached() -> None:
+    client = MagicMock()
+    failing = {"2026-02-02"}
+
+    def get_stats(d: str) -> dict:
+        if d in failing:
+            raise RuntimeError("upstream hiccup")
+        return {"totalSteps": 1000}
+
+    client.get_stats.side_effect = get_stats
+    arguments = {"metric": "get_daily_stats", "start_date": "2026-02-01", "end_date": "2026-02-03"}
+    with patch("mcp_garmin.server.get_client", return_value=client):
+        first = await server_module.call_tool("get_metric_range", arguments)
+        failing.clear()
+        second = await server_module.call_tool("get_metric_range", arguments)
+
+    assert json.loads(first[0].text)["errors"] == {"2026-02-02": "upstream hiccup"}
+    recovered = json.loads(second[0].text)
+    assert "errors" not in recovered
+    assert [row[0] for row in recovered["rows"]] == ["2026-02-01", "2026-02-02", "2026-02-03"]
+
+
+def test_metric_range_raises_when_every_day_fails() -> None:
+    client = MagicMock()
+    client.get_stats.side_effect = ConnectionError("down")
+    with pytest.raises(ConnectionError):
+        call(client, "get_daily_stats", "2026-02-01", "2026-02-02")
+
+
+def test_metric_range_rejects_unknown_metric() -> None:
+    with pytest.raises(ValueError, match="Unknown metric"):
+        call(MagicMock(), "get_activities", "2026-02-01", "2026-02-02")
+
+
+def test_metric_range_rejects_ranges_over_limit() -> None:
+    with pytest.raises(ValueError, match="exceeds 31 days"):
+        call(MagicMock(), "get_hrv", "2026-01-01", "2026-02-15")
+
+
+def test_tools_list() -> None:
+    assert {t.name for t in TOOLS} == {"get_metric_range"}
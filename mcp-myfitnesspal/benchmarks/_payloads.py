@@ -0,0 +1,87 @@
+"""Synthetic MyFitnessPal payloads shaped like real tool results, for offline benchmarks.
+
+``load(name)`` returns ``benchmarks/fixtures/<name>.json`` when a recorded
+result has been saved there, and otherwise builds a deterministic stand-in
+with the same structure and realistic sizes. ``load(name, size)`` does the
+same for the ``small`` and ``worst`` variants (``<name>-<size>.json``), which
+bracket the typical result: a day with one logged food or a week of history
+at one end, a heavily logged day or ten years of weigh-ins at the other.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+FIXTURES = Path(__file__).parent / "fixtures"
+_START = date(2026, 1, 1)
+_NUTRIENTS = ("calories", "carbohydrates", "fat", "protein", "sodium", "sugar")
+
+
+def _nutrition(rng: random.Random, scale: float) -> dict[str, float]:
+    return {name: round(rng.uniform(0, scale), 1) for name in _NUTRIENTS}
+
+
+def diary_day(items: int = 5) -> dict[str, Any]:
+    rng = random.Random(1)  # noqa: S311 - deterministic sample data
+    meals = {
+        meal: [
+            {
+                "name": f"{meal.title()} item {i}, 1 serving",
+                "nutrition_information": _nutrition(rng, 600),
+            }
+            for i in range(items)
+        ]
+        for meal in ("breakfast", "lunch", "dinner", "snacks")
+    }
+    return {
+        "date": "2026-01-01",
+        "meals": meals,
+        "totals": _nutrition(rng, 2500),
+        "goals": _nutrition(rng, 2500),
+        "complete": True,
+    }
+
+
+def nutrition_summary(days: int = 90) -> list[dict[str, Any]]:
+    rng = random.Random(2)  # noqa: S311 - deterministic sample data
+    return [
+        {"date": str(_START + timedelta(days=i)), "totals": _nutrition(rng, 2500)}
+        for i in range(days)
+    ]
+
+
+def weight_log(days: int = 365) -> list[dict[str, Any]]:
+    rng = random.Random(3)  # noqa: S311 - deterministic sample data
+    return [
+        {"date": str(_START + timedelta(days=i)), "weight": rng.uniform(70, 80)}
+        for i in range(days)
+    ]
+
+
+_BUILDERS: dict[str, Callable[..., Any]] = {
+    "diary_day": diary_day,
+    "nutrition_summary": nutrition_summary,
+    "weight_log": weight_log,
+}
+
+NAMES = tuple(_BUILDERS)
+SIZES = ("small", "typical", "worst")
+
+# Builder arguments for the non-typical sizes.
+_SIZED: dict[str, dict[str, dict[str, Any]]] = {
+    "diary_day": {"small": {"items": 1}, "worst": {"items": 40}},
+    "nutrition_summary": {"small": {"days": 7}, "worst": {"days": 365}},
+    "weight_log": {"small": {"days": 30}, "worst": {"days": 3650}},
+}
+
+
+def load(name: str, size: str = "typical") -> Any:
+    recorded = FIXTURES / (f"{name}.json" if size == "typical" else f"{name}-{size}.json")
+    if recorded.exists():
+        return json.loads(recorded.read_text())
+    return _BUILDERS[name](**_SIZED[name].get(size, {}))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Concurrent tool-call benchmark.
+
+Fires N concurrent ``call_tool`` requests at a stubbed MyFitnessPal client whose
+diary scrape sleeps for a fixed latency, and compares the wall time against
+running the same handlers back to back on the event loop (the pre-pool behaviour).
+
+The pool gets one worker per call unless ``--workers`` says otherwise, so the
+pooled run should take about one latency. With fewer workers than calls it
+takes ceil(N / workers) latencies instead: 8 calls on the default 4 workers
+take two.
+
+Run with:
+    poetry run python benchmarks/bench_concurrency.py --calls 8 --latency 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+class SlowClient:
+    """Stand-in for ``myfitnesspal.Client`` where every scrape costs ``latency`` seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def get_date(self, day: date) -> SimpleNamespace:
+        time.sleep(self.latency)
+        return SimpleNamespace(
+            meals=[],
+            totals={"calories": 2000.0},
+            goals={"calories": 2200.0},
+            complete=True,
+            get_as_dict=dict,
+        )
+
+    def _get_water(self, day: date) -> float:
+        return 0.0
+
+
+async def _sequential(client: SlowClient, dates: list[str]) -> float:
+    from mcp_myfitnesspal import tools
+
+    handler = tools.DISPATCH["get_nutrition_diary"]
+    started = time.perf_counter()
+    for d in dates:
+        handler(client, {"date": d})
+    return time.perf_counter() - started
+
+
+async def _pooled(client: SlowClient, dates: list[str]) -> float:
+    import mcp_myfitnesspal.server as server_module
+
+    with patch.object(server_module, "get_client", return_value=client):
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(server_module.call_tool("get_nutrition_diary", {"date": d}) for d in dates)
+        )
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=8, help="concurrent tool calls (N)")
+    parser.add_argument("--latency", type=float, default=0.25, help="stub latency in seconds")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="MFP_MAX_WORKERS (default: --calls)"
+    )
+    args = parser.parse_args()
+
+    os.environ["MFP_MAX_WORKERS"] = str(args.workers or args.calls)
+    # Measure the worker pool, not the diary cache or the politeness cap.
+    os.environ["MFP_CACHE_ENABLED"] = "false"
+    os.environ["MFP_RATE_LIMIT"] = "0"
+    os.environ["MFP_MAX_CONCURRENCY"] = str(args.calls)
+    from mcp_myfitnesspal.executor import get_executor
+
+    workers = get_executor()._max_workers
+    client = SlowClient(args.latency)
+    dates = [f"2026-01-{day:02d}" for day in range(1, args.calls + 1)]
+
+    sequential = asyncio.run(_sequential(client, dates))
+    pooled = asyncio.run(_pooled(client, dates))
+
+    print(f"calls={args.calls} latency={args.latency:.3f}s workers={workers}")
+    print(f"  sequential : {sequential:7.3f}s  (N x latency = {args.calls * args.latency:.3f}s)")
+    ideal = math.ceil(args.calls / workers) * args.latency
+    print(f"  worker pool: {pooled:7.3f}s  (ceil(N / workers) x latency = {ideal:.3f}s)")
+    print(f"  speed-up   : {sequential / pooled:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""First tool-call latency with and without the startup client warm-up.
+
+Simulates a server session against a stubbed MyFitnessPal client. Building it
+costs ``--login`` seconds: the real constructor loads the cookie jar and makes
+two requests for the auth token and user metadata. Each diary scrape costs
+``--latency`` seconds. The first ``call_tool`` arrives ``--startup`` seconds
+after the server starts. The lazy run builds the client inside that first
+call; the eager run starts ``warm_up()`` at server start, as ``_run`` does.
+
+Run with:
+    poetry run python benchmarks/bench_first_call.py --login 1.5 --startup 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+class SlowClient:
+    """Stand-in for ``myfitnesspal.Client`` where every scrape costs ``latency`` seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def get_date(self, day: date) -> SimpleNamespace:
+        time.sleep(self.latency)
+        return SimpleNamespace(
+            meals=[],
+            totals={"calories": 2000.0},
+            goals={"calories": 2200.0},
+            complete=True,
+            get_as_dict=dict,
+        )
+
+    def _get_water(self, day: date) -> float:
+        return 0.0
+
+
+async def _first_call(eager: bool, startup: float) -> float:
+    import mcp_myfitnesspal.client as client_module
+    import mcp_myfitnesspal.server as server_module
+
+    client_module._reset_client()
+    if eager:
+        client_module.warm_up()
+    await asyncio.sleep(startup)
+    started = time.perf_counter()
+    await server_module.call_tool("get_nutrition_diary", {"date": "2026-01-01"})
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--login", type=float, default=1.5, help="stub client setup seconds")
+    parser.add_argument("--latency", type=float, default=0.25, help="stub scrape seconds")
+    parser.add_argument("--startup", type=float, default=0.5, help="seconds until first call")
+    args = parser.parse_args()
+
+    # Measure the client setup, not the diary cache or the rate cap.
+    os.environ["MFP_CACHE_ENABLED"] = "false"
+    os.environ["MFP_RATE_LIMIT"] = "0"
+
+    def create_client() -> SlowClient:
+        time.sleep(args.login)
+        return SlowClient(args.latency)
+
+    with patch("mcp_myfitnesspal.client._create_client", create_client):
+        lazy = asyncio.run(_first_call(eager=False, startup=args.startup))
+        eager = asyncio.run(_first_call(eager=True, startup=args.startup))
+
+    print(f"login={args.login:.3f}s latency={args.latency:.3f}s startup={args.startup:.3f}s")
+    print(f"  lazy setup : first call {lazy:7.3f}s")
+    print(f"  warm-up    : first call {eager:7.3f}s  (saved {lazy - eager:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
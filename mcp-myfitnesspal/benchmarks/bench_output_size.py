@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Response size benchmark for the pretty, compact and columnar output formats.
+
+Encodes each benchmark payload (recorded fixtures in benchmarks/fixtures/ when
+present, synthetic stand-ins otherwise) in every format and reports bytes,
+tokens and encode time. Tokens are counted with tiktoken's cl100k_base when it
+is installed and otherwise estimated from word, punctuation and whitespace runs.
+
+Run with:
+    poetry run python benchmarks/bench_output_size.py --precision 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _payloads import NAMES, load  # noqa: E402
+
+from mcp_myfitnesspal.output import FORMATS, OutputOptions, encode  # noqa: E402
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]|\s+")
+
+
+def _token_counter() -> tuple[str, Callable[[str], int]]:
+    try:
+        import tiktoken
+    except ImportError:
+        return "estimated", lambda text: len(_TOKEN_RE.findall(text))
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return "cl100k_base", lambda text: len(encoding.encode(text))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--precision", type=int, default=None, help="round floats to N places")
+    parser.add_argument("--repeat", type=int, default=20, help="encodes per timing sample")
+    args = parser.parse_args()
+
+    tokenizer, count_tokens = _token_counter()
+    print(f"tokens: {tokenizer}, precision: {args.precision}")
+    print(f"{'payload':<18} {'format':<9} {'bytes':>9} {'tokens':>8} {'encode ms':>10}")
+    for name in NAMES:
+        payload = load(name)
+        for fmt in FORMATS:
+            options = OutputOptions(format=fmt, precision=args.precision)
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                text = encode(payload, options)
+            elapsed_ms = (time.perf_counter() - started) * 1000 / args.repeat
+            size = len(text.encode())
+            print(f"{name:<18} {fmt:<9} {size:>9,} {count_tokens(text):>8,} {elapsed_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
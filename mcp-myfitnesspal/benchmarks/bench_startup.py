@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Server start-up import time, measured with ``python -X importtime``.
+
+Imports ``mcp_myfitnesspal.server`` in a fresh interpreter ``--runs`` times and
+reports the median total import time, the packages that spend the most time
+in their own module bodies, and whether the vendor SDKs were loaded. The
+"with SDKs" row imports myfitnesspal and its scraping stack as well, which is
+what start-up cost before it was deferred to the first tool call.
+
+Run with:
+    poetry run python benchmarks/bench_startup.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+SERVER_MODULE = "mcp_myfitnesspal.server"
+DEFERRED = ("myfitnesspal", "requests", "cloudscraper", "lxml")
+
+# "import time:  self [us] | cumulative | imported package", nesting shown by indent.
+_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """Run ``code`` in a fresh interpreter; return self import time in µs per root package."""
+    proc = subprocess.run(  # noqa: S603 - fixed interpreter and code
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals: dict[str, int] = defaultdict(int)
+    for match in _LINE_RE.finditer(proc.stderr):
+        self_us, _, _, module = match.groups()
+        totals[module.split(".")[0]] += int(self_us)
+    return totals
+
+
+def _median_ms(code: str, runs: int) -> tuple[float, dict[str, float]]:
+    per_module: dict[str, list[int]] = defaultdict(list)
+    totals: list[int] = []
+    for _ in range(runs):
+        sample = _importtime(code)
+        totals.append(sum(sample.values()))
+        for module, micros in sample.items():
+            per_module[module].append(micros)
+    medians = {m: statistics.median(v) / 1000 for m, v in per_module.items()}
+    return statistics.median(totals) / 1000, medians
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per row")
+    parser.add_argument("--top", type=int, default=8, help="heaviest packages to list")
+    args = parser.parse_args()
+
+    server_code = f"import {SERVER_MODULE}"
+    check = subprocess.run(  # noqa: S603 - fixed interpreter and code
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {SERVER_MODULE}; "
+            f"print(','.join(m for m in {DEFERRED!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lazy_ms, modules = _median_ms(server_code, args.runs)
+    eager_ms, _ = _median_ms(f"{server_code}; import {', '.join(DEFERRED)}", args.runs)
+
+    print(f"{SERVER_MODULE}: median of {args.runs} runs")
+    print(f"  server import   : {lazy_ms:8.1f} ms")
+    print(f"  with SDKs       : {eager_ms:8.1f} ms  (deferred {eager_ms - lazy_ms:.1f} ms)")
+    print(f"  SDKs loaded at start-up: {check.stdout.strip() or 'none'}")
+    print("  heaviest packages (self time):")
+    for module, ms in sorted(modules.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"    {module:<32} {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from mcp_myfitnesspal.config import env_bool, env_int
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED_ENV = "MFP_CACHE_ENABLED"
+CACHE_PATH_ENV = "MFP_CACHE_PATH"
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "mcp-myfitnesspal" / "diary.sqlite3"
+
+DEFAULT_HORIZON_DAYS = 7
+DEFAULT_RECENT_TTL = 10 * 60
+DEFAULT_MEMORY_ENTRIES = 256
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+class DiaryCache:
+    """Parsed diary days keyed by date, in memory and in an on-disk SQLite table.
+
+    A day is stored for good once MyFitnessPal reports it ``complete`` or it is
+    more than ``horizon_days`` old, since the user is no longer editing it.
+    Recent incomplete days are kept for ``recent_ttl`` seconds so that a
+    summary and a diary lookup in the same conversation share one scrape.
+
+    A day with no meals and no goals is not stored: the library parses an
+    error or login page into exactly that, and it would otherwise be kept
+    for good once the day passes the horizon.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+        recent_ttl: int = DEFAULT_RECENT_TTL,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        clock: Callable[[], float] = time.time,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.horizon_days = horizon_days
+        self.recent_ttl = recent_ttl
+        self.stats = CacheStats()
+        self._memory_entries = memory_entries
+        # None means the entry never expires.
+        self._memory: OrderedDict[str, tuple[float | None, dict[str, Any]]] = OrderedDict()
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._db = _connect(path)
+
+    def is_immutable(self, day_date: date, record: dict[str, Any]) -> bool:
+        if record.get("complete"):
+            return True
+        return day_date < self._today() - timedelta(days=self.horizon_days)
+
+    def get(self, day_date: date) -> dict[str, Any] | None:
+        key = day_date.isoformat()
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, record = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return record
+                del self._memory[key]
+            row = self._db.execute(
+                "SELECT record, expires_at FROM days WHERE date = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.stats.misses += 1
+                return None
+            stored: dict[str, Any] = json.loads(row[0])
+            self._remember(key, row[1], stored)
+            self.stats.disk_hits += 1
+            return stored
+
+    def put(self, day_date: date, record: dict[str, Any]) -> None:
+        key = day_date.isoformat()
+        if not record.get("meals") and not record.get("goals"):
+            logger.warning("Not caching %s: the diary came back with no meals and no goals", key)
+            return
+        if self.is_immutable(day_date, record):
+            expires_at = None
+        elif self.recent_ttl > 0:
+            expires_at = self._clock() + self.recent_ttl
+        else:
+            return
+        with self._lock:
+            self._remember(key, expires_at, record)
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO days (date, record, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(record), expires_at),
+                )
+
+    def update(self, day_date: date, record: dict[str, Any]) -> None:
+        """Replace a stored day's record, keeping the expiry it was stored with."""
+        key = day_date.isoformat()
+        with self._lock:
+            row = self._db.execute("SELECT expires_at FROM days WHERE date = ?", (key,)).fetchone()
+            if row is None:
+                return
+            self._remember(key, row[0], record)
+            with self._db:
+                self._db.execute(
+                    "UPDATE days SET record = ? WHERE date = ?", (json.dumps(record), key)
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _remember(self, key: str, expires_at: float | None, record: dict[str, Any]) -> None:
+        self._memory[key] = (expires_at, record)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    if str(path) != ":memory:":
+        path = Path(path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Diary entries are personal data; create the file owner-only.
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+    db = sqlite3.connect(str(path), check_same_thread=False)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS days (date TEXT PRIMARY KEY, record TEXT NOT NULL, "
+        "expires_at REAL)"
+    )
+    return db
+
+
+_cache: DiaryCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> DiaryCache | None:
+    """Return the shared diary cache, or None when ``MFP_CACHE_ENABLED`` is off."""
+    global _cache
+    with _cache_lock:
+        if _cache is None and env_bool(CACHE_ENABLED_ENV, True):
+            path = os.environ.get(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH
+            _cache = DiaryCache(
+                path,
+                horizon_days=env_int("MFP_CACHE_HORIZON_DAYS", DEFAULT_HORIZON_DAYS, minimum=0),
+                recent_ttl=env_int("MFP_CACHE_TTL_RECENT", DEFAULT_RECENT_TTL, minimum=0),
+                memory_entries=env_int(
+                    "MFP_CACHE_MEMORY_ENTRIES", DEFAULT_MEMORY_ENTRIES, minimum=0
+                ),
+            )
+            logger.info("Diary cache opened at %s", path)
+        return _cache
+
+
+def _reset_cache() -> None:
+    """Close and drop the shared cache. Used in tests only."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
@@ -3,27 +3,63 @@ from __future__ import annotations
 import http.cookiejar
 import logging
 import os
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import myfitnesspal  # type: ignore[import-untyped]
+from mcp_myfitnesspal.ratelimit import RETRYABLE_STATUSES
+from mcp_myfitnesspal.replay import recording, replay_client_from_env
+
+if TYPE_CHECKING:
+    import myfitnesspal  # type: ignore[import-untyped]
+    import requests
 
 logger = logging.getLogger(__name__)
 
 _client: myfitnesspal.Client | None = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> myfitnesspal.Client:
-    """Return the authenticated MFP singleton, creating it on first call."""
+    """Return the authenticated MFP singleton, creating it on first call.
+
+    Callers that arrive while another thread is building the client, such as
+    the startup warm-up, wait for it instead of loading the cookies again.
+    With ``MFP_REPLAY_DIR`` set, the client answers from recorded fixtures
+    instead (see ``mcp_myfitnesspal.replay``).
+    """
     global _client
-    if _client is None:
-        _client = _create_client()
-    return _client
+    with _client_lock:
+        if _client is None:
+            replay = replay_client_from_env()
+            _client = replay if replay is not None else recording(_create_client())
+        return _client
+
+
+def warm_up() -> threading.Thread:
+    """Start building the client on a daemon thread so the first tool call finds it ready."""
+    thread = threading.Thread(target=_warm_up, name="mfp-auth", daemon=True)
+    thread.start()
+    return thread
+
+
+def _warm_up() -> None:
+    started = time.perf_counter()
+    try:
+        get_client()
+    except Exception as exc:
+        # Not fatal: the first tool call retries and reports the error.
+        logger.warning("MFP client setup at startup failed: %s", exc)
+        return
+    logger.info("MFP client ready after %.2fs", time.perf_counter() - started)
 
 
 def _reset_client() -> None:
     """Reset the singleton. Used in tests only."""
     global _client
-    _client = None
+    with _client_lock:
+        _client = None
 
 
 def _create_client() -> myfitnesspal.Client:
@@ -47,8 +83,36 @@ def _create_client() -> myfitnesspal.Client:
             f"Run: chmod 600 {cookie_path}"
         )
 
+    # myfitnesspal pulls in requests, cloudscraper, lxml and browser_cookie3; load
+    # it here so the server can answer initialize/list_tools without waiting.
+    import myfitnesspal
+
     jar = http.cookiejar.MozillaCookieJar()
     jar.load(str(cookie_path), ignore_discard=True, ignore_expires=True)
 
+    client = myfitnesspal.Client(cookiejar=jar)
+    raise_for_retryable_status(client.session)
     logger.info("MFP client authenticated from cookie file at %s", cookie_path)
-    return myfitnesspal.Client(cookiejar=jar)
+    return client
+
+
+def raise_for_retryable_status(session: requests.Session) -> None:
+    """Make ``session`` raise ``requests.HTTPError`` for 429 and 5xx responses.
+
+    The library never looks at the status of a page it scrapes, so a throttled
+    or failed request would parse as an empty day and the rate limiter would
+    never see the 429 or its ``Retry-After``. ``request`` is wrapped rather
+    than given a response hook so the check runs after cloudscraper has
+    answered a Cloudflare challenge, which also arrives as a 503.
+    """
+    import requests
+
+    send = session.request
+
+    def request(method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        response = send(method, url, *args, **kwargs)
+        if response.status_code in RETRYABLE_STATUSES:
+            raise requests.HTTPError(f"{response.status_code} error from {url}", response=response)
+        return response
+
+    session.request = request  # type: ignore[method-assign,assignment]
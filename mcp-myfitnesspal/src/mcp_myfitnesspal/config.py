@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read an integer setting from the environment, falling back to ``default``."""
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = int(raw)
+    except ValueError as err:
+        raise ValueError(f"{name} must be an integer, got {raw!r}.") from err
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}, got {value}.")
+    return value
+
+
+def env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    """Read a float setting from the environment, falling back to ``default``."""
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError as err:
+        raise ValueError(f"{name} must be a number, got {raw!r}.") from err
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}, got {value}.")
+    return value
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read an on/off setting from the environment, falling back to ``default``."""
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    value = raw.strip().lower()
+    if value in {"1", "true", "yes", "on"}:
+        return True
+    if value in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"{name} must be true or false, got {raw!r}.")
+
+
+def write_private(path: Path, text: str | bytes) -> None:
+    """Replace ``path`` with ``text`` atomically, leaving it readable by the owner only.
+
+    The new content is written and fsynced to a temporary file in the same
+    directory, then renamed over ``path``, so a crash mid-write never leaves a
+    truncated file behind.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkstemp creates the file with mode 0600.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(text, bytes) else "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
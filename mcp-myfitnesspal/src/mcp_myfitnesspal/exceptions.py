@@ -9,6 +9,10 @@ class MFPShapeError(Exception):
     """
 
 
+class UpstreamError(Exception):
+    """Raised when MyFitnessPal keeps throttling or failing a request after retries."""
+
+
 _DAY_ATTRS = ("meals", "totals", "goals")
 
 
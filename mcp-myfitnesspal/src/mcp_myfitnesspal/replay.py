@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from mcp_myfitnesspal.config import env_float, env_int, write_private
+
+logger = logging.getLogger(__name__)
+
+RECORD_DIR_ENV = "MFP_RECORD_DIR"
+REPLAY_DIR_ENV = "MFP_REPLAY_DIR"
+REPLAY_LATENCY_ENV = "MFP_REPLAY_LATENCY_MS"
+REPLAY_JITTER_ENV = "MFP_REPLAY_JITTER_MS"
+REPLAY_ERROR_RATE_ENV = "MFP_REPLAY_ERROR_RATE"
+REPLAY_ERROR_STATUS_ENV = "MFP_REPLAY_ERROR_STATUS"
+REPLAY_SEED_ENV = "MFP_REPLAY_SEED"
+DEFAULT_ERROR_STATUS = 503
+
+SCRUBBED = "REDACTED"
+
+# A key containing any of these (case-insensitive) holds a credential or identifies the user.
+_SECRET_KEY_PARTS = (
+    "token",
+    "secret",
+    "password",
+    "cookie",
+    "authorization",
+    "email",
+    "displayname",
+    "fullname",
+    "username",
+    "profileimage",
+    "userprofilepk",
+    "userprofileid",
+    "ownerid",
+    "userid",
+)
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9.=-]+")
+
+
+def _is_secret(key: str) -> bool:
+    normalized = key.replace("_", "").replace("-", "").lower()
+    return any(part in normalized for part in _SECRET_KEY_PARTS)
+
+
+def scrub(value: Any) -> Any:
+    """Return ``value`` with secret fields blanked and e-mail addresses masked.
+
+    Scrubbed fields keep their type (strings become ``REDACTED``, numbers 0)
+    so replayed payloads have the same shape as real ones.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _blank(item) if _is_secret(str(key)) else scrub(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [scrub(item) for item in value]
+    if isinstance(value, str):
+        return _EMAIL_RE.sub(SCRUBBED, value)
+    return value
+
+
+def _blank(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, str):
+        return SCRUBBED
+    if isinstance(value, int | float):
+        return 0
+    return scrub(value)
+
+
+def fixture_path(
+    directory: Path, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Path:
+    """``<directory>/<method>/<readable args>-<hash>.json`` for one call."""
+    parts = [str(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())]
+    readable = _UNSAFE_RE.sub("-", "_".join(parts))[:80] or "noargs"
+    canonical = json.dumps([list(args), kwargs], sort_keys=True, default=str)
+    digest = hashlib.sha256(canonical.encode()).hexdigest()[:10]
+    return directory / method / f"{readable}-{digest}.json"
+
+
+def _encode_day(day: Any) -> dict[str, Any]:
+    return {
+        "meals": day.get_as_dict(),
+        "totals": day.totals,
+        "goals": day.goals,
+        "complete": day.complete,
+    }
+
+
+def _encode_measurements(measurements: Any) -> list[list[Any]]:
+    return [[str(day), value] for day, value in measurements.items()]
+
+
+class ReplayDay:
+    """A recorded diary day with the parts of ``myfitnesspal.Day`` the tools read."""
+
+    def __init__(self, record: dict[str, Any]) -> None:
+        self.meals = record["meals"]
+        self.totals = record["totals"]
+        self.goals = record["goals"]
+        self.complete = record["complete"]
+
+    def get_as_dict(self) -> dict[str, Any]:
+        return dict(self.meals)
+
+
+def _decode_measurements(rows: list[list[Any]]) -> dict[date, Any]:
+    return {date.fromisoformat(day): value for day, value in rows}
+
+
+# The library returns objects rather than JSON for these methods.
+_ENCODERS: dict[str, Callable[[Any], Any]] = {
+    "get_date": _encode_day,
+    "get_measurements": _encode_measurements,
+}
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "get_date": ReplayDay,
+    "get_measurements": _decode_measurements,
+}
+
+
+def write_fixture(
+    directory: Path, method: str, args: tuple[Any, ...], kwargs: dict[str, Any], response: Any
+) -> Path:
+    """Save one scrubbed response, as JSON. The file is replaced atomically, owner-only."""
+    path = fixture_path(directory, method, args, kwargs)
+    response = _ENCODERS.get(method, lambda value: value)(response)
+    record = {
+        "method": method,
+        "args": scrub(json.loads(json.dumps(list(args), default=str))),
+        "kwargs": scrub(json.loads(json.dumps(kwargs, default=str))),
+        "response": scrub(response),
+    }
+    # Fixtures hold health and diary data, so they are owner-only like the profiles.
+    write_private(path, json.dumps(record, indent=1, ensure_ascii=False, default=str))
+    return path
+
+
+class RecordingClient:
+    """Proxy that saves the response of every method call on ``client`` under ``directory``."""
+
+    def __init__(self, client: Any, directory: Path) -> None:
+        self._client = client
+        self._directory = directory
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            response = attr(*args, **kwargs)
+            try:
+                write_fixture(self._directory, name, args, kwargs, response)
+            except (AttributeError, OSError, TypeError, ValueError) as exc:
+                logger.warning("Could not record %s response: %s", name, exc)
+            return response
+
+        return record
+
+
+class MissingFixtureError(LookupError):
+    """Raised by ``ReplayClient`` for a call that was never recorded."""
+
+
+class _InjectedResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+
+class InjectedError(OSError):
+    """An upstream HTTP failure made up by ``ReplayClient``.
+
+    It carries a ``response`` with a status code, like the errors requests
+    raises, so the rate limiter retries or backs off as it would for
+    a real one.
+    """
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"{status_code} error injected by the replay client")
+        self.response = _InjectedResponse(status_code)
+
+
+class ReplayClient:
+    """Stand-in for ``myfitnesspal.Client`` that answers from recorded fixtures.
+
+    Each method call sleeps ``latency`` plus up to ``jitter`` seconds, then
+    fails with ``InjectedError(error_status)`` with probability ``error_rate``
+    or returns a fresh copy of the recorded response. ``get_date`` returns a
+    ``ReplayDay`` and ``get_measurements`` a dict keyed by date, as the
+    library does.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = DEFAULT_ERROR_STATUS,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.calls = 0
+        self.injected_errors = 0
+        self._directory = directory
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._sleep = sleep
+        self._rng = random.Random(seed)  # noqa: S311 - fault injection, not cryptography
+        self._texts: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Private library methods such as ``_get_water`` are replayed too.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self._call(name, args, kwargs)
+
+    def _call(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        with self._lock:
+            self.calls += 1
+            delay = self._latency + self._rng.uniform(0, self._jitter)
+            fail = self._rng.random() < self._error_rate
+            if fail:
+                self.injected_errors += 1
+        if delay > 0:
+            self._sleep(delay)
+        if fail:
+            raise InjectedError(self._error_status)
+        path = fixture_path(self._directory, method, args, kwargs)
+        response = json.loads(self._text(path))["response"]
+        return _DECODERS.get(method, lambda value: value)(response)
+
+    def _text(self, path: Path) -> str:
+        text = self._texts.get(path)
+        if text is None:
+            try:
+                text = path.read_text()
+            except FileNotFoundError:
+                raise MissingFixtureError(
+                    f"No recorded MyFitnessPal response at {path}. Record it with {RECORD_DIR_ENV}."
+                ) from None
+            self._texts[path] = text
+        return text
+
+
+def replay_client_from_env() -> ReplayClient | None:
+    """A ``ReplayClient`` configured from the environment, or None unless ``MFP_REPLAY_DIR``."""
+    directory = os.environ.get(REPLAY_DIR_ENV)
+    if not directory:
+        return None
+    error_rate = env_float(REPLAY_ERROR_RATE_ENV, 0.0)
+    if error_rate > 1:
+        raise ValueError(f"{REPLAY_ERROR_RATE_ENV} must be between 0 and 1, got {error_rate}.")
+    logger.info("Serving recorded MyFitnessPal responses from %s", directory)
+    return ReplayClient(
+        Path(directory).expanduser(),
+        latency=env_float(REPLAY_LATENCY_ENV, 0.0) / 1000,
+        jitter=env_float(REPLAY_JITTER_ENV, 0.0) / 1000,
+        error_rate=error_rate,
+        error_status=env_int(REPLAY_ERROR_STATUS_ENV, DEFAULT_ERROR_STATUS, minimum=100),
+        seed=env_int(REPLAY_SEED_ENV, 0, minimum=0) if os.environ.get(REPLAY_SEED_ENV) else None,
+    )
+
+
+def recording(client: Any) -> Any:
+    """Wrap ``client`` in a ``RecordingClient`` when ``MFP_RECORD_DIR`` is set."""
+    directory = os.environ.get(RECORD_DIR_ENV)
+    if not directory:
+        return client
+    logger.info("Recording MyFitnessPal responses to %s", directory)
+    return RecordingClient(client, Path(directory).expanduser())
@@ -2,38 +2,93 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from mcp_myfitnesspal import tools
-from mcp_myfitnesspal.client import get_client
-from mcp_myfitnesspal.exceptions import MFPShapeError
+from mcp_myfitnesspal import metrics, tools
+from mcp_myfitnesspal.cache import get_cache
+from mcp_myfitnesspal.client import get_client, warm_up
+from mcp_myfitnesspal.exceptions import MFPShapeError, UpstreamError
+from mcp_myfitnesspal.executor import run_blocking, shutdown_executor
+from mcp_myfitnesspal.metrics import METRICS_TOOL, get_metrics, hit_rate, start_metrics_dump
+from mcp_myfitnesspal.output import OUTPUT_PROPERTIES, encode, output_options, parse_options
+from mcp_myfitnesspal.ratelimit import get_host_limiter, limited
+from mcp_myfitnesspal.singleflight import SingleFlight, call_key
+from mcp_myfitnesspal.tools import Handler
+from mcp_myfitnesspal.tools._shared import _with_properties
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 server: Server = Server("mcp-myfitnesspal")
 
+# Identical (tool, arguments) calls in flight at the same time share one upstream fetch.
+inflight = SingleFlight()
+
+SERVER_TOOLS: list[Tool] = [_with_properties(METRICS_TOOL, OUTPUT_PROPERTIES)]
+
 
 @server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
 async def list_tools() -> list[Tool]:
-    return tools.ALL_TOOLS
+    return tools.ALL_TOOLS + SERVER_TOOLS
+
+
+def _execute(handler: Handler, arguments: dict[str, str]) -> list[TextContent]:
+    """Run one tool call on a worker thread, waiting there for a client still being built.
+
+    The handler gets the client behind the shared MyFitnessPal rate limiter, timed as
+    upstream in the server metrics.
+    """
+    metrics.mark_executed()
+    client = metrics.metered(limited(get_client()))
+    with metrics.handling():
+        return handler(client, arguments)
+
+
+def server_metrics() -> dict[str, Any]:
+    """Per-tool metrics plus the diary cache, coalescing and limiter counters."""
+    snapshot = get_metrics().snapshot()
+    snapshot["coalescing"] = inflight.stats.as_dict()
+    snapshot["upstream_limiter"] = get_host_limiter().stats.as_dict()
+    cache = get_cache()
+    if cache is not None:
+        hits = cache.stats.memory_hits + cache.stats.disk_hits
+        snapshot["diary_cache"] = {
+            **cache.stats.as_dict(),
+            "hit_rate": hit_rate(hits, cache.stats.misses),
+        }
+    return snapshot
+
+
+def _metrics_result(arguments: dict[str, str]) -> list[TextContent]:
+    with output_options(parse_options(arguments)):
+        return [TextContent(type="text", text=encode(server_metrics()))]
 
 
 @server.call_tool()  # type: ignore[untyped-decorator]
 async def call_tool(name: str, arguments: dict[str, str]) -> list[TextContent]:
     logger.info("Tool called: %s", name)
     try:
-        client = get_client()
+        if name == METRICS_TOOL.name:
+            return _metrics_result(arguments)
         handler = tools.DISPATCH.get(name)
         if handler is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
-        return handler(client, arguments)
+        with get_metrics().track(name) as call:
+            result = await inflight.do(
+                call_key(name, arguments), lambda: run_blocking(_execute, handler, arguments)
+            )
+            call.respond(result)
+        return result
     except RuntimeError as exc:
         logger.error("Auth error in tool %s: %s", name, exc)
         return [TextContent(type="text", text=str(exc))]
+    except UpstreamError as exc:
+        logger.error("Upstream error in tool %s: %s", name, exc)
+        return [TextContent(type="text", text=str(exc))]
     except MFPShapeError as exc:
         logger.error("MFP shape error in tool %s: %s", name, exc)
         return [TextContent(type="text", text=str(exc))]
@@ -46,8 +101,18 @@ async def call_tool(name: str, arguments: dict[str, str]) -> list[TextContent]:
 
 
 async def _run() -> None:
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    # Load the cookie jar and build the client while the stdio transport starts.
+    warm_up()
+    metrics_dump = start_metrics_dump(server_metrics)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        shutdown_executor()
+        if metrics_dump is not None:
+            metrics_dump.stop(timeout=5)
+        logger.info("Request coalescing stats: %s", inflight.stats.as_dict())
+        logger.info("Upstream limiter stats: %s", get_host_limiter().stats.as_dict())
 
 
 def main() -> None:
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from mcp_myfitnesspal.cache import DiaryCache, get_cache
+from mcp_myfitnesspal.client import get_client
+from mcp_myfitnesspal.fanout import fan_out
+from mcp_myfitnesspal.ratelimit import limited
+from mcp_myfitnesspal.tools.nutrition import _serialise_day
+
+
+@dataclass
+class SyncReport:
+    """What one backfill run fetched. ``days`` counts days scraped and cached."""
+
+    days: int = 0
+    requests: int = 0
+    bytes: int = 0
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def merge(self, other: SyncReport) -> None:
+        self.days += other.days
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.errors.extend(other.errors)
+
+    def describe(self) -> str:
+        """One line with totals and throughput, for the sync command's output."""
+        seconds = max(self.seconds, 1e-9)
+        return (
+            f"{self.days} days, {self.requests} requests, {self.bytes:,} bytes "
+            f"in {self.seconds:.1f}s ({self.days / seconds:.1f} days/s, "
+            f"{self.requests / seconds:.1f} req/s, {len(self.errors)} errors)"
+        )
+
+
+def _day_range(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _scrape(cache: DiaryCache, client: Any, day: date) -> dict[str, Any]:
+    record = _serialise_day(client.get_date(day), str(day))
+    cache.put(day, record)
+    return record
+
+
+def sync_range(
+    cache: DiaryCache,
+    client: Any,
+    start: date,
+    end: date,
+    max_workers: int | None = None,
+) -> SyncReport:
+    """Scrape every day in ``start..end`` that the diary cache does not hold.
+
+    Each day is cached as soon as it is scraped, so a rerun after an
+    interruption only fetches what is still missing. Pass a ``limited`` client
+    so scrapes share the rate limit and retry policy of tool calls.
+    """
+    started = time.perf_counter()
+    missing = [d for d in _day_range(start, end) if cache.get(d) is None]
+    report = SyncReport(requests=len(missing))
+    results = fan_out(lambda d: _scrape(cache, client, d), missing, max_workers=max_workers)
+    for day, result in zip(missing, results, strict=True):
+        if isinstance(result, Exception):
+            report.errors.append(f"{day}: {result}")
+        else:
+            report.bytes += len(json.dumps(result))
+            report.days += 1
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def backfill(
+    cache: DiaryCache,
+    client: Any,
+    start: date,
+    end: date,
+    max_workers: int | None = None,
+    chunk_days: int = 30,
+    on_chunk: Callable[[date, date, SyncReport], None] | None = None,
+) -> SyncReport:
+    """Sync ``start..end`` oldest first, ``chunk_days`` at a time, reporting each chunk."""
+    started = time.perf_counter()
+    total = SyncReport()
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+        report = sync_range(cache, client, chunk_start, chunk_end, max_workers)
+        total.merge(report)
+        if on_chunk is not None:
+            on_chunk(chunk_start, chunk_end, report)
+        chunk_start = chunk_end + timedelta(days=1)
+    total.seconds = time.perf_counter() - started
+    return total
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="mcp-myfitnesspal-sync",
+        description="Backfill MyFitnessPal diary days into the local diary cache.",
+    )
+    parser.add_argument("--start", type=date.fromisoformat, help="first day (YYYY-MM-DD)")
+    parser.add_argument(
+        "--end", type=date.fromisoformat, help="last day (YYYY-MM-DD, default today)"
+    )
+    parser.add_argument(
+        "--days", type=int, default=30, help="days back from --end when --start is not given"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="concurrent scrapes (default $MFP_FETCH_WORKERS)",
+    )
+    parser.add_argument(
+        "--chunk-days", type=int, default=30, help="days per progress line (default 30)"
+    )
+    args = parser.parse_args(argv)
+    args.end = args.end or date.today()
+    args.start = args.start or args.end - timedelta(days=max(args.days, 1) - 1)
+    if args.start > args.end:
+        parser.error("--start must not be after --end")
+    if args.chunk_days < 1 or (args.workers is not None and args.workers < 1):
+        parser.error("--chunk-days and --workers must be >= 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``mcp-myfitnesspal-sync``, e.g. from cron."""
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    cache = get_cache()
+    if cache is None:
+        print("The diary cache is disabled (MFP_CACHE_ENABLED=false).", file=sys.stderr)
+        return 2
+    try:
+        client = limited(get_client())
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    def progress(chunk_start: date, chunk_end: date, report: SyncReport) -> None:
+        print(f"{chunk_start}..{chunk_end}: {report.describe()}", flush=True)
+        for error in report.errors:
+            print(f"  {error}", file=sys.stderr)
+
+    total = backfill(
+        cache,
+        client,
+        args.start,
+        args.end,
+        max_workers=args.workers,
+        chunk_days=args.chunk_days,
+        on_chunk=progress,
+    )
+    print(f"total {args.start}..{args.end}: {total.describe()}")
+    return 1 if total.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,27 @@
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-import myfitnesspal  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
+from mcp_myfitnesspal.output import OUTPUT_PROPERTIES, with_output_options
+from mcp_myfitnesspal.profiling import with_profiling
+from mcp_myfitnesspal.tools._shared import _with_properties
 from mcp_myfitnesspal.tools.body import DISPATCH as _BODY_DISPATCH
 from mcp_myfitnesspal.tools.body import TOOLS as _BODY_TOOLS
 from mcp_myfitnesspal.tools.nutrition import DISPATCH as _NUTRITION_DISPATCH
 from mcp_myfitnesspal.tools.nutrition import TOOLS as _NUTRITION_TOOLS
 
-ALL_TOOLS: list[Tool] = _NUTRITION_TOOLS + _BODY_TOOLS
+if TYPE_CHECKING:
+    import myfitnesspal  # type: ignore[import-untyped]
 
-DISPATCH: dict[str, Callable[[myfitnesspal.Client, dict[str, str]], list[TextContent]]] = {
-    **_NUTRITION_DISPATCH,
-    **_BODY_DISPATCH,
+ALL_TOOLS: list[Tool] = [
+    _with_properties(tool, OUTPUT_PROPERTIES) for tool in _NUTRITION_TOOLS + _BODY_TOOLS
+]
+
+type Handler = Callable[[myfitnesspal.Client, dict[str, str]], list[TextContent]]
+
+# Every handler honours the shared format/precision arguments and can be profiled.
+DISPATCH: dict[str, Handler] = {
+    name: with_profiling(name, with_output_options(handler))
+    for name, handler in {**_NUTRITION_DISPATCH, **_BODY_DISPATCH}.items()
 }
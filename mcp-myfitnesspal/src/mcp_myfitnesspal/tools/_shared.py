@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+from mcp.types import TextContent, Tool
+
+from mcp_myfitnesspal.metrics import serializing
+from mcp_myfitnesspal.output import encode
+
+
+def _json_result(data: Any) -> list[TextContent]:
+    with serializing():
+        text = encode(data)
+    return [TextContent(type="text", text=text)]
+
+
+def _with_properties(tool: Tool, properties: dict[str, Any]) -> Tool:
+    """Return a copy of ``tool`` whose input schema also accepts ``properties``."""
+    schema = dict(tool.inputSchema)
+    schema["properties"] = {**schema.get("properties", {}), **properties}
+    return tool.model_copy(update={"inputSchema": schema})
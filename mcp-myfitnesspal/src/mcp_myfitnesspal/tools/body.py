@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Callable
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING
 
-import myfitnesspal  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
+from mcp_myfitnesspal.tools._shared import _json_result
 from mcp_myfitnesspal.validation import validate_date_range
 
-
-def _json_result(data: Any) -> list[TextContent]:
-    return [TextContent(type="text", text=json.dumps(data, indent=2))]
+if TYPE_CHECKING:
+    import myfitnesspal  # type: ignore[import-untyped]
 
 
 def get_weight_log(client: myfitnesspal.Client, arguments: dict[str, str]) -> list[TextContent]:
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Callable
 from datetime import date, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import myfitnesspal  # type: ignore[import-untyped]
 from mcp.types import TextContent, Tool
 
+from mcp_myfitnesspal.cache import get_cache
 from mcp_myfitnesspal.exceptions import validate_day_shape
+from mcp_myfitnesspal.fanout import fan_out
+from mcp_myfitnesspal.tools._shared import _json_result
 from mcp_myfitnesspal.validation import validate_date, validate_date_range
 
-
-def _json_result(data: Any) -> list[TextContent]:
-    return [TextContent(type="text", text=json.dumps(data, indent=2))]
+if TYPE_CHECKING:
+    import myfitnesspal  # type: ignore[import-untyped]
 
 
 def _serialise_day(day: Any, date_str: str) -> dict[str, Any]:
@@ -23,18 +23,51 @@ def _serialise_day(day: Any, date_str: str) -> dict[str, Any]:
         "meals": day.get_as_dict(),
         "totals": day.totals,
         "goals": day.goals,
-        "water": day.water,
         "complete": day.complete,
     }
 
 
+def _fetch_water(client: myfitnesspal.Client, day_date: date) -> Any:
+    """Return the water intake logged on ``day_date``.
+
+    ``Day.water`` lazily calls ``_get_water`` on the unwrapped library client,
+    which would skip the rate limiter and metrics. Calling it here keeps the
+    request on the wrapped client. ``_get_water`` is private to myfitnesspal
+    2.1.2, the version pinned in pyproject.toml; re-check it when upgrading.
+    """
+    return client._get_water(day_date)
+
+
+def _load_day(
+    client: myfitnesspal.Client, day_date: date, with_water: bool = False
+) -> dict[str, Any]:
+    """Return the serialised diary for ``day_date``, scraping it only on a cache miss.
+
+    ``with_water`` adds the day's water intake, a second page load that only
+    the diary tool pays for. It is stored with the cached day.
+    """
+    cache = get_cache()
+    if cache is not None:
+        record = cache.get(day_date)
+        if record is not None:
+            if with_water and "water" not in record:
+                record = {**record, "water": _fetch_water(client, day_date)}
+                cache.update(day_date, record)
+            return record
+    record = _serialise_day(client.get_date(day_date), str(day_date))
+    if with_water:
+        record["water"] = _fetch_water(client, day_date)
+    if cache is not None:
+        cache.put(day_date, record)
+    return record
+
+
 def get_nutrition_diary(
     client: myfitnesspal.Client, arguments: dict[str, str]
 ) -> list[TextContent]:
     date_str = arguments["date"]
     validate_date(date_str)
-    day = client.get_date(date.fromisoformat(date_str))
-    return _json_result(_serialise_day(day, date_str))
+    return _json_result(_load_day(client, date.fromisoformat(date_str), with_water=True))
 
 
 def get_nutrition_summary(
@@ -43,14 +76,20 @@ def get_nutrition_summary(
     start_str = arguments["start_date"]
     end_str = arguments["end_date"]
     validate_date_range(start_str, end_str)
-    current = date.fromisoformat(start_str)
+    start = date.fromisoformat(start_str)
     end = date.fromisoformat(end_str)
-    rows = []
-    while current <= end:
-        day = client.get_date(current)
-        validate_day_shape(day, str(current))
-        rows.append({"date": str(current), "totals": day.totals})
-        current += timedelta(days=1)
+    dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    results = fan_out(lambda d: _load_day(client, d), dates)
+    errors = [r for r in results if isinstance(r, Exception)]
+    if len(errors) == len(results):
+        # Nothing usable came back; surface the first failure as the tool error.
+        raise errors[0]
+    rows = [
+        {"date": str(d), "error": str(r)}
+        if isinstance(r, Exception)
+        else {"date": str(d), "totals": r["totals"]}
+        for d, r in zip(dates, results, strict=True)
+    ]
     return _json_result(rows)
 
 
@@ -0,0 +1,17 @@
+import pytest
+
+from mcp_myfitnesspal import cache, ratelimit
+
+
+@pytest.fixture(autouse=True)
+def unthrottled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the MFP rate cap so fan-out tests don't sleep."""
+    monkeypatch.setenv("MFP_RATE_LIMIT", "0")
+    ratelimit._reset_limiters()
+
+
+@pytest.fixture(autouse=True)
+def in_memory_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the diary cache off disk and empty for every test."""
+    monkeypatch.setenv("MFP_CACHE_PATH", ":memory:")
+    cache._reset_cache()
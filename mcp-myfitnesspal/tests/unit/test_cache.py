@@ -0,0 +1,110 @@
+import stat
+from datetime import date
+from pathlib import Path
+
+from mcp_myfitnesspal.cache import DiaryCache
+
+TODAY = date(2026, 3, 10)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(
+    path: str | Path = ":memory:", memory_entries: int = 256
+) -> tuple[DiaryCache, FakeClock]:
+    clock = FakeClock()
+    cache = DiaryCache(
+        path,
+        horizon_days=7,
+        recent_ttl=600,
+        memory_entries=memory_entries,
+        clock=clock,
+        today=lambda: TODAY,
+    )
+    return cache, clock
+
+
+def record(complete: bool = False) -> dict[str, object]:
+    return {
+        "date": "x",
+        "meals": {},
+        "totals": {"calories": 1.0},
+        "goals": {"calories": 2000.0},
+        "complete": complete,
+    }
+
+
+def test_complete_days_never_expire() -> None:
+    cache, clock = make_cache()
+    cache.put(date(2026, 3, 10), record(complete=True))
+    clock.now += 10**9
+    assert cache.get(date(2026, 3, 10)) == record(complete=True)
+
+
+def test_days_past_the_horizon_never_expire() -> None:
+    cache, clock = make_cache()
+    cache.put(date(2026, 3, 1), record())
+    clock.now += 10**9
+    assert cache.get(date(2026, 3, 1)) is not None
+
+
+def test_recent_incomplete_days_expire_after_ttl() -> None:
+    cache, clock = make_cache()
+    cache.put(date(2026, 3, 9), record())
+    clock.now += 599
+    assert cache.get(date(2026, 3, 9)) is not None
+    clock.now += 2
+    assert cache.get(date(2026, 3, 9)) is None
+
+
+def test_update_keeps_the_original_expiry() -> None:
+    cache, clock = make_cache()
+    cache.put(date(2026, 3, 9), record())
+    clock.now += 599
+    cache.update(date(2026, 3, 9), {**record(), "water": 500.0})
+    assert cache.get(date(2026, 3, 9)) == {**record(), "water": 500.0}
+    clock.now += 2
+    assert cache.get(date(2026, 3, 9)) is None
+
+
+def test_update_ignores_days_not_stored() -> None:
+    cache, _ = make_cache()
+    cache.update(date(2026, 3, 9), record())
+    assert cache.get(date(2026, 3, 9)) is None
+
+
+def test_days_with_no_meals_and_no_goals_are_not_stored() -> None:
+    cache, _ = make_cache()
+    empty = {"date": "x", "meals": {}, "totals": {}, "goals": {}, "complete": False}
+    cache.put(date(2026, 1, 1), empty)
+    assert cache.get(date(2026, 1, 1)) is None
+
+
+def test_memory_is_bounded_and_falls_back_to_disk(tmp_path: Path) -> None:
+    cache, _ = make_cache(tmp_path / "diary.sqlite3", memory_entries=2)
+    for day in (1, 2, 3):
+        cache.put(date(2026, 1, day), record())
+    cache.get(date(2026, 1, 1))
+    cache.get(date(2026, 1, 3))
+    assert cache.stats.as_dict() == {"memory_hits": 1, "disk_hits": 1, "misses": 0}
+
+
+def test_stats_count_hits_and_misses(tmp_path: Path) -> None:
+    path = tmp_path / "diary.sqlite3"
+    cache, _ = make_cache(path)
+    assert cache.get(date(2026, 1, 1)) is None
+    cache.put(date(2026, 1, 1), record())
+    cache.get(date(2026, 1, 1))
+    cache.close()
+
+    reopened, _ = make_cache(path)
+    assert reopened.get(date(2026, 1, 1)) == record()
+    assert cache.stats.as_dict() == {"memory_hits": 1, "disk_hits": 0, "misses": 1}
+    assert reopened.stats.disk_hits == 1
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
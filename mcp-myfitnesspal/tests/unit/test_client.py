@@ -1,10 +1,19 @@
 import os
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from requests.adapters import BaseAdapter
 
-from mcp_myfitnesspal.client import _reset_client, get_client
+from mcp_myfitnesspal.client import (
+    _reset_client,
+    get_client,
+    raise_for_retryable_status,
+    warm_up,
+)
+from mcp_myfitnesspal.ratelimit import AdaptiveConcurrency, HostLimiter, RateLimiter
 
 
 def test_get_client_raises_if_env_var_not_set() -> None:
@@ -39,9 +48,98 @@ def test_get_client_returns_singleton(tmp_path: Path) -> None:
     cookie_file.write_text("# Netscape HTTP Cookie File\n")
     cookie_file.chmod(0o600)
     with patch.dict(os.environ, {"MFP_COOKIE_PATH": str(cookie_file)}):
-        with patch("mcp_myfitnesspal.client.myfitnesspal.Client") as mock_cls:
+        with patch("myfitnesspal.Client") as mock_cls:
             mock_cls.return_value = MagicMock()
             c1 = get_client()
             c2 = get_client()
             assert c1 is c2
             mock_cls.assert_called_once()
+
+
+def test_get_client_waits_for_warm_up_in_progress() -> None:
+    _reset_client()
+    building = threading.Event()
+    release = threading.Event()
+    created: list[MagicMock] = []
+
+    def slow_create() -> MagicMock:
+        building.set()
+        release.wait(5)
+        created.append(MagicMock())
+        return created[-1]
+
+    with patch("mcp_myfitnesspal.client._create_client", side_effect=slow_create):
+        warm = warm_up()
+        assert building.wait(5)
+        results: list[object] = []
+        caller = threading.Thread(target=lambda: results.append(get_client()))
+        caller.start()
+        release.set()
+        caller.join(5)
+        warm.join(5)
+
+    assert len(created) == 1
+    assert results == created
+
+
+def test_warm_up_failure_is_retried_by_the_first_call(caplog: pytest.LogCaptureFixture) -> None:
+    _reset_client()
+    env = {k: v for k, v in os.environ.items() if k != "MFP_COOKIE_PATH"}
+    with patch.dict(os.environ, env, clear=True):
+        warm_up().join(5)
+        with pytest.raises(RuntimeError, match="MFP_COOKIE_PATH"):
+            get_client()
+    assert "setup at startup failed" in caplog.text
+
+
+class StubAdapter(BaseAdapter):
+    """Transport answering each request with the next queued (status, headers)."""
+
+    def __init__(self, responses: list[tuple[int, dict[str, str]]]) -> None:
+        super().__init__()
+        self.responses = responses
+        self.sent = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs: object) -> requests.Response:
+        status, headers = self.responses[self.sent]
+        self.sent += 1
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = b"<html></html>"
+        response.request = request
+        response.url = request.url or ""
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def test_throttled_responses_are_retried_after_retry_after() -> None:
+    adapter = StubAdapter([(429, {"Retry-After": "3"}), (200, {})])
+    session = requests.Session()
+    session.mount("https://", adapter)
+    raise_for_retryable_status(session)
+    sleeps: list[float] = []
+    limiter = HostLimiter(
+        RateLimiter(0, sleep=sleeps.append),
+        AdaptiveConcurrency(4),
+        sleep=sleeps.append,
+        jitter=lambda: 0.0,
+    )
+
+    response = limiter.call(lambda: session.get("https://www.myfitnesspal.com/food/diary"))
+
+    assert response.status_code == 200
+    assert adapter.sent == 2
+    assert 3.0 in sleeps
+    assert limiter.stats.throttled == 1
+    assert limiter.concurrency.limit < 4
+
+
+def test_other_error_statuses_are_left_to_the_library() -> None:
+    session = requests.Session()
+    session.mount("https://", StubAdapter([(404, {})]))
+    raise_for_retryable_status(session)
+
+    assert session.get("https://www.myfitnesspal.com/missing").status_code == 404
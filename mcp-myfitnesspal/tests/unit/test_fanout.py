@@ -0,0 +1,48 @@
+import threading
+
+from mcp_myfitnesspal.fanout import fan_out
+
+
+def test_fan_out_preserves_input_order() -> None:
+    assert fan_out(lambda x: x * 2, [3, 1, 2]) == [6, 2, 4]
+
+
+def test_fan_out_returns_exceptions_in_place() -> None:
+    def func(x: int) -> int:
+        if x == 2:
+            raise ValueError("bad item")
+        return x
+
+    results = fan_out(func, [1, 2, 3])
+    assert results[0] == 1
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 3
+
+
+def test_fan_out_runs_items_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=2)
+    results = fan_out(lambda _: barrier.wait(), range(3), max_workers=3)
+    assert not any(isinstance(r, Exception) for r in results)
+
+
+def test_fan_out_bounds_worker_count() -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def func(_: int) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(0.05)
+        with lock:
+            active -= 1
+
+    fan_out(func, range(8), max_workers=2)
+    assert peak <= 2
+
+
+def test_fan_out_empty_input() -> None:
+    assert fan_out(lambda x: x, []) == []
@@ -0,0 +1,163 @@
+import json
+from pathlib import Path
+
+import pytest
+from mcp.types import TextContent
+
+from mcp_myfitnesspal import metrics
+from mcp_myfitnesspal.metrics import (
+    CallMetrics,
+    Histogram,
+    MeteredClient,
+    MetricsDump,
+    ServerMetrics,
+    hit_rate,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds() -> None:
+    histogram = Histogram((10, 100, 1000))
+    for value in [5] * 90 + [50] * 9 + [500]:
+        histogram.observe(value)
+
+    assert histogram.percentile(0.50) == 10
+    assert histogram.percentile(0.95) == 100
+    assert histogram.percentile(0.99) == 100
+    assert histogram.percentile(1.0) == 500
+    assert histogram.as_dict()["buckets"] == {"le_10": 90, "le_100": 9, "le_1000": 1}
+
+
+def test_histogram_overflow_bucket_reports_the_max() -> None:
+    histogram = Histogram((10,))
+    histogram.observe(3)
+    histogram.observe(250)
+
+    assert histogram.percentile(0.99) == 250
+    assert histogram.as_dict()["buckets"] == {"le_10": 1, "inf": 1}
+
+
+def test_empty_histogram() -> None:
+    assert Histogram((1,)).as_dict()["p99"] == 0.0
+
+
+def test_overlapping_upstream_calls_count_once() -> None:
+    clock = FakeClock()
+    call = CallMetrics(clock=clock)
+
+    with call.upstream_call():
+        clock.now = 1.0
+        with call.upstream_call():
+            clock.now = 3.0
+    clock.now = 5.0
+    with call.upstream_call():
+        clock.now = 6.0
+
+    assert call.upstream == 4.0
+    assert call.upstream_calls == 3
+
+
+def test_phases_split_handler_time() -> None:
+    clock = FakeClock()
+    call = CallMetrics(clock=clock)
+
+    with call.handling():
+        with call.upstream_call():
+            clock.now = 2.0
+        clock.now = 2.5
+        with call.serializing():
+            clock.now = 3.0
+
+    assert call.phases() == {"upstream": 2.0, "transform": 0.5, "serialize": 0.5}
+
+
+def test_phases_are_none_when_the_handler_did_not_run() -> None:
+    assert CallMetrics().phases() is None
+
+
+def test_metered_client_times_method_calls_only() -> None:
+    class Client:
+        effective_username = "alice"
+
+        def get_date(self, day: str) -> dict[str, str]:
+            return {"day": day}
+
+    call = CallMetrics()
+    client = MeteredClient(Client(), call)
+
+    assert client.get_date("2026-02-20") == {"day": "2026-02-20"}
+    assert client.effective_username == "alice"
+    assert call.upstream_calls == 1
+
+
+def test_metered_is_a_no_op_outside_a_tracked_call() -> None:
+    client = object()
+    assert metrics.metered(client) is client
+
+
+def test_track_records_latency_phases_and_bytes() -> None:
+    registry = ServerMetrics()
+
+    with registry.track("get_nutrition_diary") as call:
+        metrics.mark_executed()
+        with metrics.handling(), metrics.serializing():
+            pass
+        call.respond([TextContent(type="text", text="é" * 10)])
+
+    stats = registry.snapshot()["tools"]["get_nutrition_diary"]
+    assert stats["calls"] == 1
+    assert stats["coalesced"] == 0
+    assert stats["latency_ms"]["serialize"]["count"] == 1
+    assert stats["response_bytes"]["max"] == 20
+    assert metrics.current_call() is None
+
+
+def test_track_counts_errors_by_class() -> None:
+    registry = ServerMetrics()
+
+    with pytest.raises(ValueError), registry.track("get_nutrition_diary"):
+        metrics.mark_executed()
+        raise ValueError("bad date")
+
+    snapshot = registry.snapshot()
+    assert snapshot["tools"]["get_nutrition_diary"]["errors"] == {"ValueError": 1}
+    assert snapshot["errors"] == 1
+
+
+def test_track_counts_coalesced_calls_without_phases() -> None:
+    registry = ServerMetrics()
+
+    with registry.track("get_nutrition_diary"):
+        pass  # never executed: it waited for an identical call
+
+    stats = registry.snapshot()["tools"]["get_nutrition_diary"]
+    assert stats["coalesced"] == 1
+    assert stats["latency_ms"]["total"]["count"] == 1
+    assert stats["latency_ms"]["upstream"]["count"] == 0
+
+
+def test_hit_rate() -> None:
+    assert hit_rate(3, 1) == 0.75
+    assert hit_rate(0, 0) is None
+
+
+def test_metrics_dump_writes_a_final_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "metrics" / "mfp.json"
+    dump = MetricsDump(path, lambda: {"calls": 3}, interval=3600)
+    dump.start()
+    dump.stop(timeout=2)
+
+    assert json.loads(path.read_text()) == {"calls": 3}
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_metrics_dump_is_off_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MFP_METRICS_FILE", raising=False)
+    assert metrics.start_metrics_dump(dict) is None
@@ -0,0 +1,188 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_myfitnesspal import output
+from mcp_myfitnesspal.output import (
+    OutputOptions,
+    columnar,
+    compile_fields,
+    dumps,
+    encode,
+    output_options,
+    parse_options,
+    project,
+    stdlib_dumps,
+)
+from mcp_myfitnesspal.tools import DISPATCH
+
+ROWS = [
+    {"date": "2026-02-20", "totals": {"calories": 2100.456}},
+    {"date": "2026-02-21", "error": "No diary"},
+]
+
+
+def test_default_is_pretty() -> None:
+    assert encode({"a": 1}) == json.dumps({"a": 1}, indent=2)
+
+
+def test_compact_has_no_whitespace() -> None:
+    assert encode(ROWS, OutputOptions(format="compact")) == json.dumps(ROWS, separators=(",", ":"))
+
+
+def test_columnar_uses_union_of_keys() -> None:
+    assert columnar(ROWS) == {
+        "columns": ["date", "totals", "error"],
+        "rows": [
+            ["2026-02-20", {"calories": 2100.456}, None],
+            ["2026-02-21", None, "No diary"],
+        ],
+    }
+
+
+def test_precision_rounds_nested_floats() -> None:
+    text = encode(ROWS, OutputOptions(format="compact", precision=1))
+    assert json.loads(text)[0]["totals"]["calories"] == 2100.5
+
+
+def test_context_sets_options_for_encode() -> None:
+    with output_options(OutputOptions(format="compact")):
+        assert encode({"a": 1}) == '{"a":1}'
+    assert encode({"a": 1}) != '{"a":1}'
+
+
+def test_env_sets_default_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MFP_OUTPUT_FORMAT", "compact")
+    assert encode({"a": 1}) == '{"a":1}'
+
+
+def test_stdlib_pretty_output_matches_plain_json_dumps() -> None:
+    data = {"food": "Crème brûlée", "rows": ROWS}
+    assert stdlib_dumps(data, pretty=True) == json.dumps(data, indent=2)
+
+
+@pytest.mark.parametrize("fmt", ["pretty", "compact"])
+def test_non_ascii_round_trips(fmt: str) -> None:
+    text = encode({"food": "Crème brûlée"}, OutputOptions(format=fmt))
+    assert json.loads(text) == {"food": "Crème brûlée"}
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_non_finite_floats_are_written_as_null(pretty: bool) -> None:
+    data = {"hrv": float("nan"), "rows": [{"max": float("inf")}, (float("-inf"), 1.5)]}
+    expected = {"hrv": None, "rows": [{"max": None}, [None, 1.5]]}
+    assert json.loads(stdlib_dumps(data, pretty)) == expected
+    assert json.loads(dumps(data, pretty)) == expected
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_orjson_matches_stdlib_layout(pretty: bool) -> None:
+    pytest.importorskip("orjson")
+    data = {"rows": ROWS, "empty": [], "nested": {"n": 1, "ok": True, "none": None}}
+    assert output.orjson_dumps(data, pretty) == stdlib_dumps(data, pretty)
+
+
+def test_dumps_falls_back_for_values_orjson_rejects() -> None:
+    assert dumps({"n": 2**70}, pretty=False) == '{"n":1180591620717411303424}'
+
+
+def test_dumps_without_orjson_uses_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(output, "_orjson", None)
+    assert dumps({1: "a"}, pretty=False) == '{"1":"a"}'
+    with pytest.raises(RuntimeError, match="fast"):
+        output.orjson_dumps({}, pretty=False)
+
+
+# --- fields projection ---
+
+DAY = {
+    "date": "2026-02-20",
+    "meals": {
+        "breakfast": [{"name": "Oats", "nutrition_information": {"calories": 300, "fat": 5}}],
+        "lunch": [{"name": "Soup", "nutrition_information": {"calories": 250, "fat": 8}}],
+    },
+    "totals": {"calories": 550, "protein": 40},
+}
+
+
+def _pick(data: object, *fields: str) -> object:
+    return project(data, compile_fields(fields))
+
+
+def test_fields_selects_dotted_paths() -> None:
+    assert _pick(DAY, "date", "totals.protein") == {
+        "date": "2026-02-20",
+        "totals": {"protein": 40},
+    }
+
+
+def test_fields_wildcard_matches_every_key_and_list_element() -> None:
+    assert _pick(DAY, "meals.*.name") == {
+        "meals": {"breakfast": [{"name": "Oats"}], "lunch": [{"name": "Soup"}]}
+    }
+
+
+def test_fields_maps_over_top_level_lists() -> None:
+    assert _pick(ROWS, "date") == [{"date": "2026-02-20"}, {"date": "2026-02-21"}]
+    assert _pick(ROWS, "*.date") == [{"date": "2026-02-20"}, {"date": "2026-02-21"}]
+
+
+def test_fields_wildcard_merges_with_named_sibling() -> None:
+    assert _pick(DAY, "meals.*.name", "meals.lunch.*.nutrition_information.fat") == {
+        "meals": {
+            "breakfast": [{"name": "Oats"}],
+            "lunch": [{"name": "Soup", "nutrition_information": {"fat": 8}}],
+        }
+    }
+
+
+def test_fields_ancestor_path_keeps_whole_subtree() -> None:
+    assert _pick(DAY, "totals", "totals.protein") == {"totals": DAY["totals"]}
+    assert _pick(DAY, "totals.protein", "totals") == {"totals": DAY["totals"]}
+
+
+def test_fields_missing_paths_are_omitted() -> None:
+    assert _pick(DAY, "nope.deeper") == {}
+
+
+def test_compile_fields_is_cached() -> None:
+    assert compile_fields(("a.b", "c")) is compile_fields(("a.b", "c"))
+
+
+def test_parse_options_accepts_list_or_comma_string() -> None:
+    assert parse_options({"fields": ["a", "b.c"]}).fields == ("a", "b.c")
+    assert parse_options({"fields": "a, b.c"}).fields == ("a", "b.c")
+    assert parse_options({}).fields is None
+
+
+def test_encode_applies_fields_before_columnar() -> None:
+    options = OutputOptions(format="columnar", fields=("date",))
+    assert json.loads(encode(ROWS, options)) == {
+        "columns": ["date"],
+        "rows": [["2026-02-20"], ["2026-02-21"]],
+    }
+
+
+@pytest.mark.parametrize(
+    ("arguments", "match"),
+    [
+        ({"format": "xml"}, "format"),
+        ({"precision": "x"}, "precision"),
+        ({"precision": 11}, "precision"),
+        ({"fields": "a..b"}, "fields"),
+        ({"fields": [1]}, "fields"),
+    ],
+)
+def test_parse_options_rejects_bad_values(arguments: dict[str, object], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        parse_options(arguments)
+
+
+def test_dispatch_applies_format_argument() -> None:
+    client = MagicMock()
+    client.get_measurements.return_value = {}
+    result = DISPATCH["get_weight_log"](
+        client, {"start_date": "2026-02-20", "end_date": "2026-02-21", "format": "compact"}
+    )
+    assert result[0].text == "[]"
@@ -0,0 +1,162 @@
+import json
+import pstats
+import stat
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pytest
+from mcp.types import TextContent
+
+from mcp_myfitnesspal import profiling
+from mcp_myfitnesspal.fanout import fan_out
+from mcp_myfitnesspal.profiling import (
+    StackSampler,
+    collapse,
+    sampled_stats,
+    should_profile,
+    stack_of,
+    with_profiling,
+)
+
+
+@pytest.fixture
+def profile_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setenv("MFP_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("MFP_PROFILE", "get_nutrition_summary")
+    return tmp_path
+
+
+def busy_handler(client: Any, arguments: dict[str, Any]) -> list[TextContent]:
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return [TextContent(type="text", text="ok")]
+
+
+def test_should_profile_reads_a_tool_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MFP_PROFILE", "get_nutrition_summary, get_weight_log")
+    assert should_profile("get_weight_log")
+    assert not should_profile("get_nutrition_diary")
+
+    monkeypatch.setenv("MFP_PROFILE", "all")
+    assert should_profile("get_nutrition_diary")
+
+    monkeypatch.delenv("MFP_PROFILE")
+    assert not should_profile("get_nutrition_summary")
+
+
+def test_collapse_renders_the_stack_root_first() -> None:
+    def inner() -> str:
+        return collapse(stack_of(sys._getframe()))
+
+    stack = inner().split(";")
+    assert stack[-1].startswith("test_collapse_renders_the_stack_root_first.<locals>.inner (")
+    assert stack[-2].startswith("test_collapse_renders_the_stack_root_first (test_profiling.py:")
+
+
+def test_profiled_call_writes_pstats_stacks_and_summary(
+    profile_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MFP_PROFILE_MEMORY", "true")
+
+    handler = with_profiling("get_nutrition_summary", busy_handler)
+    result = handler(None, {"start_date": "2026-02-20"})
+
+    assert result[0].text == "ok"
+    (stats_file,) = profile_dir.glob("*-get_nutrition_summary-*.pstats")
+    stem = stats_file.with_suffix("")
+    stats = pstats.Stats(str(stats_file))
+    assert any(func[2] == "busy_handler" for func in stats.stats)  # type: ignore[attr-defined]
+    assert "busy_handler (test_profiling.py:" in stem.with_suffix(".collapsed").read_text()
+    summary = json.loads(stem.with_suffix(".json").read_text())
+    assert summary["tool"] == "get_nutrition_summary"
+    assert summary["arguments"] == {"start_date": "2026-02-20"}
+    assert summary["seconds"] >= 0.05
+    assert summary["peak_bytes"] >= 0
+    assert stat.S_IMODE(profile_dir.stat().st_mode) == 0o700
+    assert {stat.S_IMODE(p.stat().st_mode) for p in profile_dir.iterdir()} == {0o600}
+
+
+def test_profile_directory_is_created_owner_only(
+    profile_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    nested = profile_dir / "profiles"
+    monkeypatch.setenv("MFP_PROFILE_DIR", str(nested))
+    with_profiling("get_nutrition_summary", busy_handler)(None, {})
+    assert stat.S_IMODE(nested.stat().st_mode) == 0o700
+
+
+def test_sampled_stats_split_own_and_cumulative_time() -> None:
+    main, fetch, parse = ("m.py", 1, "main"), ("m.py", 5, "fetch"), ("m.py", 9, "parse")
+    stats = sampled_stats(Counter({(main, fetch): 3, (main, parse): 1}), 0.01)
+
+    assert stats[main][:4] == (4, 4, 0.0, 0.04)
+    assert stats[fetch][:4] == (3, 3, 0.03, 0.03)
+    assert stats[fetch][4] == {main: (3, 3, 0.03, 0.03)}
+
+
+def test_unselected_tools_are_not_profiled(profile_dir: Path) -> None:
+    with_profiling("get_nutrition_diary", busy_handler)(None, {})
+    assert list(profile_dir.iterdir()) == []
+
+
+def test_fast_calls_are_dropped_below_the_threshold(
+    profile_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MFP_PROFILE_MIN_MS", "60000")
+    with_profiling("get_nutrition_summary", busy_handler)(None, {})
+    assert list(profile_dir.iterdir()) == []
+
+
+def test_a_call_overlapping_a_profiled_one_runs_unprofiled(profile_dir: Path) -> None:
+    with profiling._profile_lock:
+        result = with_profiling("get_nutrition_summary", busy_handler)(None, {})
+    assert result[0].text == "ok"
+    assert list(profile_dir.iterdir()) == []
+
+
+def test_handler_errors_propagate_and_are_still_profiled(profile_dir: Path) -> None:
+    def failing(client: Any, arguments: dict[str, Any]) -> list[TextContent]:
+        raise ValueError("bad date")
+
+    with pytest.raises(ValueError, match="bad date"):
+        with_profiling("get_nutrition_summary", failing)(None, {})
+    assert len(list(profile_dir.glob("*.pstats"))) == 1
+    assert not profiling._profile_lock.locked()
+
+
+def test_sampler_includes_fan_out_workers() -> None:
+    def fetch(_: int) -> None:
+        time.sleep(0.05)
+
+    sampler = StackSampler(threading.get_ident(), interval=0.005)
+    sampler.start()
+    fan_out(fetch, range(2), max_workers=2)
+    stacks = sampler.stop()
+
+    collapsed = [collapse(stack) for stack in stacks]
+    assert any("fetch (test_profiling.py:" in stack for stack in collapsed)
+    assert any("test_sampler_includes_fan_out_workers" in stack for stack in collapsed)
+
+
+def test_sampler_leaves_out_other_calls_and_their_workers() -> None:
+    def unrelated_fetch(_: int) -> None:
+        time.sleep(0.05)
+
+    def unrelated_call() -> None:
+        fan_out(unrelated_fetch, range(2), max_workers=2)
+
+    other = threading.Thread(target=unrelated_call)
+    sampler = StackSampler(threading.get_ident(), interval=0.005)
+    sampler.start()
+    other.start()
+    time.sleep(0.05)
+    other.join()
+    stacks = sampler.stop()
+
+    assert stacks
+    assert not any("unrelated_" in collapse(stack) for stack in stacks)
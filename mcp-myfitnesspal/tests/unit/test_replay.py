@@ -0,0 +1,191 @@
+import json
+import stat
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import mcp_myfitnesspal.client as client_module
+import mcp_myfitnesspal.server as server_module
+from mcp_myfitnesspal.ratelimit import is_transient, upstream_status
+from mcp_myfitnesspal.replay import (
+    SCRUBBED,
+    InjectedError,
+    MissingFixtureError,
+    RecordingClient,
+    ReplayClient,
+    ReplayDay,
+    fixture_path,
+    replay_client_from_env,
+    scrub,
+    write_fixture,
+)
+
+DAY = date(2026, 2, 25)
+MEALS = {"breakfast": [{"name": "Oats", "nutrition_information": {"calories": 150.0}}]}
+
+
+@pytest.fixture(autouse=True)
+def reset_client() -> None:
+    client_module._reset_client()
+
+
+def make_day() -> MagicMock:
+    day = MagicMock()
+    day.totals = {"calories": 150.0}
+    day.goals = {"calories": 2200.0}
+    day.complete = True
+    day.get_as_dict.return_value = MEALS
+    return day
+
+
+def test_scrub_blanks_secrets_but_keeps_their_type() -> None:
+    data = {
+        "username": "alice",
+        "user_id": 42,
+        "auth_token": "abc",
+        "totals": {"calories": 2000.0},
+        "notes": ["from alice@example.com"],
+    }
+
+    assert scrub(data) == {
+        "username": SCRUBBED,
+        "user_id": 0,
+        "auth_token": SCRUBBED,
+        "totals": {"calories": 2000.0},
+        "notes": [f"from {SCRUBBED}"],
+    }
+
+
+def test_fixture_path_is_readable_and_stable(tmp_path: Path) -> None:
+    path = fixture_path(tmp_path, "get_date", (DAY,), {})
+
+    assert path.parent == tmp_path / "get_date"
+    assert path.name.startswith("2026-02-25-")
+    assert path == fixture_path(tmp_path, "get_date", (date(2026, 2, 25),), {})
+
+
+def test_recording_client_saves_days_as_json(tmp_path: Path) -> None:
+    mfp = MagicMock()
+    day = make_day()
+    mfp.get_date.return_value = day
+    mfp.effective_username = "alice"
+
+    client = RecordingClient(mfp, tmp_path)
+
+    assert client.get_date(DAY) is day
+    assert client.effective_username == "alice"
+    record = json.loads(fixture_path(tmp_path, "get_date", (DAY,), {}).read_text())
+    assert record["args"] == ["2026-02-25"]
+    assert record["response"] == {
+        "meals": MEALS,
+        "totals": {"calories": 150.0},
+        "goals": {"calories": 2200.0},
+        "complete": True,
+    }
+
+
+def test_replay_client_rebuilds_days(tmp_path: Path) -> None:
+    write_fixture(tmp_path, "get_date", (DAY,), {}, make_day())
+
+    day = ReplayClient(tmp_path).get_date(DAY)
+
+    assert isinstance(day, ReplayDay)
+    assert day.get_as_dict() == MEALS
+    assert day.totals == {"calories": 150.0}
+    assert day.complete is True
+
+
+def test_replay_client_rebuilds_measurements(tmp_path: Path) -> None:
+    weights = {date(2026, 2, 1): 80.5, date(2026, 2, 3): 80.1}
+    args = ("Weight", date(2026, 2, 1), date(2026, 2, 3))
+    write_fixture(tmp_path, "get_measurements", args, {}, weights)
+
+    assert ReplayClient(tmp_path).get_measurements(*args) == weights
+
+
+def test_replay_client_replays_private_library_methods(tmp_path: Path) -> None:
+    write_fixture(tmp_path, "_get_water", (DAY,), {}, 750.0)
+
+    assert ReplayClient(tmp_path)._get_water(DAY) == 750.0
+
+
+def test_fixtures_are_owner_only(tmp_path: Path) -> None:
+    fixtures = tmp_path / "fixtures"
+    path = write_fixture(fixtures, "_get_water", (DAY,), {}, 750.0)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+
+def test_replay_client_reports_unrecorded_calls(tmp_path: Path) -> None:
+    with pytest.raises(MissingFixtureError, match="MFP_RECORD_DIR"):
+        ReplayClient(tmp_path).get_date(DAY)
+
+
+def test_replay_client_injects_latency(tmp_path: Path) -> None:
+    write_fixture(tmp_path, "get_date", (DAY,), {}, make_day())
+    sleeps: list[float] = []
+    client = ReplayClient(tmp_path, latency=0.2, jitter=0.1, seed=1, sleep=sleeps.append)
+
+    for _ in range(20):
+        client.get_date(DAY)
+
+    assert len(sleeps) == 20
+    assert all(0.2 <= s <= 0.3 for s in sleeps)
+
+
+def test_injected_errors_look_like_transient_http_failures(tmp_path: Path) -> None:
+    client = ReplayClient(tmp_path, error_rate=1.0)
+
+    with pytest.raises(InjectedError) as raised:
+        client.get_date(DAY)
+
+    assert upstream_status(raised.value) == 503
+    assert is_transient(raised.value)
+    assert client.injected_errors == 1
+
+
+def test_replay_client_from_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    assert replay_client_from_env() is None
+
+    monkeypatch.setenv("MFP_REPLAY_DIR", str(tmp_path))
+    monkeypatch.setenv("MFP_REPLAY_ERROR_RATE", "2")
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        replay_client_from_env()
+
+    monkeypatch.setenv("MFP_REPLAY_ERROR_RATE", "0")
+    assert isinstance(replay_client_from_env(), ReplayClient)
+
+
+def test_get_client_replays_without_cookies(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.delenv("MFP_COOKIE_PATH", raising=False)
+    monkeypatch.setenv("MFP_REPLAY_DIR", str(tmp_path))
+
+    assert isinstance(client_module.get_client(), ReplayClient)
+
+
+def test_get_client_records_when_asked(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("MFP_RECORD_DIR", str(tmp_path))
+    mfp = MagicMock()
+    monkeypatch.setattr(client_module, "_create_client", lambda: mfp)
+
+    client: Any = client_module.get_client()
+
+    assert isinstance(client, RecordingClient)
+    assert client._client is mfp
+
+
+async def test_tool_call_against_replayed_responses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("MFP_REPLAY_DIR", str(tmp_path))
+    write_fixture(tmp_path, "get_date", (DAY,), {}, make_day())
+    write_fixture(tmp_path, "_get_water", (DAY,), {}, 0.0)
+
+    result = await server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+
+    assert json.loads(result[0].text)["meals"] == MEALS
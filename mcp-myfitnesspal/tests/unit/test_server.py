@@ -0,0 +1,159 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mcp.types import TextContent
+
+import mcp_myfitnesspal.server as server_module
+from mcp_myfitnesspal import metrics, tools
+
+
+def make_day() -> MagicMock:
+    day = MagicMock()
+    day.totals = {"calories": 2000.0}
+    day.goals = {"calories": 2200.0}
+    day.complete = False
+    day.get_as_dict.return_value = {}
+    return day
+
+
+async def test_list_tools_includes_the_metrics_tool() -> None:
+    result = await server_module.list_tools()
+
+    assert len(result) == len(tools.ALL_TOOLS) + 1
+    assert result[-1].name == "get_server_metrics"
+
+
+async def test_call_tool_dispatches_correctly() -> None:
+    mock_client = MagicMock()
+    mock_client.get_date.return_value = make_day()
+    mock_client._get_water.return_value = 0.0
+
+    with patch("mcp_myfitnesspal.server.get_client", return_value=mock_client):
+        result = await server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+
+    assert isinstance(result[0], TextContent)
+    assert "calories" in result[0].text
+
+
+async def test_call_tool_returns_error_for_unknown_tool() -> None:
+    with patch("mcp_myfitnesspal.server.get_client", return_value=MagicMock()):
+        result = await server_module.call_tool("nonexistent_tool", {})
+    assert "Unknown tool" in result[0].text
+
+
+async def test_call_tool_returns_error_on_auth_failure() -> None:
+    with patch("mcp_myfitnesspal.server.get_client", side_effect=RuntimeError("No cookies")):
+        result = await server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+    assert result[0].text == "No cookies"
+
+
+async def test_run_starts_client_warm_up_before_the_transport() -> None:
+    order: list[str] = []
+
+    def stdio_server() -> None:
+        order.append("stdio")
+        raise OSError("stdin closed")
+
+    with (
+        patch("mcp_myfitnesspal.server.warm_up", side_effect=lambda: order.append("warm_up")),
+        patch("mcp_myfitnesspal.server.stdio_server", side_effect=stdio_server),
+        pytest.raises(OSError),
+    ):
+        await server_module._run()
+    assert order == ["warm_up", "stdio"]
+
+
+async def test_call_tool_runs_concurrent_calls_in_parallel() -> None:
+    barrier = threading.Barrier(2, timeout=2)
+    mock_client = MagicMock()
+
+    def get_date(_: object) -> MagicMock:
+        barrier.wait()
+        return make_day()
+
+    mock_client.get_date.side_effect = get_date
+    mock_client._get_water.return_value = 0.0
+
+    with patch("mcp_myfitnesspal.server.get_client", return_value=mock_client):
+        results = await asyncio.gather(
+            server_module.call_tool("get_nutrition_diary", {"date": "2026-02-24"}),
+            server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"}),
+        )
+
+    # Both handlers must reach the barrier together, so neither can time out.
+    assert all("Unexpected error" not in r[0].text for r in results)
+
+
+async def test_identical_concurrent_calls_share_one_upstream_request() -> None:
+    release = threading.Event()
+    mock_client = MagicMock()
+    mock_client.get_date.side_effect = lambda d: release.wait(2) and make_day()
+    mock_client._get_water.return_value = 0.0
+    before = server_module.inflight.stats.deduplicated
+
+    with patch("mcp_myfitnesspal.server.get_client", return_value=mock_client):
+        calls = [
+            asyncio.create_task(
+                server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+    mock_client.get_date.assert_called_once()
+    assert all("calories" in r[0].text for r in results)
+    assert server_module.inflight.stats.deduplicated - before == 2
+
+
+def test_server_import_does_not_load_myfitnesspal() -> None:
+    code = "import sys, mcp_myfitnesspal.server; print('myfitnesspal' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+async def test_call_tool_reports_persistent_throttling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MFP_MAX_RETRIES", "0")
+    response = MagicMock(status_code=429, headers={"Retry-After": "20"})
+    error = OSError("429 Too Many Requests")
+    error.response = response  # type: ignore[attr-defined]
+    mock_client = MagicMock()
+    mock_client.get_date.side_effect = error
+
+    with patch("mcp_myfitnesspal.server.get_client", return_value=mock_client):
+        result = await server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+
+    assert result[0].text == (
+        "MyFitnessPal is rate limiting requests (HTTP 429). Try again in 20 seconds."
+    )
+
+
+async def test_server_metrics_track_phases_cache_hits_and_errors() -> None:
+    metrics._reset_metrics()
+    mock_client = MagicMock()
+    mock_client.get_date.return_value = make_day()
+    mock_client._get_water.return_value = 0.0
+
+    with patch("mcp_myfitnesspal.server.get_client", return_value=mock_client):
+        await server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+        await server_module.call_tool("get_nutrition_diary", {"date": "2026-02-25"})
+        await server_module.call_tool("get_nutrition_diary", {"date": "bad-date"})
+        result = await server_module.call_tool("get_server_metrics", {"format": "compact"})
+
+    snapshot = json.loads(result[0].text)
+    stats = snapshot["tools"]["get_nutrition_diary"]
+    assert stats["calls"] == 3
+    assert stats["errors"] == {"ValueError": 1}
+    assert stats["latency_ms"]["transform"]["count"] == 3
+    assert stats["response_bytes"]["count"] == 2
+    mock_client.get_date.assert_called_once()
+    assert snapshot["diary_cache"]["hit_rate"] == 0.5
+    assert "get_server_metrics" not in snapshot["tools"]
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from mcp_myfitnesspal.singleflight import SingleFlight, call_key
+
+
+async def test_concurrent_calls_with_same_key_share_one_execution() -> None:
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(flight.do("k", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["result"] * 3
+    assert calls == 1
+    assert flight.stats.as_dict() == {"executed": 1, "deduplicated": 2}
+
+
+async def test_different_keys_run_independently() -> None:
+    flight = SingleFlight()
+
+    async def fetch(value: str) -> str:
+        return value
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b"))
+    )
+    assert results == ["a", "b"]
+    assert flight.stats.deduplicated == 0
+
+
+async def test_errors_reach_every_waiter_and_key_is_released() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing() -> str:
+        await release.wait()
+        raise ValueError("upstream failed")
+
+    waiters = [asyncio.create_task(flight.do("k", failing)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+
+    async def ok() -> str:
+        return "fresh"
+
+    assert await flight.do("k", ok) == "fresh"
+
+
+async def test_cancelling_one_waiter_does_not_cancel_the_fetch() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(flight.do("k", fetch))
+    second = asyncio.create_task(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_call_key_ignores_argument_order() -> None:
+    a = call_key("get_nutrition_summary", {"start_date": "2026-01-01", "end_date": "2026-01-31"})
+    b = call_key("get_nutrition_summary", {"end_date": "2026-01-31", "start_date": "2026-01-01"})
+    assert a == b
+
+
+def test_call_key_keeps_cache_controls() -> None:
+    arguments = {"start_date": "2026-01-01", "end_date": "2026-01-31"}
+    assert call_key("get_nutrition_summary", arguments) != call_key(
+        "get_nutrition_summary", {**arguments, "bypass_cache": True}
+    )
@@ -0,0 +1,97 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_myfitnesspal.cache import DiaryCache
+from mcp_myfitnesspal.sync import backfill, main, sync_range
+
+TODAY = date(2026, 3, 10)
+
+
+def make_cache() -> DiaryCache:
+    noon = datetime(2026, 3, 10, 12).timestamp()
+    return DiaryCache(":memory:", clock=lambda: noon, today=lambda: TODAY)
+
+
+def make_client() -> MagicMock:
+    def get_date(day: date) -> MagicMock:
+        fake = MagicMock()
+        fake.date = day
+        fake.totals = {"calories": 2000.0}
+        fake.goals = {"calories": 2200.0}
+        fake.complete = True
+        fake.get_as_dict.return_value = {"Breakfast": []}
+        return fake
+
+    client = MagicMock()
+    client.get_date.side_effect = get_date
+    return client
+
+
+def test_sync_scrapes_only_days_missing_from_the_cache() -> None:
+    cache = make_cache()
+    client = make_client()
+    first = sync_range(cache, client, date(2026, 3, 1), date(2026, 3, 3))
+    second = sync_range(cache, client, date(2026, 3, 1), date(2026, 3, 5))
+    assert (first.days, first.requests) == (3, 3)
+    assert (second.days, second.requests) == (2, 2)
+    assert first.bytes > 0
+    assert cache.get(date(2026, 3, 2)) is not None
+
+
+def test_sync_reports_failed_days_and_keeps_the_rest() -> None:
+    cache = make_cache()
+    client = make_client()
+    scrape = client.get_date.side_effect
+
+    def get_date(day: date) -> MagicMock:
+        if day == date(2026, 3, 2):
+            raise ConnectionError("reset")
+        return scrape(day)
+
+    client.get_date.side_effect = get_date
+    report = sync_range(cache, client, date(2026, 3, 1), date(2026, 3, 3))
+    assert report.days == 2
+    assert report.errors == ["2026-03-02: reset"]
+    assert cache.get(date(2026, 3, 2)) is None
+
+
+def test_backfill_reports_each_chunk() -> None:
+    chunks: list[tuple[date, date]] = []
+    report = backfill(
+        make_cache(),
+        make_client(),
+        date(2026, 2, 1),
+        date(2026, 2, 25),
+        chunk_days=10,
+        on_chunk=lambda s, e, _: chunks.append((s, e)),
+    )
+    assert report.days == 25
+    assert chunks == [
+        (date(2026, 2, 1), date(2026, 2, 10)),
+        (date(2026, 2, 11), date(2026, 2, 20)),
+        (date(2026, 2, 21), date(2026, 2, 25)),
+    ]
+
+
+def test_main_backfills_and_prints_throughput(capsys: pytest.CaptureFixture[str]) -> None:
+    client = make_client()
+    with patch("mcp_myfitnesspal.sync.get_client", return_value=client):
+        code = main(["--start", "2026-01-01", "--end", "2026-01-03"])
+    out = capsys.readouterr().out
+    assert code == 0
+    assert client.get_date.call_count == 3
+    assert "total 2026-01-01..2026-01-03: 3 days, 3 requests" in out
+    assert "days/s" in out and "req/s" in out
+
+
+def test_main_reports_auth_failure(capsys: pytest.CaptureFixture[str]) -> None:
+    with patch("mcp_myfitnesspal.sync.get_client", side_effect=RuntimeError("no cookies")):
+        assert main(["--days", "1"]) == 1
+    assert "no cookies" in capsys.readouterr().err
+
+
+def test_main_rejects_start_after_end() -> None:
+    with pytest.raises(SystemExit):
+        main(["--start", "2026-01-05", "--end", "2026-01-01"])
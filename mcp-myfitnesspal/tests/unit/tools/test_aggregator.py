@@ -15,3 +15,8 @@ def test_dispatch_covers_all_tools() -> None:
 def test_no_duplicate_tool_names() -> None:
     names = [t.name for t in tools.ALL_TOOLS]
     assert len(names) == len(set(names))
+
+
+def test_every_tool_accepts_output_options() -> None:
+    for tool in tools.ALL_TOOLS:
+        assert {"format", "precision", "fields"} <= set(tool.inputSchema["properties"]), tool.name
@@ -12,14 +12,12 @@ def make_fake_day(
     date_val: date = date(2026, 2, 25),
     totals: dict | None = None,
     goals: dict | None = None,
-    water: float = 500.0,
     complete: bool = False,
 ) -> MagicMock:
     day = MagicMock()
     day.date = date_val
     day.totals = totals or {"calories": 2000.0, "protein": 150.0}
     day.goals = goals or {"calories": 2200.0, "protein": 160.0}
-    day.water = water
     day.complete = complete
     day.get_as_dict.return_value = {
         "Breakfast": [{"name": "Oats", "nutrition_information": {"calories": 300.0}}]
@@ -30,6 +28,7 @@ def make_fake_day(
 def make_client(day: MagicMock) -> MagicMock:
     client = MagicMock()
     client.get_date.return_value = day
+    client._get_water.return_value = 500.0
     return client
 
 
@@ -92,6 +91,101 @@ def test_get_nutrition_summary_iterates_range() -> None:
     assert client.get_date.call_count == 3
 
 
+def test_get_nutrition_summary_returns_rows_in_date_order() -> None:
+    client = MagicMock()
+    client.get_date.side_effect = lambda d: make_fake_day(
+        date_val=d, totals={"calories": float(d.day)}
+    )
+    result = DISPATCH["get_nutrition_summary"](
+        client, {"start_date": "2026-02-01", "end_date": "2026-02-10"}
+    )
+    data = json.loads(result[0].text)
+    assert [row["date"] for row in data] == [f"2026-02-{d:02d}" for d in range(1, 11)]
+    assert [row["totals"]["calories"] for row in data] == [float(d) for d in range(1, 11)]
+
+
+def test_get_nutrition_summary_keeps_good_days_when_one_is_broken() -> None:
+    client = MagicMock()
+    client.get_date.side_effect = lambda d: object() if d.day == 2 else make_fake_day(date_val=d)
+    result = DISPATCH["get_nutrition_summary"](
+        client, {"start_date": "2026-02-01", "end_date": "2026-02-03"}
+    )
+    data = json.loads(result[0].text)
+    assert data[0]["totals"]["calories"] == 2000.0
+    assert data[1]["date"] == "2026-02-02"
+    assert "missing fields" in data[1]["error"]
+    assert data[2]["totals"]["calories"] == 2000.0
+
+
+def test_get_nutrition_summary_raises_when_every_day_fails() -> None:
+    client = MagicMock()
+    client.get_date.return_value = object()
+    with pytest.raises(MFPShapeError):
+        DISPATCH["get_nutrition_summary"](
+            client, {"start_date": "2026-02-01", "end_date": "2026-02-03"}
+        )
+
+
+def test_get_nutrition_summary_rerun_costs_zero_scrapes() -> None:
+    client = MagicMock()
+    client.get_date.side_effect = lambda d: make_fake_day(date_val=d, complete=True)
+    arguments = {"start_date": "2026-01-01", "end_date": "2026-01-30"}
+    first = DISPATCH["get_nutrition_summary"](client, arguments)
+    second = DISPATCH["get_nutrition_summary"](client, arguments)
+    assert client.get_date.call_count == 30
+    assert first[0].text == second[0].text
+
+
+def test_get_nutrition_diary_reuses_days_fetched_by_summary() -> None:
+    client = make_client(make_fake_day(complete=True))
+    DISPATCH["get_nutrition_summary"](
+        client, {"start_date": "2026-02-24", "end_date": "2026-02-25"}
+    )
+    result = DISPATCH["get_nutrition_diary"](client, {"date": "2026-02-25"})
+    assert client.get_date.call_count == 2
+    assert "Breakfast" in json.loads(result[0].text)["meals"]
+
+
+def test_get_nutrition_summary_does_not_fetch_water() -> None:
+    client = make_client(make_fake_day())
+    DISPATCH["get_nutrition_summary"](
+        client, {"start_date": "2026-02-24", "end_date": "2026-02-25"}
+    )
+    assert client.get_date.call_count == 2
+    client._get_water.assert_not_called()
+
+
+def test_get_nutrition_diary_caches_water_with_the_day() -> None:
+    client = make_client(make_fake_day(complete=True))
+    DISPATCH["get_nutrition_diary"](client, {"date": "2026-02-25"})
+    result = DISPATCH["get_nutrition_diary"](client, {"date": "2026-02-25"})
+    client._get_water.assert_called_once_with(date(2026, 2, 25))
+    assert json.loads(result[0].text)["water"] == 500.0
+
+
+def test_get_nutrition_diary_fetches_water_for_days_cached_by_the_summary() -> None:
+    client = make_client(make_fake_day(complete=True))
+    DISPATCH["get_nutrition_summary"](
+        client, {"start_date": "2026-02-25", "end_date": "2026-02-25"}
+    )
+    DISPATCH["get_nutrition_diary"](client, {"date": "2026-02-25"})
+    result = DISPATCH["get_nutrition_diary"](client, {"date": "2026-02-25"})
+    client.get_date.assert_called_once()
+    client._get_water.assert_called_once_with(date(2026, 2, 25))
+    assert json.loads(result[0].text)["water"] == 500.0
+
+
+def test_get_nutrition_summary_does_not_cache_broken_days() -> None:
+    client = MagicMock()
+    client.get_date.return_value = object()
+    arguments = {"start_date": "2026-02-01", "end_date": "2026-02-01"}
+    with pytest.raises(MFPShapeError):
+        DISPATCH["get_nutrition_summary"](client, arguments)
+    client.get_date.return_value = make_fake_day()
+    DISPATCH["get_nutrition_summary"](client, arguments)
+    assert client.get_date.call_count == 2
+
+
 def test_get_nutrition_summary_rejects_bad_dates() -> None:
     client = MagicMock()
     with pytest.raises(ValueError, match="start_date"):